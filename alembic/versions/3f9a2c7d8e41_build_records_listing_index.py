@@ -0,0 +1,39 @@
+"""Cover build listing order with the profile/status index
+
+Revision ID: 3f9a2c7d8e41
+Revises: 164336717196
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a2c7d8e41"
+down_revision: str | Sequence[str] | None = "164336717196"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_build_records_profile_status", table_name="build_records")
+    op.create_index(
+        "ix_build_records_profile_status_id",
+        "build_records",
+        ["profile_id", "status", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_build_records_profile_status_id", table_name="build_records")
+    op.create_index(
+        "ix_build_records_profile_status",
+        "build_records",
+        ["profile_id", "status"],
+        unique=False,
+    )
@@ -0,0 +1,37 @@
+"""Cover artifact listing order with the build and kind indexes
+
+Revision ID: 8b5e1d4c2a67
+Revises: 3f9a2c7d8e41
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b5e1d4c2a67"
+down_revision: str | Sequence[str] | None = "3f9a2c7d8e41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_artifacts_kind", table_name="artifacts")
+    op.drop_index("ix_artifacts_build_id", table_name="artifacts")
+    op.create_index(
+        "ix_artifacts_build_id_id", "artifacts", ["build_id", "id"], unique=False
+    )
+    op.create_index("ix_artifacts_kind_id", "artifacts", ["kind", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_artifacts_kind_id", table_name="artifacts")
+    op.drop_index("ix_artifacts_build_id_id", table_name="artifacts")
+    op.create_index(
+        op.f("ix_artifacts_build_id"), "artifacts", ["build_id"], unique=False
+    )
+    op.create_index(op.f("ix_artifacts_kind"), "artifacts", ["kind"], unique=False)
@@ -0,0 +1,46 @@
+"""Stamp flash_records.requested_at in UTC on PostgreSQL
+
+Revision ID: a9c4e2f7b318
+Revises: e7a3c1f9d052
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c4e2f7b318"
+down_revision: str | Sequence[str] | None = "e7a3c1f9d052"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite's CURRENT_TIMESTAMP is already UTC; PostgreSQL's is in the
+    # session time zone
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "flash_records",
+        "requested_at",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("timezone('UTC', now())"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "flash_records",
+        "requested_at",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+    )
@@ -0,0 +1,56 @@
+"""Store flash record status as the flash_status enum
+
+Revision ID: c4d7a91e5b23
+Revises: 8b5e1d4c2a67
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d7a91e5b23"
+down_revision: str | Sequence[str] | None = "8b5e1d4c2a67"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+flash_status = sa.Enum(
+    "pending",
+    "running",
+    "succeeded",
+    "failed",
+    name="flash_status",
+    create_constraint=True,
+    length=20,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Creates the native type on PostgreSQL; a no-op on SQLite
+    flash_status.create(op.get_bind(), checkfirst=True)
+    # Batch mode rebuilds the table on SQLite to add the CHECK constraint
+    with op.batch_alter_table("flash_records") as batch_op:
+        batch_op.alter_column(
+            "status",
+            existing_type=sa.String(length=20),
+            type_=flash_status,
+            existing_nullable=False,
+            postgresql_using="status::flash_status",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("flash_records") as batch_op:
+        batch_op.alter_column(
+            "status",
+            existing_type=flash_status,
+            type_=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using="status::text",
+        )
+    flash_status.drop(op.get_bind(), checkfirst=True)
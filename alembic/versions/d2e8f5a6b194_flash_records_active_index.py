@@ -0,0 +1,37 @@
+"""Add a partial index over in-flight flash records
+
+Revision ID: d2e8f5a6b194
+Revises: c4d7a91e5b23
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e8f5a6b194"
+down_revision: str | Sequence[str] | None = "c4d7a91e5b23"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE_STATUS_CLAUSE = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_flash_records_active",
+        "flash_records",
+        ["artifact_id"],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_STATUS_CLAUSE),
+        sqlite_where=sa.text(ACTIVE_STATUS_CLAUSE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_flash_records_active", table_name="flash_records")
@@ -0,0 +1,32 @@
+"""Add an index for newest-first flash record listings
+
+Revision ID: e7a3c1f9d052
+Revises: d2e8f5a6b194
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c1f9d052"
+down_revision: str | Sequence[str] | None = "d2e8f5a6b194"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_flash_records_recent",
+        "flash_records",
+        ["requested_at", "id", "status", "device_path"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_flash_records_recent", table_name="flash_records")
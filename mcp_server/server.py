@@ -9,6 +9,7 @@ Per docs/FRONTENDS.md:
 - Support cache-aware semantics
 """
 
+from functools import cache
 from typing import Annotated, Any
 
 from mcp.server.fastmcp import FastMCP
@@ -45,19 +46,40 @@ mcp = FastMCP(
 )
 
 
-def _get_session_factory() -> Any:
-    """Get the database session factory.
+@cache
+def _cached_session_factory(db_url: str, create_tables: bool) -> Any:
+    """Create the engine and session factory for a database URL once.
+
+    Args:
+        db_url: Database URL.
+        create_tables: Whether to create missing tables first.
 
     Returns:
         Session factory callable.
     """
     from openwrt_imagegen.db import create_all_tables, get_engine, get_session_factory
 
-    engine = get_engine()
-    create_all_tables(engine)
+    engine = get_engine(db_url)
+    if create_tables:
+        create_all_tables(engine)
     return get_session_factory(engine)
 
 
+def _get_session_factory() -> Any:
+    """Get the database session factory.
+
+    The engine (and its connection pool) is shared by every tool call
+    against the same database URL instead of being rebuilt per call.
+
+    Returns:
+        Session factory callable.
+    """
+    from openwrt_imagegen.config import get_settings
+
+    settings = get_settings()
+    return _cached_session_factory(settings.db_url, settings.auto_create_tables)
+
+
 @mcp.tool()
 def list_profiles(
     device_id: Annotated[str | None, Field(description="Filter by device ID")] = None,
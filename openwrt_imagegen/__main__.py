@@ -1,6 +1,38 @@
-"""Entry point for python -m openwrt_imagegen."""
+"""Entry point for python -m openwrt_imagegen and the imagegen script."""
 
-from openwrt_imagegen.cli import app
+import sys
+
+
+def main() -> None:
+    """Run the CLI.
+
+    ``--version`` is answered before the Typer app (and its dependencies)
+    is imported, so version checks from shell prompts and scripts stay fast.
+
+    With ``--client`` as the first argument, the remaining arguments are
+    run by a resident daemon (started on demand, see
+    ``openwrt_imagegen.daemon``). If no daemon can be reached the command
+    runs in-process as usual.
+    """
+    args = sys.argv[1:]
+    if args in (["--version"], ["-V"]):
+        from openwrt_imagegen import __version__
+
+        print(f"openwrt-imagegen version {__version__}")
+        return
+
+    if args[:1] == ["--client"]:
+        from openwrt_imagegen.daemon import run_client
+
+        code = run_client(args[1:], spawn=True)
+        if code is not None:
+            sys.exit(code)
+        sys.argv = [sys.argv[0], *args[1:]]
+
+    from openwrt_imagegen.cli import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    main()
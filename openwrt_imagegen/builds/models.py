@@ -21,7 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from openwrt_imagegen.db import Base
+from openwrt_imagegen.db import Base, utc_now
 from openwrt_imagegen.types import BuildStatus
 
 if TYPE_CHECKING:
@@ -105,8 +105,10 @@ class BuildRecord(Base):
         "FlashRecord", back_populates="build", lazy="dynamic"
     )
 
-    # Indexes
-    __table_args__ = (Index("ix_build_records_profile_status", "profile_id", "status"),)
+    # Indexes (list_builds filters on profile/status and orders by id DESC)
+    __table_args__ = (
+        Index("ix_build_records_profile_status_id", "profile_id", "status", "id"),
+    )
 
     def __repr__(self) -> str:
         """Return string representation of BuildRecord."""
@@ -118,12 +120,12 @@ class BuildRecord(Base):
     def mark_running(self) -> None:
         """Mark this build as running."""
         self.status = BuildStatus.RUNNING.value
-        self.started_at = datetime.now()
+        self.started_at = utc_now()
 
     def mark_succeeded(self) -> None:
         """Mark this build as succeeded."""
         self.status = BuildStatus.SUCCEEDED.value
-        self.finished_at = datetime.now()
+        self.finished_at = utc_now()
 
     def mark_failed(
         self, error_type: str | None = None, message: str | None = None
@@ -135,7 +137,7 @@ class BuildRecord(Base):
             message: Error message details.
         """
         self.status = BuildStatus.FAILED.value
-        self.finished_at = datetime.now()
+        self.finished_at = utc_now()
         if error_type:
             self.error_type = error_type
         if message:
@@ -170,11 +172,11 @@ class Artifact(Base):
 
     # Foreign key
     build_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("build_records.id"), nullable=False, index=True
+        Integer, ForeignKey("build_records.id"), nullable=False
     )
 
     # Artifact classification
-    kind: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
+    kind: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # Paths
     relative_path: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -196,6 +198,12 @@ class Artifact(Base):
         "FlashRecord", back_populates="artifact", lazy="dynamic"
     )
 
+    # Indexes (artifact listings filter on build/kind and order by id DESC)
+    __table_args__ = (
+        Index("ix_artifacts_build_id_id", "build_id", "id"),
+        Index("ix_artifacts_kind_id", "kind", "id"),
+    )
+
     def __repr__(self) -> str:
         """Return string representation of Artifact."""
         return (
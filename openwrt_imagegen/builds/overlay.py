@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import mmap
 import shutil
 import stat
 from pathlib import Path
@@ -27,6 +28,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_FILE_MODE = 0o644
 DEFAULT_DIR_MODE = 0o755
 
+# Files at least this large are hashed through a read-only mmap
+MMAP_HASH_THRESHOLD = 4 * 1024 * 1024
+
 
 class OverlayStagingError(Exception):
     """Raised when overlay staging fails."""
@@ -270,32 +274,45 @@ def compute_tree_hash(directory: Path) -> str:
     if not directory.exists():
         return hasher.hexdigest()
 
-    # Collect all files with their metadata
-    entries: list[tuple[str, bytes, int]] = []
-
+    # Hash entries in sorted order, streaming each file into the hasher
     for path in sorted(directory.rglob("*")):
         if not path.is_file():
             continue
 
         rel_path = path.relative_to(directory).as_posix()
-        content = path.read_bytes()
-        mode = stat.S_IMODE(path.stat().st_mode)
-
-        entries.append((rel_path, content, mode))
+        st = path.stat()
+        mode = stat.S_IMODE(st.st_mode)
 
-    # Hash entries in sorted order
-    for rel_path, content, mode in entries:
         # Hash: path\0mode\0content
         hasher.update(rel_path.encode("utf-8"))
         hasher.update(b"\0")
         hasher.update(f"{mode:o}".encode())
         hasher.update(b"\0")
-        hasher.update(content)
+        _update_hash_from_file(hasher, path, st.st_size)
         hasher.update(b"\0")
 
     return hasher.hexdigest()
 
 
+def _update_hash_from_file(hasher: hashlib._Hash, path: Path, size: int) -> None:
+    """Feed a file's contents into a hasher.
+
+    Large files are mapped read-only so the hash is computed straight from
+    the page cache instead of through an intermediate bytes copy.
+
+    Args:
+        hasher: Hash object to update.
+        path: File to read.
+        size: File size in bytes.
+    """
+    with path.open("rb") as f:
+        if size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            hasher.update(f.read())
+
+
 def stage_and_hash_overlay(
     staging_dir: Path,
     profile: ProfileSchema,
@@ -22,13 +22,13 @@ import uuid
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from openwrt_imagegen.builds.artifacts import (
     discover_artifacts,
@@ -48,9 +48,12 @@ from openwrt_imagegen.builds.runner import (
     validate_imagebuilder_root,
 )
 from openwrt_imagegen.config import get_settings
+from openwrt_imagegen.db import utc_now
 from openwrt_imagegen.types import ArtifactInfo, BatchMode, BuildStatus
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.base import ExecutableOption
+
     from openwrt_imagegen.config import Settings
     from openwrt_imagegen.imagebuilder.models import ImageBuilder
     from openwrt_imagegen.profiles.models import Profile
@@ -85,6 +88,27 @@ class BuildServiceError(Exception):
         self.code = code
 
 
+@lru_cache(maxsize=1024)
+def _lock_file_path(lock_dir: Path, cache_key: str) -> str:
+    """Resolve the lock file path for a cache key.
+
+    Cached so that repeated acquisitions for the same key skip the filename
+    sanitizing and the lock directory creation.
+
+    Args:
+        lock_dir: Directory for lock files.
+        cache_key: Cache key to lock on.
+
+    Returns:
+        Lock file path as a string.
+    """
+    lock_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create safe filename from cache key
+    safe_key = cache_key.replace(":", "_").replace("/", "_")[:64]
+    return str(lock_dir / f"build_{safe_key}.lock")
+
+
 @contextmanager
 def build_lock(
     lock_dir: Path,
@@ -106,15 +130,16 @@ def build_lock(
     Raises:
         TimeoutError: If lock cannot be acquired within timeout.
     """
-    lock_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create safe filename from cache key
-    safe_key = cache_key.replace(":", "_").replace("/", "_")[:64]
-    lock_file = lock_dir / f"build_{safe_key}.lock"
+    lock_file = _lock_file_path(lock_dir, cache_key)
 
-    logger.debug("Acquiring build lock for key: %s", cache_key[:32])
+    logger.debug("Acquiring build lock for key: %.32s", cache_key)
 
-    fd = os.open(str(lock_file), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+    except FileNotFoundError:
+        # Lock directory was removed after the path was cached
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o600)
     lock_acquired = False
     try:
         if timeout is not None:
@@ -134,12 +159,12 @@ def build_lock(
             fcntl.flock(fd, fcntl.LOCK_EX)
             lock_acquired = True
 
-        logger.debug("Build lock acquired for key: %s", cache_key[:32])
+        logger.debug("Build lock acquired for key: %.32s", cache_key)
         yield
     finally:
         if lock_acquired:
             fcntl.flock(fd, fcntl.LOCK_UN)
-            logger.debug("Build lock released for key: %s", cache_key[:32])
+            logger.debug("Build lock released for key: %.32s", cache_key)
         os.close(fd)
 
 
@@ -168,6 +193,27 @@ def _get_cached_build(
     return session.execute(stmt).scalar_one_or_none()
 
 
+def _reuse_cached_build(
+    imagebuilder: ImageBuilder,
+    cached: BuildRecord,
+    cache_key: str,
+) -> BuildRecord:
+    """Record a cache hit and return the cached build.
+
+    Args:
+        imagebuilder: ImageBuilder ORM instance used for the request.
+        cached: Existing successful BuildRecord.
+        cache_key: Cache key that matched.
+
+    Returns:
+        The cached BuildRecord.
+    """
+    logger.info("Cache hit for key %.32s, reusing build %d", cache_key, cached.id)
+    # Update usage timestamp
+    imagebuilder.last_used_at = utc_now()
+    return cached
+
+
 def _create_build_record(
     session: Session,
     profile: Profile,
@@ -293,9 +339,7 @@ def build_or_reuse(
             _, overlay_hash = stage_and_hash_overlay(
                 staging_dir, profile_schema, base_path
             )
-            logger.info(
-                "Staged overlay to %s (hash=%s)", staging_dir, overlay_hash[:16]
-            )
+            logger.info("Staged overlay to %s (hash=%.16s)", staging_dir, overlay_hash)
         except OverlayStagingError:
             if staging_dir and staging_dir.exists():
                 shutil.rmtree(staging_dir, ignore_errors=True)
@@ -308,25 +352,26 @@ def build_or_reuse(
         extra_packages=extra_packages,
         build_options=build_options,
     )
-    logger.info("Computed cache key: %s", cache_key[:32])
+    logger.info("Computed cache key: %.32s", cache_key)
 
     # Get lock directory
     lock_dir = settings.cache_dir / ".locks"
 
     try:
+        # Fast path: a successful build already exists for this key, so there
+        # is nothing to serialize against and the file lock can be skipped.
+        if not force_rebuild:
+            cached = _get_cached_build(session, cache_key)
+            if cached is not None:
+                return _reuse_cached_build(imagebuilder, cached, cache_key), True
+
         with build_lock(lock_dir, cache_key, timeout=300):
-            # Check for cached build (after acquiring lock)
+            # Re-check after acquiring the lock: a concurrent build holding
+            # the lock may have finished since the lookup above.
             if not force_rebuild:
                 cached = _get_cached_build(session, cache_key)
                 if cached is not None:
-                    logger.info(
-                        "Cache hit for key %s, reusing build %d",
-                        cache_key[:32],
-                        cached.id,
-                    )
-                    # Update usage timestamp
-                    imagebuilder.last_used_at = datetime.now(timezone.utc)
-                    return cached, True
+                    return _reuse_cached_build(imagebuilder, cached, cache_key), True
 
             # Create build record
             build = _create_build_record(
@@ -399,7 +444,7 @@ def build_or_reuse(
                         )
 
                     build.mark_succeeded()
-                    imagebuilder.last_used_at = datetime.now(timezone.utc)
+                    imagebuilder.last_used_at = utc_now()
                     session.flush()
 
                     logger.info(
@@ -465,6 +510,7 @@ def list_builds(
     profile_id: int | None = None,
     status: BuildStatus | None = None,
     limit: int = 100,
+    loader_options: Sequence[ExecutableOption] = (),
 ) -> list[BuildRecord]:
     """List build records with optional filters.
 
@@ -473,11 +519,13 @@ def list_builds(
         profile_id: Filter by profile ID.
         status: Filter by status.
         limit: Maximum results to return.
+        loader_options: ORM loader options (e.g. selectinload) for
+            relationships the caller will access on every record.
 
     Returns:
         List of BuildRecord instances.
     """
-    stmt = select(BuildRecord)
+    stmt = select(BuildRecord).options(*loader_options)
 
     if profile_id is not None:
         stmt = stmt.where(BuildRecord.profile_id == profile_id)
@@ -502,7 +550,13 @@ def get_build_artifacts(session: Session, build_id: int) -> list[Artifact]:
     Raises:
         BuildNotFoundError: If build not found.
     """
-    build = get_build(session, build_id)
+    # Load the artifacts collection alongside the build instead of relying on
+    # a lazy load on first access.
+    build = session.get(
+        BuildRecord, build_id, options=[selectinload(BuildRecord.artifacts)]
+    )
+    if build is None:
+        raise BuildNotFoundError(build_id)
     return list(build.artifacts)
 
 
@@ -0,0 +1,467 @@
+"""Thin CLI wrapper for openwrt_imagegen.
+
+This package provides the command-line interface using Typer.
+All business logic is delegated to core modules.
+
+Only the root command, its callback and ``config`` live here. Each
+subcommand group is defined in its own ``_<group>`` module, which is
+imported the first time that group is resolved.
+"""
+
+import importlib
+import json
+import sys
+from collections.abc import Callable, Iterable
+from datetime import date, datetime
+from functools import cache, partial
+from typing import TYPE_CHECKING, Annotated, Any
+
+import typer
+from typer.core import TyperGroup
+
+from openwrt_imagegen import __version__
+from openwrt_imagegen.cli._options import JsonOption
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from sqlalchemy.orm import Session, sessionmaker
+
+    from openwrt_imagegen.config import Settings
+
+# Subcommand group name -> module (relative to this package) defining ``app``
+_LAZY_SUBCOMMANDS: dict[str, str] = {
+    "profiles": "._profiles",
+    "builders": "._builders",
+    "build": "._builds",
+    "artifacts": "._artifacts",
+    "flash": "._flash",
+    "daemon": "._daemon",
+}
+
+# ctx.meta key set by _LazyGroup when a help option is on the command line
+_HELP_REQUESTED = "openwrt_imagegen.help_requested"
+
+
+class _LazyGroup(TyperGroup):
+    """Root group that loads subcommand groups on demand.
+
+    Group names are registered statically; the module defining a group is
+    imported, and its Typer app converted to a Click command, only when
+    that group is resolved (e.g. ``imagegen builders info`` never loads
+    the build or flash commands).
+
+    It also notes whether a help option appears anywhere on the command
+    line, so the root callback can skip settings and logging setup when
+    the invocation will only print help.
+
+    Click types are left as ``Any`` because newer Typer releases vendor
+    their own copy of Click.
+    """
+
+    def parse_args(self, ctx: Any, args: list[str]) -> list[str]:
+        options = args[: args.index("--")] if "--" in args else args
+        ctx.meta[_HELP_REQUESTED] = any(arg in ctx.help_option_names for arg in options)
+        return super().parse_args(ctx, args)
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in _LAZY_SUBCOMMANDS if name not in names]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _LAZY_SUBCOMMANDS:
+            command = _load_group(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def invoke(self, ctx: Any) -> Any:
+        try:
+            return super().invoke(ctx)
+        except Exception as exc:
+            if not _schema_missing(exc):
+                raise
+            console.print(
+                "[red]Database schema is not initialized: run "
+                "`alembic upgrade head` or set OWRT_IMG_AUTO_CREATE_TABLES=true[/red]"
+            )
+            raise typer.Exit(code=1) from None
+
+
+def _schema_missing(exc: BaseException) -> bool:
+    """Return whether a command failed because the database has no tables.
+
+    Read-only commands query the database without bootstrapping it when
+    ``auto_create_tables`` is off, so a database that was never migrated
+    surfaces as a driver error on the first query. The schema is only
+    inspected once such an error has occurred.
+    """
+    if "sqlalchemy" not in sys.modules:
+        return False
+
+    from sqlalchemy import inspect
+    from sqlalchemy.exc import DBAPIError
+
+    if not isinstance(exc, DBAPIError):
+        return False
+
+    from openwrt_imagegen.db import get_engine
+    from openwrt_imagegen.profiles.models import Profile
+
+    engine = get_engine(_settings().db_url)
+    try:
+        return not inspect(engine).has_table(Profile.__tablename__)
+    finally:
+        engine.dispose()
+
+
+@cache
+def _load_group(name: str) -> Any:
+    """Import a subcommand group and build its Click command once per process.
+
+    Typer rebuilds the whole command tree, introspecting every signature,
+    each time an app is called; caching the built group lets repeated
+    in-process invocations (the daemon, tests) skip that work.
+    """
+    module = importlib.import_module(_LAZY_SUBCOMMANDS[name], __name__)
+    command = typer.main.get_command(module.app)
+    command.name = name
+    return command
+
+
+app = typer.Typer(
+    name="imagegen",
+    help="OpenWrt Image Generator - manage profiles, builds, and TF/SD flashing",
+    no_args_is_help=True,
+    cls=_LazyGroup,
+)
+
+
+class _LazyConsole:
+    """Proxy that creates the Rich console on first use.
+
+    Keeps ``rich`` out of the import path for invocations that never print
+    through it (e.g. ``--help``).
+    """
+
+    _console: "Console | None" = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib JSON encoder does not handle."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(obj: Any, *, indent: bool = True) -> bytes:
+    """Serialize CLI ``--json`` output, by default with two-space indentation.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    Datetimes are emitted as ISO 8601 strings either way.
+
+    Args:
+        obj: Value to serialize.
+        indent: Indent by two spaces; otherwise emit compact single-line JSON.
+    """
+    try:
+        import orjson
+    except ImportError:
+        if indent:
+            return json.dumps(obj, indent=2, default=_json_default).encode()
+        return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+
+def _encode_row(row: Any, *, indent: bool = True) -> bytes:
+    """Serialize a column-projected SQLAlchemy ``Row`` as a JSON object.
+
+    Keys are the selected column names, so a statement that selects a
+    schema's fields yields that schema's keys without validating each row.
+    """
+    return _encode_json(row._asdict(), indent=indent)
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write raw bytes to stdout, bypassing Rich."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+    else:
+        buffer.write(data)
+        buffer.flush()
+
+
+def _emit_json(payload: bytes | str) -> None:
+    """Write a serialized ``--json`` payload to stdout, bypassing Rich.
+
+    Rich would scan the text for markup and wrap long lines; JSON output
+    needs neither. A trailing newline is added if the payload lacks one.
+    Only an interactive terminal goes through Rich, for syntax highlighting.
+    """
+    if sys.stdout.isatty():
+        console.print_json(payload.decode() if isinstance(payload, bytes) else payload)
+        return
+    data = payload.encode() if isinstance(payload, str) else payload
+    _write_stdout(data if data.endswith(b"\n") else data + b"\n")
+
+
+def _write_json_array(
+    items: Iterable[Any],
+    encode: Callable[[Any], bytes] = _encode_json,
+) -> None:
+    """Stream a JSON array to stdout one element at a time.
+
+    Produces the same text as serializing the whole list with two-space
+    indentation, but never holds more than one encoded element in memory,
+    and output starts as soon as the first element is available.
+
+    Args:
+        items: Elements to serialize.
+        encode: Serializes one element to indented JSON bytes.
+    """
+    first = True
+    for item in items:
+        prefix = b"[\n  " if first else b",\n  "
+        _write_stdout(prefix + encode(item).replace(b"\n", b"\n  "))
+        first = False
+    _write_stdout(b"[]\n" if first else b"\n]\n")
+
+
+def _write_ndjson(
+    items: Iterable[Any],
+    encode: Callable[[Any], bytes] | None = None,
+) -> None:
+    """Stream newline-delimited JSON to stdout, one element per line.
+
+    Args:
+        items: Elements to serialize.
+        encode: Serializes one element to single-line JSON bytes. Defaults
+            to compact _encode_json().
+    """
+    if encode is None:
+        encode = partial(_encode_json, indent=False)
+    for item in items:
+        _write_stdout(encode(item) + b"\n")
+
+
+@cache
+def _settings() -> "Settings":
+    """Return the settings for the current invocation.
+
+    Settings are built once and shared by the root callback and the
+    command. The root callback clears the cache so every invocation,
+    including repeated in-process ones, reads the environment afresh.
+    """
+    from openwrt_imagegen.config import get_settings
+
+    return get_settings()
+
+
+@cache
+def _cached_session_factory(
+    db_url: str, create_tables: bool
+) -> "sessionmaker[Session]":
+    """Create the engine and session factory for a database URL once.
+
+    Args:
+        db_url: Database URL.
+        create_tables: Whether to create missing tables first.
+
+    Returns:
+        Session factory bound to the engine.
+    """
+    from openwrt_imagegen.db import create_all_tables, get_engine, get_session_factory
+
+    engine = get_engine(db_url)
+    if create_tables:
+        create_all_tables(engine)
+    return get_session_factory(engine)
+
+
+def _session_factory() -> "sessionmaker[Session]":
+    """Return the session factory for the configured database.
+
+    The engine is created, and tables bootstrapped, at most once per
+    database URL for the lifetime of the process.
+    """
+    settings = _settings()
+    return _cached_session_factory(settings.db_url, settings.auto_create_tables)
+
+
+def _sqlite_query_only(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Put a new SQLite connection into read-only mode."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+@cache
+def _cached_readonly_session_factory(
+    db_url: str, create_tables: bool
+) -> "sessionmaker[Session]":
+    """Create a session factory for commands that only read the database.
+
+    No DDL is issued against a database that already has the schema, and
+    SQLite connections are opened with ``PRAGMA query_only`` so they never
+    take a write lock. A database without the schema is bootstrapped
+    through the regular factory instead.
+
+    Args:
+        db_url: Database URL.
+        create_tables: Whether a database without tables may be bootstrapped.
+
+    Returns:
+        Session factory bound to the engine.
+    """
+    from sqlalchemy import event, inspect
+
+    from openwrt_imagegen.db import get_engine, get_session_factory, import_models
+    from openwrt_imagegen.profiles.models import Profile
+
+    import_models()
+    engine = get_engine(db_url)
+    if engine.url.get_backend_name() == "sqlite":
+        event.listen(engine, "connect", _sqlite_query_only)
+    if create_tables and not inspect(engine).has_table(Profile.__tablename__):
+        engine.dispose()
+        return _cached_session_factory(db_url, create_tables)
+    return get_session_factory(engine)
+
+
+def _readonly_session_factory() -> "sessionmaker[Session]":
+    """Return a read-only session factory for the configured database.
+
+    Used by listing and show commands; see _cached_readonly_session_factory.
+    """
+    settings = _settings()
+    return _cached_readonly_session_factory(
+        settings.db_url, settings.auto_create_tables
+    )
+
+
+def version_callback(value: bool) -> None:
+    """Print version and exit."""
+    if value:
+        console.print(f"openwrt-imagegen version {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    version: Annotated[  # noqa: ARG001
+        bool | None,
+        typer.Option(
+            "--version",
+            "-V",
+            help="Show version and exit",
+            callback=version_callback,
+            is_eager=True,
+        ),
+    ] = None,
+) -> None:
+    """OpenWrt Image Generator - manage profiles, builds, and TF/SD flashing."""
+    _settings.cache_clear()
+    if ctx.meta.get(_HELP_REQUESTED):
+        return
+    from openwrt_imagegen.config import reload_settings
+    from openwrt_imagegen.logs import configure_logging
+
+    reload_settings()
+    settings = _settings()
+    # Log output is opt-in: without an explicit OWRT_IMG_LOG_LEVEL the
+    # console shows only what Python's last-resort handler prints
+    if "log_level" in settings.model_fields_set:
+        configure_logging(settings.log_level)
+
+
+@app.command()
+def config(
+    json_output: JsonOption = False,
+) -> None:
+    """Show effective configuration."""
+    from openwrt_imagegen.config import print_settings_json
+
+    settings = _settings()
+    if json_output:
+        _emit_json(print_settings_json(settings))
+    else:
+        from rich.console import Group, RenderableType
+        from rich.table import Table
+
+        tmp_dir_display = (
+            str(settings.tmp_dir) if settings.tmp_dir else "(system default)"
+        )
+        sections: list[tuple[str, list[tuple[str, object]]]] = [
+            (
+                "Paths:",
+                [
+                    ("Cache directory:", settings.cache_dir),
+                    ("Artifacts directory:", settings.artifacts_dir),
+                    ("Database URL:", settings.db_url),
+                    ("Temp directory:", tmp_dir_display),
+                ],
+            ),
+            (
+                "Operational:",
+                [
+                    ("Offline mode:", settings.offline),
+                    ("Log level:", settings.log_level),
+                    ("Auto-create tables:", settings.auto_create_tables),
+                    ("Verification mode:", settings.verification_mode),
+                    ("Hash algorithm:", settings.hash_algorithm),
+                ],
+            ),
+            (
+                "Concurrency:",
+                [
+                    ("Max downloads:", settings.max_concurrent_downloads),
+                    ("Max builds:", settings.max_concurrent_builds),
+                ],
+            ),
+            (
+                "Timeouts (seconds):",
+                [
+                    ("Download timeout:", settings.download_timeout),
+                    ("Build timeout:", settings.build_timeout),
+                    ("Flash timeout:", settings.flash_timeout),
+                ],
+            ),
+        ]
+
+        # Build the whole report first so it is rendered in a single print
+        renderables: list[RenderableType] = ["[bold]Effective Configuration:[/bold]"]
+        for title, rows in sections:
+            table = Table.grid(padding=(0, 1))
+            table.add_column(min_width=22, no_wrap=True)
+            table.add_column(overflow="fold")
+            for label, value in rows:
+                table.add_row(f"  {label}", str(value))
+            renderables.extend(["", f"[bold]{title}[/bold]", table])
+        console.print(Group(*renderables))
+
+
+@cache
+def _cli_command() -> Any:
+    """Return the root Click command, built from ``app`` once per process.
+
+    Used by callers that run many invocations in one process (see
+    ``openwrt_imagegen.daemon``) so the command tree is not rebuilt for
+    each of them.
+    """
+    return typer.main.get_command(app)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,132 @@
+"""Artifact commands (``imagegen artifacts``)."""
+
+from functools import cache
+from typing import TYPE_CHECKING, Annotated, Any
+
+import typer
+
+from openwrt_imagegen.cli import (
+    _emit_json,
+    _encode_row,
+    _readonly_session_factory,
+    _write_json_array,
+    _write_ndjson,
+    console,
+)
+from openwrt_imagegen.cli._options import BuildIdFilter, JsonOption, NdjsonOption
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
+app = typer.Typer(help="Manage build artifacts")
+
+
+@cache
+def _artifacts_list_stmt(by_build: bool, by_kind: bool) -> "Select[Any]":
+    """Build the ``artifacts list`` query for a combination of filters.
+
+    Filter values are bound at execution time, so each statement is built
+    once per process and its cache key is reused on every later call.
+
+    Args:
+        by_build: Whether to filter on the ``build_id`` parameter.
+        by_kind: Whether to filter on the ``kind`` parameter.
+
+    Returns:
+        SELECT statement expecting ``build_id``/``kind`` parameters.
+    """
+    from sqlalchemy import bindparam, select
+
+    from openwrt_imagegen.builds.models import Artifact
+    from openwrt_imagegen.cli._schemas import ArtifactItem
+
+    # Project only the ArtifactItem columns: rows come back as named
+    # tuples, skipping entity construction and the identity map.
+    stmt = select(*(getattr(Artifact, name) for name in ArtifactItem.model_fields))
+    if by_build:
+        stmt = stmt.where(Artifact.build_id == bindparam("build_id"))
+    if by_kind:
+        stmt = stmt.where(Artifact.kind == bindparam("kind"))
+    return stmt.order_by(Artifact.id.desc()).limit(100)
+
+
+@app.command("list")
+def artifacts_list(
+    build_id: BuildIdFilter = None,
+    kind: Annotated[
+        str | None,
+        typer.Option("--kind", "-k", help="Filter by artifact kind"),
+    ] = None,
+    json_output: JsonOption = False,
+    ndjson_output: NdjsonOption = False,
+) -> None:
+    """List artifacts."""
+    factory = _readonly_session_factory()
+
+    with factory() as session:
+        stmt = _artifacts_list_stmt(build_id is not None, kind is not None)
+        params = {"build_id": build_id, "kind": kind}
+
+        if ndjson_output:
+            _write_ndjson(
+                session.execute(stmt, params),
+                encode=lambda r: _encode_row(r, indent=False),
+            )
+            return
+        if json_output:
+            # Stream rows straight from the cursor to stdout
+            _write_json_array(session.execute(stmt, params), encode=_encode_row)
+            return
+
+        artifacts = session.execute(stmt, params).all()
+        if not artifacts:
+            console.print("[yellow]No artifacts found[/yellow]")
+            return
+
+        lines = [f"[bold]Found {len(artifacts)} artifact(s):[/bold]", ""]
+        for a in artifacts:
+            lines.append(f"  [green]Artifact #{a.id}[/green]")
+            lines.append(f"    Build ID: {a.build_id}")
+            lines.append(f"    Kind: {a.kind or 'unknown'}")
+            lines.append(f"    Filename: {a.filename}")
+            lines.append(f"    Size: {a.size_bytes:,} bytes")
+            lines.append(f"    SHA256: {a.sha256[:16]}...")
+            lines.append("")
+        console.print("\n".join(lines), highlight=False)
+
+
+@app.command("show")
+def artifacts_show(
+    artifact_id: Annotated[int, typer.Argument(help="Artifact ID to show")],
+    json_output: JsonOption = False,
+) -> None:
+    """Show details of a specific artifact."""
+    from openwrt_imagegen.builds.models import Artifact
+    from openwrt_imagegen.cli._schemas import ArtifactItem
+
+    factory = _readonly_session_factory()
+
+    with factory() as session:
+        artifact = session.get(Artifact, artifact_id)
+
+        if artifact is None:
+            console.print(f"[red]Artifact not found: {artifact_id}[/red]")
+            raise typer.Exit(code=1)
+
+        if json_output:
+            _emit_json(ArtifactItem.model_validate(artifact).model_dump_json(indent=2))
+        else:
+            lines = [
+                f"[bold]Artifact #{artifact.id}[/bold]",
+                "",
+                f"  Build ID:      {artifact.build_id}",
+                f"  Kind:          {artifact.kind or 'unknown'}",
+                f"  Filename:      {artifact.filename}",
+                f"  Relative path: {artifact.relative_path}",
+                f"  Absolute path: {artifact.absolute_path or 'N/A'}",
+                f"  Size:          {artifact.size_bytes:,} bytes",
+                f"  SHA256:        {artifact.sha256}",
+            ]
+            if artifact.labels:
+                lines.append(f"  Labels:        {', '.join(artifact.labels)}")
+            console.print("\n".join(lines), highlight=False)
@@ -0,0 +1,244 @@
+"""Image Builder cache commands (``imagegen builders``)."""
+
+from typing import Annotated
+
+import typer
+
+from openwrt_imagegen.cli import (
+    _emit_json,
+    _encode_json,
+    _encode_row,
+    _readonly_session_factory,
+    _session_factory,
+    _write_json_array,
+    console,
+)
+from openwrt_imagegen.cli._options import (
+    JsonOption,
+    ReleaseFilter,
+    SubtargetFilter,
+    TargetFilter,
+)
+
+app = typer.Typer(help="Manage Image Builder cache")
+
+# Rich color for each Image Builder state in human-readable listings
+_BUILDER_STATE_COLOR = {
+    "ready": "green",
+    "pending": "yellow",
+    "broken": "red",
+    "deprecated": "dim",
+}
+
+
+@app.command("list")
+def builders_list(
+    release: ReleaseFilter = None,
+    target: TargetFilter = None,
+    subtarget: SubtargetFilter = None,
+    state: Annotated[
+        str | None,
+        typer.Option(
+            "--state", help="Filter by state (pending, ready, broken, deprecated)"
+        ),
+    ] = None,
+    json_output: JsonOption = False,
+) -> None:
+    """List cached Image Builders."""
+    from openwrt_imagegen.imagebuilder.service import iter_builders, list_builders
+    from openwrt_imagegen.types import ImageBuilderState
+
+    factory = _readonly_session_factory()
+
+    # Parse state filter
+    state_filter: ImageBuilderState | None = None
+    if state:
+        try:
+            state_filter = ImageBuilderState(state)
+        except ValueError:
+            console.print(f"[red]Invalid state: {state}[/red]")
+            console.print("Valid values: pending, ready, broken, deprecated")
+            raise typer.Exit(code=1) from None
+
+    with factory() as session:
+        if json_output:
+            from openwrt_imagegen.cli._schemas import BuilderListItem
+            from openwrt_imagegen.imagebuilder.models import ImageBuilder
+
+            # Select just the schema's columns and encode the rows directly;
+            # datetimes are serialized natively by the JSON encoder
+            columns = [
+                getattr(ImageBuilder, name) for name in BuilderListItem.model_fields
+            ]
+            _write_json_array(
+                iter_builders(
+                    session,
+                    columns,
+                    release=release,
+                    target=target,
+                    subtarget=subtarget,
+                    state=state_filter,
+                ),
+                encode=_encode_row,
+            )
+            return
+
+        builders = list_builders(
+            session,
+            release=release,
+            target=target,
+            subtarget=subtarget,
+            state=state_filter,
+        )
+
+        if not builders:
+            console.print("[yellow]No Image Builders found[/yellow]")
+            return
+
+        lines = [f"[bold]Found {len(builders)} Image Builder(s):[/bold]", ""]
+        for b in builders:
+            entry = (
+                f"  [{_BUILDER_STATE_COLOR.get(b.state, 'white')}]"
+                f"{b.openwrt_release}/{b.target}/{b.subtarget}[/]\n"
+                f"    State: {b.state}\n"
+                f"    Root: {b.root_dir}"
+            )
+            if b.last_used_at:
+                entry += f"\n    Last used: {b.last_used_at.isoformat()}"
+            lines.append(entry + "\n")
+        console.print("\n".join(lines), highlight=False)
+
+
+@app.command("ensure")
+def builders_ensure(
+    release: Annotated[str, typer.Argument(help="OpenWrt release version")],
+    target: Annotated[str, typer.Argument(help="Target platform")],
+    subtarget: Annotated[str, typer.Argument(help="Subtarget")],
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Force re-download even if cached"),
+    ] = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Ensure an Image Builder is available."""
+    from openwrt_imagegen.imagebuilder.service import (
+        ImageBuilderBrokenError,
+        OfflineModeError,
+        ensure_builder,
+    )
+
+    factory = _session_factory()
+
+    try:
+        # Commits when the block exits; the builder stays readable afterwards
+        # because the factory does not expire objects on commit
+        with factory.begin() as session:
+            console.print(
+                f"[blue]Ensuring Image Builder {release}/{target}/{subtarget}...[/blue]"
+            )
+            builder = ensure_builder(
+                session,
+                release=release,
+                target=target,
+                subtarget=subtarget,
+                force_download=force,
+            )
+    except OfflineModeError:
+        console.print("[red]Cannot download in offline mode[/red]")
+        raise typer.Exit(code=1) from None
+    except ImageBuilderBrokenError:
+        console.print(
+            f"[red]Image Builder {release}/{target}/{subtarget} is broken. "
+            "Use --force to re-download.[/red]"
+        )
+        raise typer.Exit(code=1) from None
+    except Exception as e:
+        console.print(f"[red]Failed to ensure Image Builder: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    if json_output:
+        output = {
+            "openwrt_release": builder.openwrt_release,
+            "target": builder.target,
+            "subtarget": builder.subtarget,
+            "state": builder.state,
+            "root_dir": builder.root_dir,
+            "checksum": builder.checksum,
+        }
+        _emit_json(_encode_json(output))
+    else:
+        lines = [
+            f"[green]✓ Image Builder ready: {release}/{target}/{subtarget}[/green]",
+            f"  Root: {builder.root_dir}",
+        ]
+        if builder.checksum:
+            lines.append(f"  Checksum: {builder.checksum[:16]}...")
+        console.print("\n".join(lines), highlight=False)
+
+
+@app.command("info")
+def builders_info(
+    json_output: JsonOption = False,
+) -> None:
+    """Show Image Builder cache information."""
+    from openwrt_imagegen.imagebuilder.cache import get_builder_cache_info
+
+    info = get_builder_cache_info()
+
+    if json_output:
+        _emit_json(_encode_json(info))
+    else:
+        lines = [
+            "[bold]Image Builder Cache Information:[/bold]",
+            "",
+            f"  Cache directory: {info['cache_dir']}",
+            f"  Exists: {info['exists']}",
+            f"  Total size: {info['total_size_human']}",
+        ]
+        console.print("\n".join(lines), highlight=False)
+
+
+@app.command("prune")
+def builders_prune(
+    deprecated_only: Annotated[
+        bool,
+        typer.Option(
+            "--deprecated-only", help="Only prune deprecated builders (default)"
+        ),
+    ] = True,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run", "-n", help="Show what would be pruned without actually pruning"
+        ),
+    ] = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Prune unused or deprecated Image Builders."""
+    from openwrt_imagegen.imagebuilder.service import prune_builders
+
+    factory = _readonly_session_factory() if dry_run else _session_factory()
+
+    with factory.begin() as session:
+        pruned = prune_builders(
+            session,
+            deprecated_only=deprecated_only,
+            dry_run=dry_run,
+        )
+
+    if json_output:
+        output = {
+            "dry_run": dry_run,
+            "pruned": [
+                {"release": r, "target": t, "subtarget": s} for r, t, s in pruned
+            ],
+        }
+        _emit_json(_encode_json(output))
+    else:
+        if not pruned:
+            console.print("[yellow]No Image Builders to prune[/yellow]")
+        else:
+            prefix = "[DRY RUN] Would prune" if dry_run else "Pruned"
+            lines = [f"[bold]{prefix} {len(pruned)} Image Builder(s):[/bold]"]
+            lines.extend(f"  - {r}/{t}/{s}" for r, t, s in pruned)
+            console.print("\n".join(lines), highlight=False)
@@ -0,0 +1,249 @@
+"""Build commands (``imagegen build``)."""
+
+from typing import Annotated
+
+import typer
+
+from openwrt_imagegen.cli import (
+    _emit_json,
+    _readonly_session_factory,
+    _session_factory,
+    _settings,
+    _write_json_array,
+    _write_ndjson,
+    console,
+)
+from openwrt_imagegen.cli._options import (
+    BuildForceOption,
+    DeviceIdFilter,
+    JsonOption,
+    LimitOption,
+    NdjsonOption,
+    ReleaseFilter,
+    StatusFilter,
+    SubtargetFilter,
+    TagFilter,
+    TargetFilter,
+)
+
+app = typer.Typer(help="Build images")
+
+# Rich color for each build status in human-readable listings
+_BUILD_STATUS_COLOR = {
+    "succeeded": "green",
+    "failed": "red",
+    "running": "blue",
+    "pending": "yellow",
+}
+
+
+@app.command("run")
+def build_run(
+    profile_id: Annotated[str, typer.Argument(help="Profile ID to build")],
+    force: BuildForceOption = False,
+) -> None:
+    """Build an image for a profile."""
+    console.print(
+        f"[yellow]Not yet implemented: build {profile_id} (force={force})[/yellow]"
+    )
+    raise typer.Exit(code=1)
+
+
+@app.command("batch")
+def build_batch_cmd(
+    profile_ids: Annotated[
+        list[str] | None,
+        typer.Option("--profile", "-p", help="Profile ID(s) to build"),
+    ] = None,
+    device_id: DeviceIdFilter = None,
+    release: ReleaseFilter = None,
+    target: TargetFilter = None,
+    subtarget: SubtargetFilter = None,
+    tags: TagFilter = None,
+    mode: Annotated[
+        str,
+        typer.Option(
+            "--mode", "-m", help="Batch mode: fail-fast or best-effort (default)"
+        ),
+    ] = "best-effort",
+    force: BuildForceOption = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Build images for multiple profiles.
+
+    Select profiles by explicit IDs or filters (release, target, tags, etc.).
+    Use --mode=fail-fast to stop on first failure, or --mode=best-effort to
+    continue building remaining profiles after failures.
+    """
+    from openwrt_imagegen.builds.service import (
+        BatchBuildFilter,
+        build_batch,
+    )
+    from openwrt_imagegen.types import BatchMode
+
+    # Validate mode
+    try:
+        batch_mode = BatchMode(mode)
+    except ValueError:
+        console.print(f"[red]Invalid mode: {mode}[/red]")
+        console.print("Valid values: fail-fast, best-effort")
+        raise typer.Exit(code=1) from None
+
+    # Validate at least one filter is provided
+    if not (profile_ids or device_id or release or target or subtarget or tags):
+        console.print("[red]Error: At least one filter must be specified[/red]")
+        console.print(
+            "Use --profile, --device, --release, --target, --subtarget, or --tag"
+        )
+        raise typer.Exit(code=1)
+
+    factory = _session_factory()
+
+    with factory.begin() as session:
+        filter_spec = BatchBuildFilter(
+            profile_ids=profile_ids,
+            device_id=device_id,
+            openwrt_release=release,
+            target=target,
+            subtarget=subtarget,
+            tags=tags,
+        )
+
+        if not json_output:
+            console.print("[blue]Starting batch build...[/blue]")
+
+        settings = _settings()
+        result = build_batch(
+            session=session,
+            filter_spec=filter_spec,
+            settings=settings,
+            mode=batch_mode,
+            force_rebuild=force,
+        )
+
+    if json_output:
+        _emit_json(result.model_dump_json(indent=2))
+    else:
+        # Human-readable output, collected and printed once
+        lines = [
+            "",
+            "[bold]Batch Build Results:[/bold]",
+            f"  Total profiles: {result.total}",
+            f"  [green]Succeeded: {result.succeeded}[/green]",
+            f"  [blue]Cache hits: {result.cache_hits}[/blue]",
+        ]
+        if result.failed > 0:
+            lines.append(f"  [red]Failed: {result.failed}[/red]")
+        if result.stopped_early:
+            lines.append("  [yellow]Stopped early (fail-fast mode)[/yellow]")
+
+        lines += ["", "[bold]Per-Profile Results:[/bold]"]
+        for r in result.results:
+            pid = r["profile_id"]
+            if r["success"]:
+                hit_marker = " (cache hit)" if r["is_cache_hit"] else ""
+                lines.append(f"  [green]✓ {pid}{hit_marker}[/green]")
+                if r["artifacts"]:
+                    lines.extend(f"      {a['filename']}" for a in r["artifacts"])
+            else:
+                lines.append(f"  [red]✗ {pid}[/red]")
+                if r["error_message"]:
+                    lines.append(f"      Error: {r['error_message']}")
+        console.print("\n".join(lines), highlight=False)
+
+    if result.failed > 0:
+        raise typer.Exit(code=1)
+
+
+@app.command("list")
+def builds_list(
+    profile_id: Annotated[
+        str | None,
+        typer.Option("--profile", "-p", help="Filter by profile ID"),
+    ] = None,
+    status: StatusFilter = None,
+    limit: LimitOption = 100,
+    json_output: JsonOption = False,
+    ndjson_output: NdjsonOption = False,
+) -> None:
+    """List build records."""
+    from sqlalchemy.orm import selectinload
+
+    from openwrt_imagegen.builds.models import BuildRecord
+    from openwrt_imagegen.builds.service import list_builds
+    from openwrt_imagegen.cli._schemas import BuildListItem
+    from openwrt_imagegen.profiles.service import ProfileNotFoundError, get_profile
+    from openwrt_imagegen.types import BuildStatus
+
+    factory = _readonly_session_factory()
+
+    # Parse status filter
+    status_filter: BuildStatus | None = None
+    if status:
+        try:
+            status_filter = BuildStatus(status)
+        except ValueError:
+            console.print(f"[red]Invalid status: {status}[/red]")
+            console.print("Valid values: pending, running, succeeded, failed")
+            raise typer.Exit(code=1) from None
+
+    with factory() as session:
+        # Resolve profile_id to database ID if provided
+        db_profile_id: int | None = None
+        if profile_id:
+            try:
+                profile = get_profile(session, profile_id)
+                db_profile_id = profile.id
+            except ProfileNotFoundError:
+                console.print(f"[red]Profile not found: {profile_id}[/red]")
+                raise typer.Exit(code=1) from None
+
+        # Every row reads profile and artifacts; load them up front
+        builds = list_builds(
+            session,
+            profile_id=db_profile_id,
+            status=status_filter,
+            limit=limit,
+            loader_options=(
+                selectinload(BuildRecord.profile),
+                selectinload(BuildRecord.artifacts),
+            ),
+        )
+
+        if ndjson_output:
+            _write_ndjson(
+                builds,
+                encode=lambda b: (
+                    BuildListItem.model_validate(b).model_dump_json().encode()
+                ),
+            )
+            return
+        if json_output:
+            _write_json_array(
+                builds,
+                encode=lambda b: (
+                    BuildListItem.model_validate(b).model_dump_json(indent=2).encode()
+                ),
+            )
+            return
+
+        if not builds:
+            console.print("[yellow]No build records found[/yellow]")
+            return
+
+        lines = [f"[bold]Found {len(builds)} build(s):[/bold]", ""]
+        for b in builds:
+            status_color = _BUILD_STATUS_COLOR.get(b.status, "white")
+            profile_display = b.profile.profile_id if b.profile else "N/A"
+            lines.append(f"  [{status_color}]Build #{b.id}[/{status_color}]")
+            lines.append(f"    Profile: {profile_display}")
+            lines.append(f"    Status: {b.status}")
+            lines.append(f"    Cache hit: {b.is_cache_hit}")
+            lines.append(
+                f"    Requested: {b.requested_at.isoformat() if b.requested_at else 'N/A'}"
+            )
+            lines.append(f"    Artifacts: {len(b.artifacts)}")
+            if b.error_message:
+                lines.append(f"    Error: {b.error_message}")
+            lines.append("")
+        console.print("\n".join(lines), highlight=False)
@@ -0,0 +1,53 @@
+"""Resident daemon commands (``imagegen daemon``)."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from openwrt_imagegen.cli import console
+
+app = typer.Typer(help="Run a resident daemon for fast repeated invocations")
+
+_SOCKET_OPTION = typer.Option(
+    "--socket",
+    help="Unix socket path (default: $XDG_RUNTIME_DIR/imagegen.sock)",
+)
+
+
+@app.command("start")
+def daemon_start(
+    socket_path: Annotated[Path | None, _SOCKET_OPTION] = None,
+) -> None:
+    """Serve CLI invocations over a Unix socket (runs in the foreground).
+
+    Clients connect with ``imagegen --client <command> ...``, which also
+    starts a daemon on demand.
+    """
+    from openwrt_imagegen.daemon import default_socket_path, serve
+
+    path = socket_path or default_socket_path()
+    console.print(f"Listening on {path}", highlight=False)
+    try:
+        serve(path)
+    except OSError as e:
+        console.print(f"[red]Cannot start daemon: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+
+@app.command("stop")
+def daemon_stop(
+    socket_path: Annotated[Path | None, _SOCKET_OPTION] = None,
+) -> None:
+    """Stop a running daemon."""
+    from openwrt_imagegen.daemon import stop_daemon
+
+    try:
+        stopped = stop_daemon(socket_path)
+    except PermissionError as e:
+        console.print(f"[red]Cannot stop daemon: {e}[/red]")
+        raise typer.Exit(code=1) from None
+    if not stopped:
+        console.print("[yellow]No daemon running[/yellow]")
+        raise typer.Exit(code=1)
+    console.print("[green]Daemon stopped[/green]")
@@ -0,0 +1,339 @@
+"""TF/SD flashing commands (``imagegen flash``)."""
+
+import sys
+from collections.abc import Iterator
+from typing import Annotated, Any
+
+import typer
+
+from openwrt_imagegen.cli import (
+    _emit_json,
+    _encode_row,
+    _readonly_session_factory,
+    _session_factory,
+    _settings,
+    _write_json_array,
+    _write_ndjson,
+    console,
+)
+from openwrt_imagegen.cli._options import (
+    BuildIdFilter,
+    FlashDryRunOption,
+    FlashForceOption,
+    JsonOption,
+    LimitOption,
+    NdjsonOption,
+    StatusFilter,
+    WipeOption,
+)
+
+app = typer.Typer(help="Flash images to TF/SD cards")
+
+# Rich color for each flash status in human-readable listings
+_FLASH_STATUS_COLOR = {
+    "succeeded": "green",
+    "failed": "red",
+    "running": "blue",
+    "pending": "yellow",
+}
+
+
+def _confirm_overwrite(device: str, source: str, wipe: bool, json_output: bool) -> None:
+    """Ask the operator to confirm overwriting a device.
+
+    Scripted ``--json`` callers without a terminal on stdin cannot answer
+    the prompt, so they are refused up front instead of blocking on a
+    read; they must pass ``--force`` explicitly.
+
+    Args:
+        device: Device path that would be overwritten.
+        source: Human-readable description of what would be written.
+        wipe: Whether the device would be wiped first.
+        json_output: Whether the caller asked for JSON output.
+
+    Raises:
+        typer.Exit: If the write is refused or not confirmed.
+    """
+    if json_output and not sys.stdin.isatty():
+        console.print(
+            f"[red]Refusing to overwrite {device} without --force "
+            "(stdin is not a terminal)[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold red]WARNING:[/bold red] This will OVERWRITE {device}")
+    console.print(f"  {source}")
+    if wipe:
+        console.print("  Device will be WIPED before writing")
+    confirm = typer.confirm("Are you sure you want to continue?", default=False)
+    if not confirm:
+        console.print("[yellow]Aborted[/yellow]")
+        raise typer.Exit(code=0)
+
+
+@app.command("write")
+def flash_write(
+    artifact_id: Annotated[int, typer.Argument(help="Artifact ID to flash")],
+    device: Annotated[str, typer.Argument(help="Device path (e.g., /dev/sdX)")],
+    dry_run: FlashDryRunOption = False,
+    force: FlashForceOption = False,
+    wipe: WipeOption = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Flash an artifact to a TF/SD card.
+
+    Requires explicit device path (e.g., /dev/sdb, /dev/mmcblk0).
+    Never operates on partitions (e.g., /dev/sdb1).
+
+    Use --dry-run to see what would happen without writing.
+    Use --force to skip confirmation prompts.
+    Use --wipe to clear existing signatures before writing.
+    """
+    from openwrt_imagegen.cli._schemas import FlashResultItem
+    from openwrt_imagegen.flash.service import (
+        ArtifactFileNotFoundError,
+        ArtifactNotFoundError,
+        flash_artifact,
+    )
+
+    factory = _session_factory()
+
+    settings = _settings()
+
+    # Confirmation prompt unless force or dry-run
+    if not force and not dry_run:
+        _confirm_overwrite(device, f"Artifact ID: {artifact_id}", wipe, json_output)
+
+    with factory() as session:
+        try:
+            if dry_run and not json_output:
+                console.print("[blue]Dry-run mode: validating without writing[/blue]")
+
+            result = flash_artifact(
+                session,
+                artifact_id=artifact_id,
+                device_path=device,
+                settings=settings,
+                wipe_before=wipe,
+                dry_run=dry_run,
+                force=force,
+            )
+
+            if not dry_run:
+                session.commit()
+
+            if json_output:
+                _emit_json(
+                    FlashResultItem.model_validate(result).model_dump_json(indent=2)
+                )
+            else:
+                if result.success:
+                    if dry_run:
+                        console.print("[green]✓ Dry-run validation passed[/green]")
+                        console.print(f"  Would write {result.bytes_written} bytes")
+                        console.print(f"  Image: {result.image_path}")
+                        console.print(f"  Device: {result.device_path}")
+                    else:
+                        console.print("[green]✓ Flash succeeded[/green]")
+                        console.print(f"  Bytes written: {result.bytes_written}")
+                        console.print(
+                            f"  Verification: {result.verification_result.value}"
+                        )
+                        if result.flash_record_id:
+                            console.print(f"  Record ID: {result.flash_record_id}")
+                else:
+                    console.print("[red]✗ Flash failed[/red]")
+                    if result.error_message:
+                        console.print(f"  Error: {result.error_message}")
+
+            if not result.success:
+                raise typer.Exit(code=1)
+
+        except ArtifactNotFoundError as e:
+            console.print(f"[red]Artifact not found: {e.artifact_id}[/red]")
+            raise typer.Exit(code=1) from None
+        except ArtifactFileNotFoundError as e:
+            console.print(f"[red]Artifact file not found: {e.path}[/red]")
+            raise typer.Exit(code=1) from None
+        except Exception as e:
+            console.print(f"[red]Flash failed: {e}[/red]")
+            raise typer.Exit(code=1) from None
+
+
+@app.command("image")
+def flash_image_cmd(
+    image_path: Annotated[str, typer.Argument(help="Path to image file")],
+    device: Annotated[str, typer.Argument(help="Device path (e.g., /dev/sdX)")],
+    dry_run: FlashDryRunOption = False,
+    force: FlashForceOption = False,
+    wipe: WipeOption = False,
+    skip_verify: Annotated[
+        bool,
+        typer.Option("--skip-verify", help="Skip hash verification after write"),
+    ] = False,
+    json_output: JsonOption = False,
+) -> None:
+    """Flash an image file to a TF/SD card.
+
+    This flashes a raw image file without database tracking.
+    Use 'flash write' to flash a tracked artifact instead.
+
+    Requires explicit device path (e.g., /dev/sdb, /dev/mmcblk0).
+    Never operates on partitions (e.g., /dev/sdb1).
+    """
+    from openwrt_imagegen.cli._schemas import FlashResultItem
+    from openwrt_imagegen.flash.service import flash_image
+    from openwrt_imagegen.types import VerificationMode
+
+    settings = _settings()
+
+    verification_mode = (
+        VerificationMode.SKIP
+        if skip_verify
+        else VerificationMode(settings.verification_mode)
+    )
+
+    # Confirmation prompt unless force or dry-run
+    if not force and not dry_run:
+        _confirm_overwrite(device, f"Image: {image_path}", wipe, json_output)
+
+    try:
+        if dry_run and not json_output:
+            console.print("[blue]Dry-run mode: validating without writing[/blue]")
+
+        result = flash_image(
+            image_path,
+            device,
+            settings=settings,
+            wipe_before=wipe,
+            verification_mode=verification_mode,
+            dry_run=dry_run,
+            force=force,
+        )
+
+        if json_output:
+            _emit_json(
+                FlashResultItem.model_validate(result).model_dump_json(
+                    indent=2, exclude={"flash_record_id"}
+                )
+            )
+        else:
+            if result.success:
+                if dry_run:
+                    console.print("[green]✓ Dry-run validation passed[/green]")
+                    console.print(f"  Would write {result.bytes_written} bytes")
+                    console.print(f"  Image: {result.image_path}")
+                    console.print(f"  Device: {result.device_path}")
+                else:
+                    console.print("[green]✓ Flash succeeded[/green]")
+                    console.print(f"  Bytes written: {result.bytes_written}")
+                    console.print(f"  Verification: {result.verification_result.value}")
+            else:
+                console.print("[red]✗ Flash failed[/red]")
+                if result.error_message:
+                    console.print(f"  Error: {result.error_message}")
+
+        if not result.success:
+            raise typer.Exit(code=1)
+
+    except Exception as e:
+        console.print(f"[red]Flash failed: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+
+@app.command("list")
+def flash_list(
+    artifact_id: Annotated[
+        int | None,
+        typer.Option("--artifact-id", "-a", help="Filter by artifact ID"),
+    ] = None,
+    build_id: BuildIdFilter = None,
+    device_path: Annotated[
+        str | None,
+        typer.Option("--device", "-d", help="Filter by device path"),
+    ] = None,
+    status: StatusFilter = None,
+    limit: LimitOption = 100,
+    json_output: JsonOption = False,
+    ndjson_output: NdjsonOption = False,
+) -> None:
+    """List flash records.
+
+    Shows history of flash operations with optional filters.
+    """
+    from openwrt_imagegen.cli._schemas import FlashRecordListItem
+    from openwrt_imagegen.flash.models import FlashRecord
+    from openwrt_imagegen.flash.service import iter_flash_records
+    from openwrt_imagegen.types import FlashStatus
+
+    factory = _readonly_session_factory()
+
+    # Parse status filter
+    status_filter: FlashStatus | None = None
+    if status:
+        try:
+            status_filter = FlashStatus(status)
+        except ValueError:
+            console.print(f"[red]Invalid status: {status}[/red]")
+            console.print("Valid values: pending, running, succeeded, failed")
+            raise typer.Exit(code=1) from None
+
+    with factory() as session:
+
+        def select_records(columns: list[Any]) -> Iterator[Any]:
+            return iter_flash_records(
+                session,
+                columns,
+                artifact_id=artifact_id,
+                build_id=build_id,
+                device_path=device_path,
+                status=status_filter,
+                limit=limit,
+            )
+
+        if json_output or ndjson_output:
+            # Select just the fields the JSON schema exposes
+            json_columns = [
+                getattr(FlashRecord, name) for name in FlashRecordListItem.model_fields
+            ]
+            if ndjson_output:
+                _write_ndjson(
+                    select_records(json_columns),
+                    encode=lambda r: _encode_row(r, indent=False),
+                )
+            else:
+                _write_json_array(select_records(json_columns), encode=_encode_row)
+            return
+
+        text_columns = [
+            FlashRecord.id,
+            FlashRecord.artifact_id,
+            FlashRecord.build_id,
+            FlashRecord.device_path,
+            FlashRecord.status,
+            FlashRecord.verification_result,
+            FlashRecord.requested_at,
+            FlashRecord.error_message,
+        ]
+        records = list(select_records(text_columns))
+
+        if not records:
+            console.print("[yellow]No flash records found[/yellow]")
+            return
+
+        lines = [f"[bold]Found {len(records)} flash record(s):[/bold]", ""]
+        for r in records:
+            status_color = _FLASH_STATUS_COLOR.get(r.status, "white")
+            lines.append(f"  [{status_color}]Flash #{r.id}[/{status_color}]")
+            lines.append(f"    Artifact ID: {r.artifact_id}")
+            lines.append(f"    Build ID: {r.build_id}")
+            lines.append(f"    Device: {r.device_path}")
+            lines.append(f"    Status: {r.status.value}")
+            lines.append(f"    Verification: {r.verification_result or 'N/A'}")
+            lines.append(
+                f"    Requested: {r.requested_at.isoformat() if r.requested_at else 'N/A'}"
+            )
+            if r.error_message:
+                lines.append(f"    Error: {r.error_message}")
+            lines.append("")
+        console.print("\n".join(lines), highlight=False)
@@ -0,0 +1,71 @@
+"""Shared Typer option declarations for CLI commands.
+
+Each alias bundles a parameter type with its ``typer.Option``, so options
+that several commands accept are declared (and their ``OptionInfo``
+constructed) once and read the same everywhere.
+"""
+
+from typing import Annotated
+
+import typer
+
+JsonOption = Annotated[bool, typer.Option("--json", help="Output as JSON")]
+NdjsonOption = Annotated[
+    bool,
+    typer.Option("--ndjson", help="Output as newline-delimited JSON, one per line"),
+]
+
+ReleaseFilter = Annotated[
+    str | None,
+    typer.Option("--release", "-r", help="Filter by OpenWrt release"),
+]
+TargetFilter = Annotated[
+    str | None,
+    typer.Option("--target", "-t", help="Filter by target"),
+]
+SubtargetFilter = Annotated[
+    str | None,
+    typer.Option("--subtarget", "-s", help="Filter by subtarget"),
+]
+DeviceIdFilter = Annotated[
+    str | None,
+    typer.Option("--device", "-d", help="Filter by device ID"),
+]
+TagFilter = Annotated[
+    list[str] | None,
+    typer.Option("--tag", help="Filter by tag (can be repeated)"),
+]
+BuildIdFilter = Annotated[
+    int | None,
+    typer.Option("--build-id", "-b", help="Filter by build ID"),
+]
+StatusFilter = Annotated[
+    str | None,
+    typer.Option(
+        "--status", "-s", help="Filter by status (pending/running/succeeded/failed)"
+    ),
+]
+LimitOption = Annotated[
+    int,
+    typer.Option("--limit", "-l", help="Maximum number of records to return"),
+]
+
+# Build commands
+BuildForceOption = Annotated[
+    bool,
+    typer.Option("--force", "-f", help="Force rebuild even if cached"),
+]
+
+# Flash commands
+FlashDryRunOption = Annotated[
+    bool,
+    typer.Option("--dry-run", "-n", help="Show what would be done without writing"),
+]
+FlashForceOption = Annotated[
+    bool,
+    typer.Option("--force", "-f", help="Skip confirmation prompts"),
+]
+WipeOption = Annotated[
+    bool,
+    typer.Option("--wipe", "-w", help="Wipe device before writing"),
+]
@@ -0,0 +1,298 @@
+"""Profile management commands (``imagegen profiles``)."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from openwrt_imagegen.cli import (
+    _emit_json,
+    _readonly_session_factory,
+    _session_factory,
+    _write_json_array,
+    _write_ndjson,
+    console,
+)
+from openwrt_imagegen.cli._options import (
+    DeviceIdFilter,
+    JsonOption,
+    NdjsonOption,
+    ReleaseFilter,
+    SubtargetFilter,
+    TagFilter,
+    TargetFilter,
+)
+
+app = typer.Typer(help="Manage device profiles")
+
+
+@app.command("list")
+def profiles_list(
+    device_id: DeviceIdFilter = None,
+    release: ReleaseFilter = None,
+    target: TargetFilter = None,
+    subtarget: SubtargetFilter = None,
+    tags: TagFilter = None,
+    json_output: JsonOption = False,
+    ndjson_output: NdjsonOption = False,
+) -> None:
+    """List profiles in the database.
+
+    Supports filtering by device, release, target, subtarget, and tags.
+    Use --json for machine-readable output, or --ndjson for one JSON
+    object per line.
+    """
+    from openwrt_imagegen.profiles.service import (
+        iter_profiles,
+        list_profiles,
+        profile_to_schema,
+        query_profiles,
+    )
+
+    factory = _readonly_session_factory()
+
+    with factory() as session:
+        if json_output or ndjson_output:
+            # Stream rows straight from the cursor to stdout; pydantic-core
+            # encodes each schema without building a dict first
+            schemas = (
+                profile_to_schema(p)
+                for p in iter_profiles(
+                    session,
+                    device_id=device_id,
+                    openwrt_release=release,
+                    target=target,
+                    subtarget=subtarget,
+                    tags=tags,
+                )
+            )
+            if ndjson_output:
+                _write_ndjson(
+                    schemas,
+                    encode=lambda s: s.model_dump_json(exclude_none=True).encode(),
+                )
+            else:
+                _write_json_array(
+                    schemas,
+                    encode=lambda s: s.model_dump_json(
+                        indent=2, exclude_none=True
+                    ).encode(),
+                )
+            return
+
+        # Use query_profiles if any filters are specified, otherwise list_profiles
+        if device_id or release or target or subtarget or tags:
+            profiles = query_profiles(
+                session,
+                device_id=device_id,
+                openwrt_release=release,
+                target=target,
+                subtarget=subtarget,
+                tags=tags,
+            )
+        else:
+            profiles = list_profiles(session)
+
+        if not profiles:
+            console.print("[yellow]No profiles found[/yellow]")
+            return
+
+        # Collect all lines and print once to avoid per-line render overhead
+        lines = [f"[bold]Found {len(profiles)} profile(s):[/bold]", ""]
+        for p in profiles:
+            lines.append(f"  [green]{p.profile_id}[/green]")
+            lines.append(f"    Name: {p.name}")
+            lines.append(f"    Device: {p.device_id}")
+            lines.append(f"    Target: {p.openwrt_release}/{p.target}/{p.subtarget}")
+            if p.tags:
+                lines.append(f"    Tags: {', '.join(p.tags)}")
+            lines.append("")
+        console.print("\n".join(lines), highlight=False)
+
+
+@app.command("show")
+def profiles_show(
+    profile_id: Annotated[str, typer.Argument(help="Profile ID to show")],
+    json_output: JsonOption = False,
+) -> None:
+    """Show details of a specific profile."""
+    from openwrt_imagegen.profiles.service import (
+        ProfileNotFoundError,
+        get_profile,
+        profile_to_schema,
+    )
+
+    factory = _readonly_session_factory()
+
+    with factory() as session:
+        try:
+            profile = get_profile(session, profile_id)
+        except ProfileNotFoundError:
+            console.print(f"[red]Profile not found: {profile_id}[/red]")
+            raise typer.Exit(code=1) from None
+
+        schema = profile_to_schema(profile, include_meta=True)
+
+        if json_output:
+            _emit_json(schema.model_dump_json(indent=2, exclude_none=True))
+        else:
+            from openwrt_imagegen.profiles.io import profile_to_yaml_string
+
+            console.print(profile_to_yaml_string(schema))
+
+
+@app.command("import")
+def profiles_import(
+    path: Annotated[str, typer.Argument(help="Path to profile file or directory")],
+    update: Annotated[
+        bool,
+        typer.Option("--update", "-u", help="Update existing profiles"),
+    ] = False,
+    pattern: Annotated[
+        str,
+        typer.Option("--pattern", "-p", help="Glob pattern for directory import"),
+    ] = "*.yaml",
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Threads reading profile files for directory import",
+        ),
+    ] = None,
+) -> None:
+    """Import profiles from YAML/JSON file(s)."""
+    from openwrt_imagegen.profiles.service import (
+        import_profile_from_file,
+        import_profiles_from_directory,
+    )
+
+    file_path = Path(path)
+    if not file_path.exists():
+        console.print(f"[red]Path not found: {path}[/red]")
+        raise typer.Exit(code=1)
+
+    factory = _session_factory()
+
+    if file_path.is_dir():
+        # The transaction commits when the block exits, before any exit code
+        with factory.begin() as session:
+            result = import_profiles_from_directory(
+                session,
+                file_path,
+                pattern=pattern,
+                update_existing=update,
+                workers=workers,
+            )
+
+        lines = [
+            "[bold]Import results:[/bold]",
+            f"  Total: {result.total}",
+            f"  [green]Succeeded: {result.succeeded}[/green]",
+        ]
+        if result.failed > 0:
+            lines.append(f"  [red]Failed: {result.failed}[/red]")
+            lines.extend(
+                f"    - {r.profile_id}: {r.error}"
+                for r in result.results
+                if not r.success
+            )
+        console.print("\n".join(lines), highlight=False)
+        if result.failed > 0:
+            raise typer.Exit(code=1)
+    else:
+        with factory.begin() as session:
+            single_result = import_profile_from_file(
+                session, file_path, update_existing=update
+            )
+
+        if single_result.success:
+            action = "Created" if single_result.created else "Updated"
+            console.print(
+                f"[green]{action} profile: {single_result.profile_id}[/green]"
+            )
+        else:
+            console.print(f"[red]Failed: {single_result.error}[/red]")
+            raise typer.Exit(code=1)
+
+
+@app.command("export")
+def profiles_export(
+    path: Annotated[str, typer.Argument(help="Output path (file or directory)")],
+    profile_id: Annotated[
+        str | None,
+        typer.Option("--profile", "-p", help="Profile ID to export (for single file)"),
+    ] = None,
+    format: Annotated[
+        str,
+        typer.Option("--format", "-f", help="Output format for directory export"),
+    ] = "yaml",
+    include_meta: Annotated[
+        bool,
+        typer.Option("--include-meta", help="Include metadata in export"),
+    ] = False,
+) -> None:
+    """Export profiles to YAML/JSON file(s)."""
+    from openwrt_imagegen.profiles.service import (
+        ProfileNotFoundError,
+        export_profile_to_file,
+        export_profiles_to_directory,
+    )
+
+    output_path = Path(path)
+    factory = _readonly_session_factory()
+
+    with factory() as session:
+        try:
+            if profile_id:
+                # Export single profile
+                export_profile_to_file(
+                    session, profile_id, output_path, include_meta=include_meta
+                )
+                console.print(f"[green]Exported {profile_id} to {path}[/green]")
+            else:
+                # Export all profiles to directory
+                count = export_profiles_to_directory(
+                    session, output_path, format=format, include_meta=include_meta
+                )
+                console.print(f"[green]Exported {count} profile(s) to {path}[/green]")
+        except ProfileNotFoundError as e:
+            console.print(f"[red]Profile not found: {e.profile_id}[/red]")
+            raise typer.Exit(code=1) from None
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1) from None
+
+
+@app.command("validate")
+def profiles_validate(
+    path: Annotated[str, typer.Argument(help="Path to profile file to validate")],
+) -> None:
+    """Validate a profile file without importing."""
+    from pydantic import ValidationError
+
+    from openwrt_imagegen.profiles.io import load_profile
+
+    file_path = Path(path)
+    if not file_path.exists():
+        console.print(f"[red]File not found: {path}[/red]")
+        raise typer.Exit(code=1)
+
+    try:
+        profile = load_profile(file_path)
+        profile.validate_snapshot_policy()
+        lines = [
+            f"[green]✓ Valid profile: {profile.profile_id}[/green]",
+            f"  Name: {profile.name}",
+            f"  Device: {profile.device_id}",
+            f"  Target: {profile.openwrt_release}/{profile.target}/{profile.subtarget}",
+        ]
+        console.print("\n".join(lines), highlight=False)
+    except ValidationError as e:
+        console.print("[red]Validation failed:[/red]")
+        console.print(str(e))
+        raise typer.Exit(code=1) from None
+    except ValueError as e:
+        console.print(f"[red]Validation failed: {e}[/red]")
+        raise typer.Exit(code=1) from None
@@ -0,0 +1,122 @@
+"""Pydantic models for CLI ``--json`` output.
+
+Commands validate ORM rows and service results directly into these models
+and let pydantic-core serialize them, instead of building a dict first.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator
+
+
+class BuilderListItem(BaseModel):
+    """Image Builder entry in ``imagegen builders list --json``."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    openwrt_release: str
+    target: str
+    subtarget: str
+    state: str
+    root_dir: str
+    checksum: str | None = None
+    signature_verified: bool
+    first_used_at: datetime | None = None
+    last_used_at: datetime | None = None
+
+
+class BuildListItem(BaseModel):
+    """Build record entry in ``imagegen build list --json``."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    profile_id: str | None = Field(
+        default=None, validation_alias=AliasPath("profile", "profile_id")
+    )
+    status: str
+    cache_key: str
+    is_cache_hit: bool
+    requested_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    log_path: str | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+    artifact_count: int = Field(validation_alias="artifacts")
+
+    @field_validator("artifact_count", mode="before")
+    @classmethod
+    def _count_artifacts(cls, value: Any) -> int:
+        return len(value)
+
+
+class ArtifactItem(BaseModel):
+    """Artifact entry in ``imagegen artifacts list/show --json``."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    build_id: int
+    kind: str | None = None
+    filename: str
+    relative_path: str
+    absolute_path: str | None = None
+    size_bytes: int
+    sha256: str
+    labels: list[str] | None = None
+
+
+class FlashRecordListItem(BaseModel):
+    """Flash record entry in ``imagegen flash list --json``."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    artifact_id: int
+    build_id: int
+    device_path: str
+    device_model: str | None = None
+    device_serial: str | None = None
+    status: str
+    wiped_before_flash: bool
+    verification_mode: str | None = None
+    verification_result: str | None = None
+    requested_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+    log_path: str | None = None
+
+
+class FlashResultItem(BaseModel):
+    """Flash outcome in ``imagegen flash write/image --json``.
+
+    ``flash image`` does not track records and omits ``flash_record_id``.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    success: bool
+    flash_record_id: int | None = None
+    image_path: str
+    device_path: str
+    bytes_written: int
+    source_hash: str
+    device_hash: str | None = None
+    verification_mode: str
+    verification_result: str
+    message: str | None = None
+    error_message: str | None = None
+    error_code: str | None = None
+
+
+__all__ = [
+    "ArtifactItem",
+    "BuildListItem",
+    "BuilderListItem",
+    "FlashRecordListItem",
+    "FlashResultItem",
+]
@@ -4,6 +4,7 @@ Uses pydantic-settings for config parsing from environment variables
 and defaults. Configuration precedence: CLI flags > env vars > defaults.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -68,6 +69,11 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level",
     )
+    auto_create_tables: bool = Field(
+        default=True,
+        description="Create missing database tables on startup "
+        "(disable when the schema is managed with Alembic)",
+    )
 
     # Concurrency
     max_concurrent_downloads: int = Field(
@@ -90,6 +96,10 @@ class Settings(BaseSettings):
             description="Default verification mode for flashing",
         )
     )
+    hash_algorithm: Literal["sha256", "blake3"] = Field(
+        default="sha256",
+        description="Hash used to verify flashed images (blake3 needs the blake3 extra)",
+    )
 
     # Timeouts (in seconds)
     download_timeout: int = Field(
@@ -109,15 +119,24 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the application settings singleton.
 
+    Settings are read from the environment (and ``.env``) once per
+    process; later changes are not picked up until
+    :func:`reload_settings` is called.
+
     Returns:
         Settings instance loaded from environment.
     """
     return Settings()
 
 
+# Discard the cached settings so the next lookup re-reads the environment
+reload_settings = get_settings.cache_clear
+
+
 def print_settings_json(settings: Settings | None = None) -> str:
     """Render effective settings as JSON.
 
@@ -132,4 +151,4 @@ def print_settings_json(settings: Settings | None = None) -> str:
     return settings.model_dump_json(indent=2)
 
 
-__all__ = ["Settings", "get_settings", "print_settings_json"]
+__all__ = ["Settings", "get_settings", "print_settings_json", "reload_settings"]
@@ -0,0 +1,437 @@
+"""Resident CLI daemon for openwrt_imagegen.
+
+Back-to-back CLI invocations (e.g. from an orchestration agent) each pay
+for interpreter start-up, importing SQLAlchemy/pydantic/Typer and opening
+the database. The daemon keeps one warm interpreter around and runs CLI
+invocations on behalf of a thin client over a Unix domain socket.
+
+Protocol (one request per connection):
+- The client sends one JSON line: ``{"argv": [...], "cwd": "...",
+  "env": {...}}`` where ``env`` holds the caller's ``OWRT_IMG_*``
+  variables, or ``{"command": "shutdown"}``.
+- The daemon answers with frames of ``!BI`` (channel, length) followed by
+  the payload. Channel 1 is stdout, 2 is stderr, and 3 carries the exit
+  code as ASCII and ends the response.
+
+Requests are served one at a time. Commands see an empty stdin, so
+confirmation prompts abort; pass ``--force`` where a command offers it.
+
+Requests carry settings such as ``db_url``, so the socket lives in a
+directory only the current user can enter, and the client checks with
+``SO_PEERCRED`` that the daemon runs as the same user before sending
+anything.
+
+The client side of this module only uses the standard library so that
+``imagegen --client`` starts without importing the application.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import IO, Any
+
+SOCKET_ENV = "OWRT_IMG_DAEMON_SOCKET"
+ENV_PREFIX = "OWRT_IMG_"
+
+_FRAME_HEADER = struct.Struct("!BI")
+# struct ucred from SO_PEERCRED: pid, uid, gid
+_PEER_CREDENTIALS = struct.Struct("3i")
+_STDOUT = 1
+_STDERR = 2
+_EXIT = 3
+
+# How long an auto-spawning client waits for the daemon socket to appear
+SPAWN_TIMEOUT = 10.0
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path.
+
+    Uses ``OWRT_IMG_DAEMON_SOCKET`` when set, otherwise ``imagegen.sock``
+    in ``$XDG_RUNTIME_DIR``, falling back to a per-user directory in the
+    system temp directory. The socket's directory must be private to the
+    current user; see DaemonServer.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "imagegen.sock"
+    return Path(tempfile.gettempdir()) / f"imagegen-{os.getuid()}" / "imagegen.sock"
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    """Create a 0700 directory, or check that an existing one is private.
+
+    Raises:
+        PermissionError: The directory is a symlink, belongs to another
+            user, or is accessible to group or others.
+    """
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileExistsError):
+        directory.mkdir(mode=0o700)
+    st = directory.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(
+            f"Socket directory {directory} must be a directory owned by the "
+            "current user and not accessible to group or others"
+        )
+
+
+def _peer_uid(sock: socket.socket) -> int:
+    """Return the uid of the process on the other end of a Unix socket."""
+    credentials = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size
+    )
+    uid: int = _PEER_CREDENTIALS.unpack(credentials)[1]
+    return uid
+
+
+def _send_frame(wfile: io.BufferedIOBase, channel: int, payload: bytes) -> None:
+    wfile.write(_FRAME_HEADER.pack(channel, len(payload)) + payload)
+    wfile.flush()
+
+
+def _read_exact(rfile: io.BufferedIOBase, size: int) -> bytes | None:
+    data = rfile.read(size)
+    if len(data) != size:
+        return None
+    return data
+
+
+class _FrameWriter(io.RawIOBase):
+    """Raw stream that forwards every write as a frame on one channel."""
+
+    def __init__(self, wfile: io.BufferedIOBase, channel: int) -> None:
+        super().__init__()
+        self._wfile = wfile
+        self._channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        payload = bytes(data)
+        if payload:
+            _send_frame(self._wfile, self._channel, payload)
+        return len(payload)
+
+
+def _text_stream(wfile: io.BufferedIOBase, channel: int) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BufferedWriter(_FrameWriter(wfile, channel)),
+        encoding="utf-8",
+        write_through=True,
+    )
+
+
+@contextlib.contextmanager
+def _caller_environment(cwd: str | None, env: dict[str, str]) -> Any:
+    """Temporarily adopt the client's working directory and settings env."""
+    saved_cwd = os.getcwd()
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+    for key in saved_env:
+        if key != SOCKET_ENV:
+            del os.environ[key]
+    os.environ.update({k: v for k, v in env.items() if k.startswith(ENV_PREFIX)})
+    try:
+        if cwd:
+            os.chdir(cwd)
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        for key in [k for k in os.environ if k.startswith(ENV_PREFIX)]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+
+
+def _run_cli(request: dict[str, Any], wfile: io.BufferedIOBase) -> int:
+    """Run one CLI invocation, streaming its output to the client.
+
+    Returns:
+        The process exit code the invocation would have produced.
+    """
+    from openwrt_imagegen.cli import _cli_command
+    from openwrt_imagegen.logs import shutdown_logging
+
+    stdout = _text_stream(wfile, _STDOUT)
+    stderr = _text_stream(wfile, _STDERR)
+    code = 0
+    with (
+        _caller_environment(request.get("cwd"), request.get("env") or {}),
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        saved_stdin = sys.stdin
+        sys.stdin = io.StringIO()
+        try:
+            _cli_command()(args=list(request.get("argv") or []), prog_name="imagegen")
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                code = e.code
+            elif e.code is not None:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdin = saved_stdin
+            # Drain records still queued for the listener thread into this
+            # request's stderr before the exit frame ends the response
+            shutdown_logging()
+            stdout.flush()
+            stderr.flush()
+    return code
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serve a single client request."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            _send_frame(self.wfile, _STDERR, b"imagegen daemon: malformed request\n")
+            _send_frame(self.wfile, _EXIT, b"2")
+            return
+
+        if request.get("command") == "shutdown":
+            _send_frame(self.wfile, _EXIT, b"0")
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        code = _run_cli(request, self.wfile)
+        _send_frame(self.wfile, _EXIT, str(code).encode())
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server that runs CLI invocations one at a time."""
+
+    def __init__(self, socket_path: Path) -> None:
+        _ensure_private_dir(socket_path.parent)
+        if socket_path.exists():
+            if _is_listening(socket_path):
+                raise OSError(f"Daemon already running on {socket_path}")
+            socket_path.unlink()
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.socket_path = socket_path
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def warm_up() -> None:
+    """Import the modules and build the command trees invocations reuse."""
+    from openwrt_imagegen.cli import _LAZY_SUBCOMMANDS, _cli_command, _load_group
+    from openwrt_imagegen.db import import_models
+
+    import_models()
+    _cli_command()
+    for name in _LAZY_SUBCOMMANDS:
+        _load_group(name)
+
+
+def serve(socket_path: Path | None = None) -> None:
+    """Run the daemon in the foreground until it is asked to shut down.
+
+    Args:
+        socket_path: Socket to listen on. Defaults to default_socket_path().
+    """
+    warm_up()
+    with DaemonServer(socket_path or default_socket_path()) as server:
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Connect to the daemon, or return None if nothing is listening.
+
+    Raises:
+        PermissionError: The listening process belongs to another user.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    try:
+        uid = _peer_uid(sock)
+    except OSError:
+        sock.close()
+        raise
+    if uid != os.getuid():
+        sock.close()
+        raise PermissionError(
+            f"Refusing to use {socket_path}: it is served by uid {uid}, "
+            f"not the current user (uid {os.getuid()})"
+        )
+    return sock
+
+
+def _spawn_daemon(socket_path: Path) -> socket.socket | None:
+    """Start a detached daemon and wait for it to accept connections."""
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "openwrt_imagegen",
+            "daemon",
+            "start",
+            "--socket",
+            str(socket_path),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while time.monotonic() < deadline:
+        sock = _connect(socket_path)
+        if sock is not None:
+            return sock
+        time.sleep(0.05)
+    return None
+
+
+def _exchange(
+    sock: socket.socket,
+    request: dict[str, Any],
+    stdout: IO[bytes],
+    stderr: IO[bytes],
+) -> int:
+    """Send a request and relay the response frames until the exit code.
+
+    A connection lost mid-response is reported as a failure rather than
+    retried, since the command may already have had side effects.
+    """
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        while True:
+            header = _read_exact(stream, _FRAME_HEADER.size)
+            payload = None
+            if header is not None:
+                channel, length = _FRAME_HEADER.unpack(header)
+                payload = _read_exact(stream, length)
+            if payload is None:
+                stderr.write(b"imagegen: lost connection to daemon\n")
+                stderr.flush()
+                return 1
+            if channel == _EXIT:
+                return int(payload)
+            target = stdout if channel == _STDOUT else stderr
+            target.write(payload)
+            target.flush()
+
+
+def run_client(
+    argv: list[str],
+    socket_path: Path | None = None,
+    *,
+    spawn: bool = False,
+    stdout: IO[bytes] | None = None,
+    stderr: IO[bytes] | None = None,
+) -> int | None:
+    """Run a CLI invocation through the daemon.
+
+    Args:
+        argv: CLI arguments (without the program name).
+        socket_path: Daemon socket. Defaults to default_socket_path().
+        spawn: Start a daemon if none is listening.
+        stdout: Binary stream for command output. Defaults to stdout.
+        stderr: Binary stream for diagnostics. Defaults to stderr.
+
+    Returns:
+        The command's exit code, or None if no daemon could be reached or
+        trusted, in which case the caller should run the command
+        in-process.
+    """
+    socket_path = socket_path or default_socket_path()
+    stderr = stderr or sys.stderr.buffer
+    try:
+        sock = _connect(socket_path)
+        if sock is None and spawn:
+            _ensure_private_dir(socket_path.parent)
+            sock = _spawn_daemon(socket_path)
+    except PermissionError as e:
+        stderr.write(f"imagegen: {e}\n".encode())
+        stderr.flush()
+        return None
+    if sock is None:
+        return None
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)},
+    }
+    return _exchange(
+        sock,
+        request,
+        stdout or sys.stdout.buffer,
+        stderr,
+    )
+
+
+def stop_daemon(socket_path: Path | None = None) -> bool:
+    """Ask a running daemon to shut down.
+
+    Returns:
+        True if a daemon was running and acknowledged the request.
+
+    Raises:
+        PermissionError: The socket is served by another user.
+    """
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return False
+    sink = io.BytesIO()
+    return _exchange(sock, {"command": "shutdown"}, sink, sink) == 0
+
+
+__all__ = [
+    "DaemonServer",
+    "default_socket_path",
+    "run_client",
+    "serve",
+    "stop_daemon",
+    "warm_up",
+]
@@ -4,12 +4,18 @@ This module provides SQLAlchemy engine creation, session factory,
 and base model class for all ORM models.
 """
 
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import cache
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, event, make_url
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 from openwrt_imagegen.config import get_settings
 
@@ -20,6 +26,66 @@ class Base(DeclarativeBase):
     pass
 
 
+def utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime.
+
+    DateTime columns are declared without a time zone and hold UTC, so
+    values assigned in Python match the ones loaded back from the
+    database and can be compared or subtracted.
+
+    Returns:
+        Current UTC time without tzinfo.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class utc_timestamp(FunctionElement[datetime]):  # noqa: N801
+    """SQL expression for the current UTC time, without a time zone.
+
+    The database-side counterpart of utc_now(), for server defaults.
+    SQLite's ``CURRENT_TIMESTAMP`` is already UTC; PostgreSQL's ``now()``
+    is in the session time zone and is converted to UTC first.
+    """
+
+    type = DateTime()
+    name = "utc_timestamp"
+    inherit_cache = True
+
+
+@compiles(utc_timestamp)
+def _compile_utc_timestamp(
+    _element: utc_timestamp, _compiler: SQLCompiler, **_kw: Any
+) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_timestamp, "postgresql")
+def _compile_utc_timestamp_postgresql(
+    _element: utc_timestamp, _compiler: SQLCompiler, **_kw: Any
+) -> str:
+    return "timezone('UTC', now())"
+
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer and, with synchronous=NORMAL, avoids an fsync per commit; the
+# mmap/cache/temp_store settings keep hot pages in memory.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def _sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Apply SQLITE_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 def get_engine(db_url: str | None = None) -> Any:
     """Create and return a SQLAlchemy engine.
 
@@ -35,33 +101,56 @@ def get_engine(db_url: str | None = None) -> Any:
         settings = get_settings()
         db_url = settings.db_url
 
+    # Parse once; the backend decides both connect args and listeners
+    url = make_url(db_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+
     # SQLite-specific connect args for better concurrency
     connect_args: dict[str, Any] = {}
-    if db_url.startswith("sqlite"):
+    if is_sqlite:
         connect_args["check_same_thread"] = False
-        # Ensure the parent directory exists for SQLite
-        if db_url.startswith("sqlite:///"):
-            db_path = Path(db_url.replace("sqlite:///", ""))
-            db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure the parent directory exists for a file database
+        if url.database and url.database != ":memory:":
+            Path(url.database).parent.mkdir(parents=True, exist_ok=True)
 
-    return create_engine(
-        db_url,
+    engine = create_engine(
+        url,
         connect_args=connect_args,
         echo=False,
     )
+    if is_sqlite:
+        event.listen(engine, "connect", _sqlite_pragmas)
+    return engine
+
+
+@cache
+def _default_engine(db_url: str) -> Any:
+    """Return the process-wide engine for a configured database URL.
+
+    Helpers called without an explicit engine share it, so they reuse one
+    connection pool instead of creating an engine per call.
+    """
+    return get_engine(db_url)
+
+
+@cache
+def _default_session_factory(db_url: str) -> sessionmaker[Session]:
+    """Return the process-wide session factory for a configured database URL."""
+    return get_session_factory(_default_engine(db_url))
 
 
 def get_session_factory(engine: Any | None = None) -> sessionmaker[Session]:
     """Create and return a session factory.
 
     Args:
-        engine: SQLAlchemy engine. If not provided, creates one from settings.
+        engine: SQLAlchemy engine. If not provided, the shared engine for
+            the configured database is used.
 
     Returns:
         Session factory (sessionmaker).
     """
     if engine is None:
-        engine = get_engine()
+        engine = _default_engine(get_settings().db_url)
     return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
@@ -72,13 +161,14 @@ def get_session(
     """Provide a transactional scope around a series of operations.
 
     Args:
-        session_factory: Optional session factory. Creates one if not provided.
+        session_factory: Optional session factory. Defaults to the shared
+            factory for the configured database.
 
     Yields:
         SQLAlchemy Session instance.
     """
     if session_factory is None:
-        session_factory = get_session_factory()
+        session_factory = _default_session_factory(get_settings().db_url)
 
     session = session_factory()
     try:
@@ -91,17 +181,13 @@ def get_session(
         session.close()
 
 
-def create_all_tables(engine: Any | None = None) -> None:
-    """Create all tables defined by ORM models.
-
-    This is primarily for testing and development. Production deployments
-    should use Alembic migrations.
+def import_models() -> None:
+    """Import all ORM model modules.
 
-    Args:
-        engine: SQLAlchemy engine. If not provided, creates one from settings.
+    Registers every model with SQLAlchemy's mapper so relationship
+    references between modules resolve. Must run before tables are
+    created or any query is issued.
     """
-    # Import all models to ensure they are registered with SQLAlchemy's mapper
-    # before creating tables. This resolves relationship references.
     from openwrt_imagegen.builds import models as builds_models  # noqa: F401
     from openwrt_imagegen.flash import models as flash_models  # noqa: F401
     from openwrt_imagegen.imagebuilder import (
@@ -109,9 +195,37 @@ def create_all_tables(engine: Any | None = None) -> None:
     )
     from openwrt_imagegen.profiles import models as profiles_models  # noqa: F401
 
+
+# Engines whose database is known to have every table; weak so disposed
+# engines drop out, and an id() can never be mistaken for a new engine's.
+_tables_ready: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def create_all_tables(engine: Any | None = None) -> None:
+    """Create all tables defined by ORM models.
+
+    This is primarily for testing and development. Production deployments
+    should use Alembic migrations.
+
+    A database that already has every table is detected with a single
+    catalog query, instead of the per-table checks create_all() issues,
+    and later calls with the same engine return without querying at all.
+
+    Args:
+        engine: SQLAlchemy engine. If not provided, the shared engine for
+            the configured database is used.
+    """
+    from sqlalchemy import inspect
+
+    import_models()
+
     if engine is None:
-        engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+        engine = _default_engine(get_settings().db_url)
+    if engine in _tables_ready:
+        return
+    if not set(inspect(engine).get_table_names()).issuperset(Base.metadata.tables):
+        Base.metadata.create_all(bind=engine)
+    _tables_ready.add(engine)
 
 
 def drop_all_tables(engine: Any | None = None) -> None:
@@ -120,10 +234,12 @@ def drop_all_tables(engine: Any | None = None) -> None:
     WARNING: This is destructive. Only use in testing.
 
     Args:
-        engine: SQLAlchemy engine. If not provided, creates one from settings.
+        engine: SQLAlchemy engine. If not provided, the shared engine for
+            the configured database is used.
     """
     if engine is None:
-        engine = get_engine()
+        engine = _default_engine(get_settings().db_url)
+    _tables_ready.discard(engine)
     Base.metadata.drop_all(bind=engine)
 
 
@@ -134,4 +250,7 @@ __all__ = [
     "get_engine",
     "get_session",
     "get_session_factory",
+    "import_models",
+    "utc_now",
+    "utc_timestamp",
 ]
@@ -21,7 +21,9 @@ from openwrt_imagegen.flash.device import (
     NotBlockDeviceError,
     PartitionDeviceError,
     SystemDeviceError,
+    discard_device,
     validate_device,
+    validate_devices,
 )
 from openwrt_imagegen.flash.models import FlashRecord
 from openwrt_imagegen.flash.service import (
@@ -32,7 +34,9 @@ from openwrt_imagegen.flash.service import (
     FlashServiceError,
     flash_artifact,
     flash_image,
+    flash_many_artifacts,
     get_flash_records,
+    iter_flash_records,
     plan_flash,
 )
 from openwrt_imagegen.flash.writer import (
@@ -55,7 +59,9 @@ __all__ = [
     "NotBlockDeviceError",
     "PartitionDeviceError",
     "SystemDeviceError",
+    "discard_device",
     "validate_device",
+    "validate_devices",
     # Writer
     "HashMismatchError",
     "ImageNotFoundError",
@@ -71,6 +77,8 @@ __all__ = [
     "FlashServiceError",
     "flash_artifact",
     "flash_image",
+    "flash_many_artifacts",
     "get_flash_records",
+    "iter_flash_records",
     "plan_flash",
 ]
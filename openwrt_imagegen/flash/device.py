@@ -11,17 +11,29 @@ All operations follow the safety rules in docs/SAFETY.md:
 - No auto-selection of devices
 """
 
+import errno
+import fcntl
 import logging
 import os
 import re
 import stat
+import struct
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal, overload
 
 logger = logging.getLogger(__name__)
 
+# Linux ioctl returning a block device's size in bytes as a u64
+_BLKGETSIZE64 = 0x80081272
+# Linux ioctl discarding a (start, length) byte range of a block device
+_BLKDISCARD = 0x1277
+# Write size when zeroing a range on devices without discard support
+_ZERO_CHUNK_SIZE = 4 * 1024 * 1024
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Information about a validated block device.
 
@@ -51,77 +63,95 @@ class DeviceValidationError(Exception):
 
     def __init__(self, message: str, error_code: str) -> None:
         super().__init__(message)
-        self.message = message
+        self._message = message
         self.error_code = error_code
 
+    @property
+    def message(self) -> str:
+        """Human-readable description of the failure."""
+        return self._message
 
-class DeviceNotFoundError(DeviceValidationError):
-    """Device path does not exist."""
+    def __str__(self) -> str:
+        return self.message
+
+
+class _DevicePathError(DeviceValidationError):
+    """Validation error about a single device path.
+
+    The message is only formatted when it is read, so errors that are
+    caught and discarded during bulk validation cost no string work.
+    """
+
+    error_code: str
+    _template: str
 
     def __init__(self, device_path: str) -> None:
-        super().__init__(
-            f"Device not found: {device_path}", error_code="DEVICE_NOT_FOUND"
-        )
+        Exception.__init__(self, device_path)
         self.device_path = device_path
 
+    @property
+    def message(self) -> str:
+        return self._template.format(device_path=self.device_path)
 
-class NotBlockDeviceError(DeviceValidationError):
+
+class DeviceNotFoundError(_DevicePathError):
+    """Device path does not exist."""
+
+    error_code = "DEVICE_NOT_FOUND"
+    _template = "Device not found: {device_path}"
+
+
+class NotBlockDeviceError(_DevicePathError):
     """Path exists but is not a block device."""
 
-    def __init__(self, device_path: str) -> None:
-        super().__init__(
-            f"Not a block device: {device_path}", error_code="NOT_BLOCK_DEVICE"
-        )
-        self.device_path = device_path
+    error_code = "NOT_BLOCK_DEVICE"
+    _template = "Not a block device: {device_path}"
 
 
-class PartitionDeviceError(DeviceValidationError):
+class PartitionDeviceError(_DevicePathError):
     """Device appears to be a partition, not a whole device."""
 
-    def __init__(self, device_path: str) -> None:
-        super().__init__(
-            f"Device appears to be a partition, not a whole device: {device_path}. "
-            "Only whole devices (e.g., /dev/sda, /dev/mmcblk0) are supported.",
-            error_code="PARTITION_NOT_ALLOWED",
-        )
-        self.device_path = device_path
+    error_code = "PARTITION_NOT_ALLOWED"
+    _template = (
+        "Device appears to be a partition, not a whole device: {device_path}. "
+        "Only whole devices (e.g., /dev/sda, /dev/mmcblk0) are supported."
+    )
 
 
-class DeviceMountedError(DeviceValidationError):
+class DeviceMountedError(_DevicePathError):
     """Device or its partitions are mounted."""
 
+    error_code = "DEVICE_MOUNTED"
+
     def __init__(self, device_path: str, mount_points: list[str]) -> None:
-        mounts_str = ", ".join(mount_points)
-        super().__init__(
-            f"Device {device_path} has mounted partitions: {mounts_str}. "
-            "Unmount all partitions before flashing.",
-            error_code="DEVICE_MOUNTED",
-        )
+        Exception.__init__(self, device_path, mount_points)
         self.device_path = device_path
         self.mount_points = mount_points
 
+    @property
+    def message(self) -> str:
+        mounts_str = ", ".join(self.mount_points)
+        return (
+            f"Device {self.device_path} has mounted partitions: {mounts_str}. "
+            "Unmount all partitions before flashing."
+        )
+
 
-class SystemDeviceError(DeviceValidationError):
+class SystemDeviceError(_DevicePathError):
     """Device appears to be the system root device."""
 
-    def __init__(self, device_path: str) -> None:
-        super().__init__(
-            f"Device {device_path} appears to be the system root device. "
-            "Refusing to flash to avoid data loss.",
-            error_code="SYSTEM_DEVICE",
-        )
-        self.device_path = device_path
+    error_code = "SYSTEM_DEVICE"
+    _template = (
+        "Device {device_path} appears to be the system root device. "
+        "Refusing to flash to avoid data loss."
+    )
 
 
-# Patterns for partition detection
-# /dev/sdX1, /dev/hdX1, /dev/vdX1
-_PARTITION_PATTERN_SD = re.compile(r"^/dev/[shv]d[a-z]+(\d+)$")
-# /dev/nvme0n1p1, /dev/nvme0n1p2
-_PARTITION_PATTERN_NVME = re.compile(r"^/dev/nvme\d+n\d+p(\d+)$")
-# /dev/mmcblk0p1, /dev/mmcblk0p2
-_PARTITION_PATTERN_MMC = re.compile(r"^/dev/mmcblk\d+p(\d+)$")
-# /dev/loop0p1
-_PARTITION_PATTERN_LOOP = re.compile(r"^/dev/loop\d+p(\d+)$")
+# Partition naming schemes, matched as a whole path:
+# /dev/sdX1, /dev/hdX1, /dev/vdX1; /dev/nvme0n1p1; /dev/mmcblk0p1; /dev/loop0p1
+_PARTITION_PATTERN = re.compile(
+    r"/dev/(?:[shv]d[a-z]+|nvme\d+n\d+p|mmcblk\d+p|loop\d+p)\d+"
+)
 
 
 def is_partition_path(device_path: str) -> bool:
@@ -139,14 +169,11 @@ def is_partition_path(device_path: str) -> bool:
     Returns:
         True if the path appears to be a partition, False otherwise.
     """
-    patterns = [
-        _PARTITION_PATTERN_SD,
-        _PARTITION_PATTERN_NVME,
-        _PARTITION_PATTERN_MMC,
-        _PARTITION_PATTERN_LOOP,
-    ]
-
-    return any(pattern.match(device_path) for pattern in patterns)
+    # SD cards are the common case; split mmcblk<N>p<M> without the regex
+    if device_path.startswith("/dev/mmcblk"):
+        disk, sep, part = device_path[11:].partition("p")
+        return bool(sep) and disk.isdecimal() and part.isdecimal()
+    return _PARTITION_PATTERN.fullmatch(device_path) is not None
 
 
 def is_block_device(device_path: str) -> bool:
@@ -165,7 +192,32 @@ def is_block_device(device_path: str) -> bool:
         return False
 
 
-def get_mount_points(device_path: str) -> list[str]:
+def _parse_mounts(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (device, mount point) pairs from /proc/mounts lines."""
+    for line in lines:
+        # Only the first two fields are needed; leave the rest unsplit
+        parts = line.split(maxsplit=2)
+        if len(parts) >= 2:
+            yield parts[0], parts[1]
+
+
+def read_mounts() -> list[tuple[str, str]] | None:
+    """Read a snapshot of the mount table.
+
+    Returns:
+        (device, mount point) pairs from /proc/mounts, in file order, or
+        None if the file cannot be read.
+    """
+    try:
+        with open("/proc/mounts") as f:
+            return list(_parse_mounts(f))
+    except OSError:
+        return None
+
+
+def get_mount_points(
+    device_path: str, mounts: list[tuple[str, str]] | None = None
+) -> list[str]:
     """Get mount points for a device and its partitions.
 
     Parses /proc/mounts to find any mounted partitions associated
@@ -173,62 +225,71 @@ def get_mount_points(device_path: str) -> list[str]:
 
     Args:
         device_path: Path to the device (e.g., '/dev/sda').
+        mounts: Mount table from read_mounts(); read afresh if not given.
 
     Returns:
         List of mount points (empty if none mounted).
     """
-    mount_points: list[str] = []
-    device_name = Path(device_path).name
-
-    try:
-        with open("/proc/mounts") as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) >= 2:
-                    mounted_device = parts[0]
-                    mount_point = parts[1]
-
-                    # Check if this is the device or one of its partitions
-                    # Must be exact match or device name followed by a digit (partition)
-                    mounted_name = Path(mounted_device).name
-                    if mounted_name == device_name:
-                        mount_points.append(mount_point)
-                    elif (
-                        mounted_name.startswith(device_name)
-                        and len(mounted_name) > len(device_name)
-                        and (
-                            mounted_name[len(device_name)].isdigit()
-                            or mounted_name[len(device_name)] == "p"
-                        )
-                    ):
-                        # Matches partitions like sda1, sda2 or mmcblk0p1, nvme0n1p1
-                        mount_points.append(mount_point)
-    except OSError:
+    if mounts is None:
+        mounts = read_mounts()
+    if mounts is None:
         # If we can't read /proc/mounts, assume nothing is mounted
         logger.warning("Could not read /proc/mounts, skipping mount check")
+        return []
+
+    mount_points: list[str] = []
+    # Plain string splitting; a Path per mount line is needlessly heavy
+    device_name = device_path.rsplit("/", 1)[-1]
+
+    for mounted_device, mount_point in mounts:
+        # Check if this is the device or one of its partitions
+        # Must be exact match or device name followed by a digit (partition)
+        mounted_name = mounted_device.rsplit("/", 1)[-1]
+        if mounted_name == device_name:
+            mount_points.append(mount_point)
+        elif (
+            mounted_name.startswith(device_name)
+            and len(mounted_name) > len(device_name)
+            and (
+                mounted_name[len(device_name)].isdigit()
+                or mounted_name[len(device_name)] == "p"
+            )
+        ):
+            # Matches partitions like sda1, sda2 or mmcblk0p1, nvme0n1p1
+            mount_points.append(mount_point)
 
     return mount_points
 
 
-def get_root_device() -> str | None:
+def get_root_device(mounts: list[tuple[str, str]] | None = None) -> str | None:
     """Get the device that contains the root filesystem.
 
     Reads /proc/mounts to find the device mounted at '/'.
 
+    Args:
+        mounts: Mount table from read_mounts(); read afresh if not given.
+
     Returns:
         Path to the root device (whole device, not partition), or None if unknown.
     """
+    if mounts is not None:
+        return _find_root_device(mounts)
+
+    # Without a snapshot, stream the file and stop at the root mount
     try:
         with open("/proc/mounts") as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) >= 2 and parts[1] == "/":
-                    root_partition = parts[0]
-                    # Convert partition to whole device
-                    return _partition_to_whole_device(root_partition)
+            return _find_root_device(_parse_mounts(f))
     except OSError:
         logger.warning("Could not read /proc/mounts to determine root device")
+        return None
+
 
+def _find_root_device(mounts: Iterable[tuple[str, str]]) -> str | None:
+    """Return the whole device mounted at '/' in mounts, if any."""
+    for mounted_device, mount_point in mounts:
+        if mount_point == "/":
+            # Convert partition to whole device
+            return _partition_to_whole_device(mounted_device)
     return None
 
 
@@ -241,34 +302,24 @@ def _partition_to_whole_device(partition_path: str) -> str:
     Returns:
         Path to the whole device (e.g., '/dev/sda').
     """
-    # Handle /dev/sdXN -> /dev/sdX
-    match = _PARTITION_PATTERN_SD.match(partition_path)
-    if match:
-        return partition_path[: -len(match.group(1))]
+    # Anything else (whole devices, /dev/mapper/..., /dev/root) is returned
+    # as-is; stripping digits from it would invent a different device
+    if not is_partition_path(partition_path):
+        return partition_path
 
-    # Handle /dev/nvme0n1pN -> /dev/nvme0n1
-    match = _PARTITION_PATTERN_NVME.match(partition_path)
-    if match:
-        return partition_path[: partition_path.rfind("p")]
-
-    # Handle /dev/mmcblk0pN -> /dev/mmcblk0
-    match = _PARTITION_PATTERN_MMC.match(partition_path)
-    if match:
-        return partition_path[: partition_path.rfind("p")]
-
-    # Handle /dev/loop0pN -> /dev/loop0
-    match = _PARTITION_PATTERN_LOOP.match(partition_path)
-    if match:
-        return partition_path[: partition_path.rfind("p")]
-
-    # If no pattern matches, return as-is (might already be whole device)
-    return partition_path
+    # /dev/sdaN -> /dev/sda; /dev/nvme0n1pN, /dev/mmcblk0pN, /dev/loop0pN ->
+    # .../nvme0n1p etc., whose "p" separator follows a digit
+    whole = partition_path.rstrip("0123456789")
+    if whole.endswith("p") and whole[-2].isdigit():
+        whole = whole[:-1]
+    return whole
 
 
 def get_device_size(device_path: str) -> int | None:
     """Get the size of a block device in bytes.
 
-    Uses the sysfs interface to read device size.
+    Asks the kernel directly with the BLKGETSIZE64 ioctl, falling back to
+    the sysfs interface when the device cannot be opened.
 
     Args:
         device_path: Path to the device.
@@ -276,7 +327,20 @@ def get_device_size(device_path: str) -> int | None:
     Returns:
         Size in bytes, or None if unknown.
     """
-    device_name = Path(device_path).name
+    try:
+        fd = os.open(device_path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        pass
+    else:
+        try:
+            buf = fcntl.ioctl(fd, _BLKGETSIZE64, bytes(8))
+            return int(struct.unpack("Q", buf)[0])
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    device_name = os.path.basename(device_path)
     size_path = Path(f"/sys/block/{device_name}/size")
 
     try:
@@ -285,11 +349,69 @@ def get_device_size(device_path: str) -> int | None:
             sectors = int(size_path.read_text().strip())
             return sectors * 512
     except (OSError, ValueError) as e:
-        logger.warning(f"Could not read device size for {device_path}: {e}")
+        logger.warning("Could not read device size for %s: %s", device_path, e)
 
     return None
 
 
+def discard_device(device_path: str, offset: int = 0, length: int | None = None) -> int:
+    """Discard (TRIM) a byte range of a block device.
+
+    Issues the BLKDISCARD ioctl so the controller marks the blocks unused
+    instead of receiving a full pass of writes. Devices that do not
+    support discard get the range written with zeros instead.
+
+    Discarded blocks are not guaranteed to read back as zeros on every
+    device, so this is not a substitute for wiping signatures.
+
+    Args:
+        device_path: Path to the device.
+        offset: Byte offset where the range starts.
+        length: Number of bytes to discard; defaults to the rest of the device.
+
+    Returns:
+        Number of bytes discarded or zeroed.
+
+    Raises:
+        ValueError: length was not given and the device size is unknown.
+        OSError: The device could not be opened, discarded, or written.
+    """
+    if length is None:
+        size_bytes = get_device_size(device_path)
+        if size_bytes is None:
+            raise ValueError(f"Could not determine size of {device_path}")
+        length = size_bytes - offset
+
+    fd = os.open(device_path, os.O_RDWR)
+    try:
+        try:
+            fcntl.ioctl(fd, _BLKDISCARD, struct.pack("QQ", offset, length))
+        except OSError as e:
+            if e.errno != errno.EOPNOTSUPP:
+                raise
+            logger.info(
+                "Discard not supported on %s, zeroing %d bytes", device_path, length
+            )
+            _zero_range(fd, offset, length)
+    finally:
+        os.close(fd)
+
+    logger.info("Discarded %d bytes of %s at offset %d", length, device_path, offset)
+    return length
+
+
+def _zero_range(fd: int, offset: int, length: int) -> None:
+    """Write zeros over a byte range of an open file descriptor."""
+    zeros = memoryview(bytes(_ZERO_CHUNK_SIZE))
+    position = offset
+    end = offset + length
+    while position < end:
+        position += os.pwrite(
+            fd, zeros[: min(_ZERO_CHUNK_SIZE, end - position)], position
+        )
+    os.fsync(fd)
+
+
 def validate_device(
     device_path: str,
     *,
@@ -309,9 +431,12 @@ def validate_device(
 
     Args:
         device_path: Path to the device to validate.
-        check_mount: Whether to check if device is mounted.
+        check_mount: Whether to check if device is mounted. Callers that
+            need neither the refusal nor mount_points pass False to skip
+            the mount table scan.
         check_system_device: Whether to refuse the system root device.
-        allow_mounted: If True, warn about mounted devices but don't raise.
+        allow_mounted: If True, warn about mounted devices but don't raise;
+            is_mounted and mount_points are still filled in.
 
     Returns:
         DeviceInfo with validation results.
@@ -323,38 +448,137 @@ def validate_device(
         SystemDeviceError: Device is the system root device.
         DeviceMountedError: Device is mounted and allow_mounted is False.
     """
-    # Normalize path
-    device_path = os.path.abspath(device_path)
+    return validate_devices(
+        [device_path],
+        check_mount=check_mount,
+        check_system_device=check_system_device,
+        allow_mounted=allow_mounted,
+    )[0]
 
-    logger.debug("Validating device: %s", device_path)
 
-    # Check existence
-    if not os.path.exists(device_path):
-        logger.error("Device not found: %s", device_path)
-        raise DeviceNotFoundError(device_path)
+@overload
+def validate_devices(
+    device_paths: Sequence[str],
+    *,
+    check_mount: bool = ...,
+    check_system_device: bool = ...,
+    allow_mounted: bool = ...,
+    raise_on_error: Literal[True] = ...,
+) -> list[DeviceInfo]: ...
 
-    # Check if block device
-    if not is_block_device(device_path):
-        logger.error("Not a block device: %s", device_path)
-        raise NotBlockDeviceError(device_path)
 
-    # Check if partition
-    if is_partition_path(device_path):
-        logger.error("Device is a partition: %s", device_path)
-        raise PartitionDeviceError(device_path)
+@overload
+def validate_devices(
+    device_paths: Sequence[str],
+    *,
+    check_mount: bool = ...,
+    check_system_device: bool = ...,
+    allow_mounted: bool = ...,
+    raise_on_error: Literal[False],
+) -> list[DeviceInfo | DeviceValidationError]: ...
+
+
+def validate_devices(
+    device_paths: Sequence[str],
+    *,
+    check_mount: bool = True,
+    check_system_device: bool = True,
+    allow_mounted: bool = False,
+    raise_on_error: bool = True,
+) -> list[DeviceInfo] | list[DeviceInfo | DeviceValidationError]:
+    """Validate several device paths for flashing in one pass.
+
+    Applies the checks of validate_device() to every path, but reads the
+    mount table and resolves the root device once for the whole batch.
+
+    Args:
+        device_paths: Paths of the devices to validate.
+        check_mount: Whether to check if devices are mounted. False skips
+            the mount table scan.
+        check_system_device: Whether to refuse the system root device.
+        allow_mounted: If True, warn about mounted devices but don't raise.
+        raise_on_error: If True, raise the first failure; if False, return
+            the error in place of that device's DeviceInfo and go on
+            validating the rest.
+
+    Returns:
+        DeviceInfo (or, with raise_on_error False, DeviceValidationError)
+        for each path, in the order given.
+
+    Raises:
+        DeviceValidationError: The first failing check when raise_on_error
+            is True; see validate_device().
+    """
+    checked: list[str | DeviceValidationError] = []
+    for device_path in device_paths:
+        try:
+            checked.append(_check_whole_block_device(device_path))
+        except DeviceValidationError as e:
+            if raise_on_error:
+                raise
+            checked.append(e)
+    # Every device is checked against one snapshot of the mount table,
+    # which is not read at all when no path got this far
+    pending = any(isinstance(entry, str) for entry in checked)
+    mounts = read_mounts() if pending and (check_system_device or check_mount) else None
+    root_device = get_root_device(mounts) if pending and check_system_device else None
+
+    results: list[DeviceInfo | DeviceValidationError] = []
+    for entry in checked:
+        if isinstance(entry, DeviceValidationError):
+            results.append(entry)
+            continue
+        try:
+            results.append(
+                _check_device_in_use(
+                    entry,
+                    mounts,
+                    root_device,
+                    check_mount=check_mount,
+                    allow_mounted=allow_mounted,
+                )
+            )
+        except DeviceValidationError as e:
+            if raise_on_error:
+                raise
+            results.append(e)
+    return results
+
+
+def _check_device_in_use(
+    device_path: str,
+    mounts: list[tuple[str, str]] | None,
+    root_device: str | None,
+    *,
+    check_mount: bool,
+    allow_mounted: bool,
+) -> DeviceInfo:
+    """Check a whole block device against the root device and mount table.
+
+    Args:
+        device_path: Normalized path from _check_whole_block_device().
+        mounts: Mount table snapshot shared by the batch.
+        root_device: Root filesystem device, or None to skip that check.
+        check_mount: Whether to look up the device's mount points.
+        allow_mounted: If True, warn about mounted devices but don't raise.
 
+    Returns:
+        DeviceInfo for the device.
+
+    Raises:
+        SystemDeviceError: Device is the system root device.
+        DeviceMountedError: Device is mounted and allow_mounted is False.
+    """
     # Check if system device
-    if check_system_device:
-        root_device = get_root_device()
-        if root_device and device_path == root_device:
-            logger.error("Device is system root: %s", device_path)
-            raise SystemDeviceError(device_path)
+    if root_device and device_path == root_device:
+        logger.error("Device is system root: %s", device_path)
+        raise SystemDeviceError(device_path)
 
     # Get mount points
     mount_points: list[str] = []
     is_mounted = False
     if check_mount:
-        mount_points = get_mount_points(device_path)
+        mount_points = get_mount_points(device_path, mounts)
         is_mounted = len(mount_points) > 0
 
         if is_mounted and not allow_mounted:
@@ -385,6 +609,45 @@ def validate_device(
     )
 
 
+def _check_whole_block_device(device_path: str) -> str:
+    """Check that a path names an existing whole block device.
+
+    Args:
+        device_path: Path to the device.
+
+    Returns:
+        The normalized absolute device path.
+
+    Raises:
+        DeviceNotFoundError: Device path does not exist.
+        NotBlockDeviceError: Path is not a block device.
+        PartitionDeviceError: Device is a partition, not whole device.
+    """
+    # Normalize path
+    device_path = os.path.abspath(device_path)
+
+    logger.debug("Validating device: %s", device_path)
+
+    # Check existence and device type with a single stat(2)
+    try:
+        mode = os.stat(device_path).st_mode
+    except FileNotFoundError:
+        logger.error("Device not found: %s", device_path)
+        raise DeviceNotFoundError(device_path) from None
+    except OSError:
+        mode = 0
+    if not stat.S_ISBLK(mode):
+        logger.error("Not a block device: %s", device_path)
+        raise NotBlockDeviceError(device_path)
+
+    # Check if partition
+    if is_partition_path(device_path):
+        logger.error("Device is a partition: %s", device_path)
+        raise PartitionDeviceError(device_path)
+
+    return device_path
+
+
 __all__ = [
     "DeviceInfo",
     "DeviceMountedError",
@@ -393,10 +656,13 @@ __all__ = [
     "NotBlockDeviceError",
     "PartitionDeviceError",
     "SystemDeviceError",
+    "discard_device",
     "get_device_size",
     "get_mount_points",
     "get_root_device",
     "is_block_device",
     "is_partition_path",
+    "read_mounts",
     "validate_device",
+    "validate_devices",
 ]
@@ -8,15 +8,27 @@ for the schema design and safety requirements.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from openwrt_imagegen.db import Base
+from openwrt_imagegen.db import Base, utc_now, utc_timestamp
 from openwrt_imagegen.types import FlashStatus
 
 if TYPE_CHECKING:
     from openwrt_imagegen.builds.models import Artifact, BuildRecord
 
+# Predicate of the partial index over flashes still in flight
+_ACTIVE_STATUS_CLAUSE = "status IN ('pending', 'running')"
+
 
 class FlashRecord(Base):
     """ORM model for TF/SD card flash operations.
@@ -62,15 +74,27 @@ class FlashRecord(Base):
     device_serial: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timing
+    # Stamped by the database, in UTC like the Python-side timestamps
     requested_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, server_default=func.now()
+        DateTime, nullable=False, server_default=utc_timestamp()
     )
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Status
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=FlashStatus.PENDING.value, index=True
+    # Stored by value ('pending', ...) so existing rows stay valid; a native
+    # enum type where the backend has one, a CHECK-constrained VARCHAR elsewhere
+    status: Mapped[FlashStatus] = mapped_column(
+        Enum(
+            FlashStatus,
+            name="flash_status",
+            values_callable=lambda statuses: [s.value for s in statuses],
+            create_constraint=True,
+            length=20,
+        ),
+        nullable=False,
+        default=FlashStatus.PENDING,
+        index=True,
     )
 
     # Flash options
@@ -94,24 +118,37 @@ class FlashRecord(Base):
     # Indexes
     __table_args__ = (
         Index("ix_flash_records_artifact_status", "artifact_id", "status"),
+        # Record listings sort newest first; the index is walked backwards
+        # for ORDER BY requested_at DESC, id DESC, and status/device_path
+        # filters are checked from index entries before the row is fetched
+        Index("ix_flash_records_recent", "requested_at", "id", "status", "device_path"),
+        # Most records end up succeeded or failed; in-flight lookups only
+        # need the few pending/running rows
+        Index(
+            "ix_flash_records_active",
+            "artifact_id",
+            postgresql_where=text(_ACTIVE_STATUS_CLAUSE),
+            sqlite_where=text(_ACTIVE_STATUS_CLAUSE),
+        ),
     )
 
     def __repr__(self) -> str:
         """Return string representation of FlashRecord."""
+        status = self.status.value if self.status else None
         return (
             f"<FlashRecord(id={self.id}, artifact_id={self.artifact_id}, "
-            f"device_path='{self.device_path}', status='{self.status}')>"
+            f"device_path='{self.device_path}', status='{status}')>"
         )
 
     def mark_running(self) -> None:
         """Mark this flash as running."""
-        self.status = FlashStatus.RUNNING.value
-        self.started_at = datetime.now()
+        self.status = FlashStatus.RUNNING
+        self.started_at = utc_now()
 
     def mark_succeeded(self) -> None:
         """Mark this flash as succeeded."""
-        self.status = FlashStatus.SUCCEEDED.value
-        self.finished_at = datetime.now()
+        self.status = FlashStatus.SUCCEEDED
+        self.finished_at = utc_now()
 
     def mark_failed(
         self, error_type: str | None = None, message: str | None = None
@@ -122,8 +159,8 @@ class FlashRecord(Base):
             error_type: Type/category of the error.
             message: Error message details.
         """
-        self.status = FlashStatus.FAILED.value
-        self.finished_at = datetime.now()
+        self.status = FlashStatus.FAILED
+        self.finished_at = utc_now()
         if error_type:
             self.error_type = error_type
         if message:
@@ -131,7 +168,7 @@ class FlashRecord(Base):
 
     def is_succeeded(self) -> bool:
         """Check if this flash succeeded."""
-        return self.status == FlashStatus.SUCCEEDED.value
+        return self.status == FlashStatus.SUCCEEDED
 
 
 __all__ = ["FlashRecord"]
@@ -3,6 +3,7 @@
 This module provides high-level flash operations:
 - flash_artifact: Flash an artifact by ID with DB tracking
 - flash_image: Flash an image file directly
+- flash_many_artifacts: Flash several artifacts, one per device
 - Dry-run mode support
 - Force flag support
 - FlashRecord persistence
@@ -16,18 +17,24 @@ All operations follow the safety rules in docs/SAFETY.md:
 """
 
 import logging
+import os
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, Row, Select, bindparam, insert, select, update
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from openwrt_imagegen.builds.models import Artifact
 from openwrt_imagegen.config import Settings, get_settings
+from openwrt_imagegen.db import utc_now
 from openwrt_imagegen.flash.device import (
     DeviceInfo,
     DeviceValidationError,
     validate_device,
+    validate_devices,
 )
 from openwrt_imagegen.flash.models import FlashRecord
 from openwrt_imagegen.flash.writer import (
@@ -35,10 +42,16 @@ from openwrt_imagegen.flash.writer import (
     HashMismatchError,
     ImageNotFoundError,
     WriteError,
+    WriteResult,
     compute_file_hash,
     write_image_to_device,
 )
-from openwrt_imagegen.types import FlashStatus, VerificationMode, VerificationResult
+from openwrt_imagegen.types import (
+    FlashStatus,
+    HashAlgorithm,
+    VerificationMode,
+    VerificationResult,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,13 +101,14 @@ class FlashPlan:
     Attributes:
         image_path: Path to the image file.
         image_size: Size of the image in bytes.
-        image_hash: SHA-256 hash of the image.
+        image_hash: Hash of the image (empty if deferred to the writer).
         device_path: Path to the target device.
         device_info: Information about the device.
         wipe_before: Whether device will be wiped before writing.
         verification_mode: How write will be verified.
         artifact_id: Artifact ID if flashing from database.
         build_id: Build ID if flashing from database.
+        hash_algorithm: Algorithm of image_hash and of the verification.
     """
 
     image_path: str
@@ -106,6 +120,7 @@ class FlashPlan:
     verification_mode: VerificationMode
     artifact_id: int | None = None
     build_id: int | None = None
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256
 
 
 @dataclass
@@ -118,7 +133,7 @@ class FlashResult:
         image_path: Path to the flashed image.
         device_path: Path to the target device.
         bytes_written: Number of bytes written.
-        source_hash: SHA-256 hash of the source image.
+        source_hash: Hash of the source image.
         device_hash: SHA-256 hash read back from device.
         verification_mode: Verification mode used.
         verification_result: Result of hash verification.
@@ -176,6 +191,33 @@ def _get_artifact_path(artifact: Artifact, settings: Settings) -> Path:
         return settings.artifacts_dir / artifact.relative_path
 
 
+@lru_cache(maxsize=32)
+def _cached_file_hash(
+    path: str,
+    size: int,  # noqa: ARG001
+    mtime_ns: int,  # noqa: ARG001
+    max_bytes: int | None,
+    algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+) -> str:
+    """Hash an image file, remembering the result for unchanged files.
+
+    size and mtime_ns are only part of the cache key: an image that is
+    rewritten in place gets a new key and is hashed again.
+
+    Args:
+        path: Resolved path to the image file.
+        size: File size in bytes when the hash was requested.
+        mtime_ns: File modification time in nanoseconds.
+        max_bytes: Number of leading bytes to hash, or None for the whole file.
+        algorithm: Hash algorithm to use.
+
+    Returns:
+        Hex digest.
+    """
+    image_hash, _ = compute_file_hash(path, max_bytes=max_bytes, algorithm=algorithm)
+    return image_hash
+
+
 def plan_flash(
     image_path: str | Path,
     device_path: str,
@@ -186,6 +228,10 @@ def plan_flash(
     build_id: int | None = None,
     check_mount: bool = True,
     check_system_device: bool = True,
+    image_sha256: str | None = None,
+    defer_hash: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    device_info: DeviceInfo | None = None,
 ) -> FlashPlan:
     """Create a plan for a flash operation.
 
@@ -201,6 +247,15 @@ def plan_flash(
         build_id: Build ID if flashing from database.
         check_mount: Whether to check if device is mounted.
         check_system_device: Whether to refuse system root device.
+        image_sha256: Known SHA-256 of the whole image (e.g. a build
+            artifact's recorded hash); used instead of hashing the file
+            in full verification mode.
+        defer_hash: Leave image_hash empty because the writer will hash the
+            image while writing it; a dry run needs the hash up front.
+        hash_algorithm: Hash algorithm for the image hash and verification;
+            image_sha256 is only used with SHA-256.
+        device_info: Result of validating device_path already (e.g. in a
+            validate_devices() batch); the device is not validated again.
 
     Returns:
         FlashPlan with operation details.
@@ -216,31 +271,48 @@ def plan_flash(
     """
     image_path = Path(image_path)
 
-    # Validate image exists
-    if not image_path.exists():
-        raise ImageNotFoundError(str(image_path))
-
-    # Get image info
-    image_size = image_path.stat().st_size
+    # Validate image exists and get its info
+    try:
+        image_stat = image_path.stat()
+    except FileNotFoundError:
+        raise ImageNotFoundError(str(image_path)) from None
+    image_size = image_stat.st_size
 
-    # Compute image hash for the verification mode
+    # Compute image hash for the verification mode; planning an unchanged
+    # image again reuses the earlier hash
     if verification_mode == VerificationMode.SKIP:
         image_hash = ""
-    elif verification_mode == VerificationMode.FULL:
-        image_hash, _ = compute_file_hash(image_path)
+    elif (
+        verification_mode == VerificationMode.FULL
+        and image_sha256
+        and hash_algorithm == HashAlgorithm.SHA256
+    ):
+        image_hash = image_sha256
+    elif defer_hash:
+        # Hashed by the writer in the same pass that copies the image
+        image_hash = ""
     else:
-        # Prefix mode
-        verify_bytes = min(
-            VERIFICATION_SIZE_BYTES.get(verification_mode, image_size), image_size
+        verify_bytes: int | None = None
+        if verification_mode != VerificationMode.FULL:
+            # Prefix mode
+            verify_bytes = min(
+                VERIFICATION_SIZE_BYTES.get(verification_mode, image_size), image_size
+            )
+        image_hash = _cached_file_hash(
+            str(image_path.resolve()),
+            image_size,
+            image_stat.st_mtime_ns,
+            verify_bytes,
+            hash_algorithm,
         )
-        image_hash, _ = compute_file_hash(image_path, max_bytes=verify_bytes)
 
     # Validate device
-    device_info = validate_device(
-        device_path,
-        check_mount=check_mount,
-        check_system_device=check_system_device,
-    )
+    if device_info is None:
+        device_info = validate_device(
+            device_path,
+            check_mount=check_mount,
+            check_system_device=check_system_device,
+        )
 
     return FlashPlan(
         image_path=str(image_path),
@@ -252,6 +324,77 @@ def plan_flash(
         verification_mode=verification_mode,
         artifact_id=artifact_id,
         build_id=build_id,
+        hash_algorithm=hash_algorithm,
+    )
+
+
+def _validation_failure(
+    image_path: Path,
+    device_path: str,
+    verification_mode: VerificationMode,
+    error: DeviceValidationError,
+) -> FlashResult:
+    """Build the result for a flash rejected by device validation."""
+    logger.error("Device validation failed: %s", error.message)
+    return FlashResult(
+        success=False,
+        flash_record_id=None,
+        image_path=str(image_path),
+        device_path=device_path,
+        bytes_written=0,
+        source_hash="",
+        device_hash=None,
+        verification_mode=verification_mode,
+        verification_result=VerificationResult.SKIPPED,
+        error_message=error.message,
+        error_code=error.error_code,
+    )
+
+
+def _write_failure(
+    plan: FlashPlan, flash_record_id: int | None, error: WriteError
+) -> FlashResult:
+    """Build the result for a flash whose write or verification failed."""
+    logger.error("Flash failed: %s", error.message)
+    return FlashResult(
+        success=False,
+        flash_record_id=flash_record_id,
+        image_path=plan.image_path,
+        device_path=plan.device_path,
+        bytes_written=0,
+        source_hash=error.expected_hash
+        if isinstance(error, HashMismatchError)
+        else plan.image_hash,
+        device_hash=error.actual_hash if isinstance(error, HashMismatchError) else None,
+        verification_mode=plan.verification_mode,
+        verification_result=VerificationResult.MISMATCH
+        if isinstance(error, HashMismatchError)
+        else VerificationResult.SKIPPED,
+        error_message=error.message,
+        error_code=error.error_code,
+    )
+
+
+def _write_success(
+    plan: FlashPlan, flash_record_id: int | None, write_result: WriteResult
+) -> FlashResult:
+    """Build the result for a written and verified flash."""
+    logger.info(
+        "Flash succeeded: %d bytes written to %s, verification=%s",
+        write_result.bytes_written,
+        plan.device_path,
+        write_result.verification_result.value,
+    )
+    return FlashResult(
+        success=True,
+        flash_record_id=flash_record_id,
+        image_path=plan.image_path,
+        device_path=plan.device_path,
+        bytes_written=write_result.bytes_written,
+        source_hash=write_result.source_hash,
+        device_hash=write_result.device_hash,
+        verification_mode=write_result.verification_mode,
+        verification_result=write_result.verification_result,
     )
 
 
@@ -267,6 +410,7 @@ def flash_image(
     force: bool = False,
     artifact_id: int | None = None,
     build_id: int | None = None,
+    image_sha256: str | None = None,
 ) -> FlashResult:
     """Flash an image to a device.
 
@@ -289,6 +433,7 @@ def flash_image(
         force: If True, skip confirmation prompts (for non-interactive use).
         artifact_id: Artifact ID if flashing from database.
         build_id: Build ID if flashing from database.
+        image_sha256: Known SHA-256 of the whole image, if any.
 
     Returns:
         FlashResult with operation details. If an error occurs (e.g., device validation failure,
@@ -300,6 +445,7 @@ def flash_image(
 
     if verification_mode is None:
         verification_mode = VerificationMode(settings.verification_mode)
+    hash_algorithm = HashAlgorithm(settings.hash_algorithm)
 
     image_path = Path(image_path)
 
@@ -320,22 +466,12 @@ def flash_image(
             verification_mode=verification_mode,
             artifact_id=artifact_id,
             build_id=build_id,
+            image_sha256=image_sha256,
+            defer_hash=not dry_run,
+            hash_algorithm=hash_algorithm,
         )
     except DeviceValidationError as e:
-        logger.error("Device validation failed: %s", e.message)
-        return FlashResult(
-            success=False,
-            flash_record_id=None,
-            image_path=str(image_path),
-            device_path=device_path,
-            bytes_written=0,
-            source_hash="",
-            device_hash=None,
-            verification_mode=verification_mode,
-            verification_result=VerificationResult.SKIPPED,
-            error_message=e.message,
-            error_code=e.error_code,
-        )
+        return _validation_failure(image_path, device_path, verification_mode, e)
 
     # If dry-run, return the plan without writing
     if dry_run:
@@ -353,7 +489,9 @@ def flash_image(
             message="Dry-run mode: no write performed",
         )
 
-    # Create FlashRecord if session provided
+    # Create FlashRecord if session provided. The write starts right away,
+    # so the record is inserted already running (one INSERT, no UPDATE);
+    # the database stamps requested_at.
     flash_record: FlashRecord | None = None
     if session is not None and artifact_id is not None and build_id is not None:
         flash_record = FlashRecord(
@@ -362,27 +500,24 @@ def flash_image(
             device_path=plan.device_path,
             device_model=plan.device_info.model,
             device_serial=plan.device_info.serial,
-            status=FlashStatus.PENDING.value,
+            status=FlashStatus.PENDING,
             wiped_before_flash=wipe_before,
             verification_mode=verification_mode.value,
-            requested_at=datetime.now(),
         )
+        flash_record.mark_running()
         session.add(flash_record)
         session.flush()  # Get the ID
         logger.debug("Created FlashRecord id=%d", flash_record.id)
 
     # Perform the write
     try:
-        if flash_record:
-            flash_record.mark_running()
-            session.flush()  # type: ignore[union-attr]
-
         write_result = write_image_to_device(
             plan.image_path,
             plan.device_path,
             wipe_before=wipe_before,
             verification_mode=verification_mode,
-            expected_hash=plan.image_hash,
+            expected_hash=plan.image_hash or None,
+            hash_algorithm=plan.hash_algorithm,
         )
 
         # Success
@@ -391,47 +526,16 @@ def flash_image(
             flash_record.mark_succeeded()
             session.flush()  # type: ignore[union-attr]
 
-        logger.info(
-            "Flash succeeded: %d bytes written to %s, verification=%s",
-            write_result.bytes_written,
-            plan.device_path,
-            write_result.verification_result.value,
-        )
-
-        return FlashResult(
-            success=True,
-            flash_record_id=flash_record.id if flash_record else None,
-            image_path=plan.image_path,
-            device_path=plan.device_path,
-            bytes_written=write_result.bytes_written,
-            source_hash=write_result.source_hash,
-            device_hash=write_result.device_hash,
-            verification_mode=write_result.verification_mode,
-            verification_result=write_result.verification_result,
+        return _write_success(
+            plan, flash_record.id if flash_record else None, write_result
         )
 
     except (WriteError, HashMismatchError) as e:
-        logger.error("Flash failed: %s", e.message)
-
         if flash_record:
             flash_record.mark_failed(error_type=e.error_code, message=e.message)
             session.flush()  # type: ignore[union-attr]
 
-        return FlashResult(
-            success=False,
-            flash_record_id=flash_record.id if flash_record else None,
-            image_path=plan.image_path,
-            device_path=plan.device_path,
-            bytes_written=0,
-            source_hash=plan.image_hash,
-            device_hash=e.actual_hash if isinstance(e, HashMismatchError) else None,
-            verification_mode=verification_mode,
-            verification_result=VerificationResult.MISMATCH
-            if isinstance(e, HashMismatchError)
-            else VerificationResult.SKIPPED,
-            error_message=e.message,
-            error_code=e.error_code,
-        )
+        return _write_failure(plan, flash_record.id if flash_record else None, e)
 
 
 def flash_artifact(
@@ -483,8 +587,10 @@ def flash_artifact(
 
     # Get artifact file path
     artifact_path = _get_artifact_path(artifact, settings)
-    if not artifact_path.exists():
-        raise ArtifactFileNotFoundError(artifact_id, str(artifact_path))
+    try:
+        artifact_size = artifact_path.stat().st_size
+    except FileNotFoundError:
+        raise ArtifactFileNotFoundError(artifact_id, str(artifact_path)) from None
 
     # Flash the image
     return flash_image(
@@ -498,9 +604,246 @@ def flash_artifact(
         force=force,
         artifact_id=artifact.id,
         build_id=artifact.build_id,
+        # The recorded hash stands in for re-hashing the file, unless the
+        # file on disk no longer has the recorded size
+        image_sha256=artifact.sha256 if artifact.size_bytes == artifact_size else None,
     )
 
 
+def flash_many_artifacts(
+    session: Session,
+    artifact_ids: Sequence[int],
+    device_paths: Sequence[str],
+    *,
+    settings: Settings | None = None,
+    wipe_before: bool = False,
+    verification_mode: VerificationMode | None = None,
+) -> list[FlashResult]:
+    """Flash several artifacts, one per device, with one INSERT for the records.
+
+    Every artifact and its file are resolved, and every device validated
+    against one mount table snapshot, before any device is touched. The
+    FlashRecords for all devices that pass validation are inserted in one
+    statement, then the images are written one after another. Each record
+    is marked running just before its device is written and gets its
+    outcome right after, so an interrupted batch leaves the earlier
+    outcomes in the session.
+
+    Args:
+        session: Database session.
+        artifact_ids: Artifact to flash onto each device.
+        device_paths: Target devices, parallel to artifact_ids.
+        settings: Application settings (optional).
+        wipe_before: Whether to wipe each device before writing.
+        verification_mode: How to verify the writes (defaults to settings).
+
+    Returns:
+        FlashResult per device, in the order given. Devices that fail
+        validation get a failed result and no FlashRecord.
+
+    Raises:
+        ValueError: The sequences differ in length or repeat a device.
+        ArtifactNotFoundError: An artifact is not in the database.
+        ArtifactFileNotFoundError: An artifact file is not on disk.
+    """
+    if len(artifact_ids) != len(device_paths):
+        raise ValueError("artifact_ids and device_paths must have the same length")
+    if len(set(device_paths)) != len(device_paths):
+        raise ValueError("Each device may only be flashed once per batch")
+    if not device_paths:
+        return []
+
+    if settings is None:
+        settings = get_settings()
+    if verification_mode is None:
+        verification_mode = VerificationMode(settings.verification_mode)
+    hash_algorithm = HashAlgorithm(settings.hash_algorithm)
+
+    logger.info("Batch flash requested: %d device(s)", len(device_paths))
+
+    artifacts = {
+        a.id: a
+        for a in session.scalars(
+            select(Artifact).where(Artifact.id.in_(set(artifact_ids)))
+        )
+    }
+    sources: list[tuple[Artifact, Path, int]] = []
+    for artifact_id in artifact_ids:
+        artifact = artifacts.get(artifact_id)
+        if artifact is None:
+            raise ArtifactNotFoundError(artifact_id)
+        artifact_path = _get_artifact_path(artifact, settings)
+        try:
+            artifact_size = artifact_path.stat().st_size
+        except FileNotFoundError:
+            raise ArtifactFileNotFoundError(artifact_id, str(artifact_path)) from None
+        sources.append((artifact, artifact_path, artifact_size))
+
+    # One mount table read and root device lookup for the whole batch
+    devices = validate_devices(device_paths, raise_on_error=False)
+
+    results: list[FlashResult | None] = [None] * len(device_paths)
+    planned: list[tuple[int, FlashPlan]] = []
+    for index, (
+        (artifact, artifact_path, artifact_size),
+        device_path,
+        device,
+    ) in enumerate(zip(sources, device_paths, devices, strict=True)):
+        if isinstance(device, DeviceValidationError):
+            results[index] = _validation_failure(
+                artifact_path, device_path, verification_mode, device
+            )
+            continue
+        plan = plan_flash(
+            artifact_path,
+            device_path,
+            wipe_before=wipe_before,
+            verification_mode=verification_mode,
+            artifact_id=artifact.id,
+            build_id=artifact.build_id,
+            image_sha256=artifact.sha256
+            if artifact.size_bytes == artifact_size
+            else None,
+            defer_hash=True,
+            hash_algorithm=hash_algorithm,
+            device_info=device,
+        )
+        planned.append((index, plan))
+
+    # Different spellings of one device (/dev/sdb, /dev/../dev/sdb, a
+    # /dev/disk/by-id link) only meet once the paths are resolved
+    seen_devices: set[str] = set()
+    for _, plan in planned:
+        resolved = os.path.realpath(plan.device_path)
+        if resolved in seen_devices:
+            raise ValueError(
+                f"Device {plan.device_path} appears more than once in the batch"
+            )
+        seen_devices.add(resolved)
+
+    record_ids: dict[str, int] = {}
+    if planned:
+        # One multi-row INSERT, with requested_at left to the server default.
+        # RETURNING rows may come back in any order; device paths are unique
+        # within the batch, so they key the IDs.
+        inserted = session.execute(
+            insert(FlashRecord).returning(FlashRecord.device_path, FlashRecord.id),
+            [
+                {
+                    "artifact_id": plan.artifact_id,
+                    "build_id": plan.build_id,
+                    "device_path": plan.device_path,
+                    "device_model": plan.device_info.model,
+                    "device_serial": plan.device_info.serial,
+                    "status": FlashStatus.PENDING,
+                    "wiped_before_flash": wipe_before,
+                    "verification_mode": verification_mode.value,
+                }
+                for _, plan in planned
+            ],
+        )
+        record_ids = dict(inserted.all())
+
+    for index, plan in planned:
+        record_id = record_ids[plan.device_path]
+        # ORM bulk UPDATE by primary key, before and after each write
+        session.execute(
+            update(FlashRecord),
+            [{"id": record_id, "status": FlashStatus.RUNNING, "started_at": utc_now()}],
+        )
+        try:
+            write_result = write_image_to_device(
+                plan.image_path,
+                plan.device_path,
+                wipe_before=wipe_before,
+                verification_mode=verification_mode,
+                expected_hash=plan.image_hash or None,
+                hash_algorithm=plan.hash_algorithm,
+            )
+        except (WriteError, HashMismatchError) as e:
+            results[index] = _write_failure(plan, record_id, e)
+            outcome = {
+                "status": FlashStatus.FAILED,
+                "verification_result": None,
+                "error_type": e.error_code,
+                "error_message": e.message,
+            }
+        else:
+            results[index] = _write_success(plan, record_id, write_result)
+            outcome = {
+                "status": FlashStatus.SUCCEEDED,
+                "verification_result": write_result.verification_result.value,
+                "error_type": None,
+                "error_message": None,
+            }
+        session.execute(
+            update(FlashRecord),
+            [{"id": record_id, "finished_at": utc_now(), **outcome}],
+        )
+
+    return [result for result in results if result is not None]
+
+
+@lru_cache(maxsize=64)
+def _flash_records_query(
+    columns: tuple[Any, ...],
+    by_artifact: bool,
+    by_build: bool,
+    by_device: bool,
+    by_status: bool,
+) -> Select[Any]:
+    """Build the SELECT shared by get_flash_records() and iter_flash_records().
+
+    Filter values and the limit are bound at execution time, so each
+    combination of columns and filters is built once per process and its
+    cache key is reused on every later call.
+
+    Args:
+        columns: Entities or columns to select.
+        by_artifact: Whether to filter on the ``artifact_id`` parameter.
+        by_build: Whether to filter on the ``build_id`` parameter.
+        by_device: Whether to filter on the ``device_path`` parameter.
+        by_status: Whether to filter on the ``status`` parameter.
+
+    Returns:
+        SELECT statement expecting the filter parameters and ``limit``,
+        newest records first.
+    """
+    stmt = select(*columns)
+
+    if by_artifact:
+        stmt = stmt.where(FlashRecord.artifact_id == bindparam("artifact_id"))
+    if by_build:
+        stmt = stmt.where(FlashRecord.build_id == bindparam("build_id"))
+    if by_device:
+        stmt = stmt.where(FlashRecord.device_path == bindparam("device_path"))
+    if by_status:
+        stmt = stmt.where(FlashRecord.status == bindparam("status"))
+
+    # requested_at comes from the server clock and can tie within a batch;
+    # the id keeps the order, and so what the limit cuts, deterministic
+    return stmt.order_by(FlashRecord.requested_at.desc(), FlashRecord.id.desc()).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+
+def _flash_records_params(
+    artifact_id: int | None,
+    build_id: int | None,
+    device_path: str | None,
+    status: FlashStatus | None,
+    limit: int,
+) -> dict[str, Any]:
+    """Collect the parameters for a _flash_records_query() statement."""
+    return {
+        "artifact_id": artifact_id,
+        "build_id": build_id,
+        "device_path": device_path,
+        "status": status,
+        "limit": limit,
+    }
+
+
 def get_flash_records(
     session: Session,
     *,
@@ -523,23 +866,62 @@ def get_flash_records(
     Returns:
         List of FlashRecord objects.
     """
-    from sqlalchemy import select
+    stmt = _flash_records_query(
+        (FlashRecord,),
+        artifact_id is not None,
+        build_id is not None,
+        device_path is not None,
+        status is not None,
+    )
+    result = session.execute(
+        stmt,
+        _flash_records_params(artifact_id, build_id, device_path, status, limit),
+    )
+    return list(result.scalars().all())
 
-    stmt = select(FlashRecord)
 
-    if artifact_id is not None:
-        stmt = stmt.where(FlashRecord.artifact_id == artifact_id)
-    if build_id is not None:
-        stmt = stmt.where(FlashRecord.build_id == build_id)
-    if device_path is not None:
-        stmt = stmt.where(FlashRecord.device_path == device_path)
-    if status is not None:
-        stmt = stmt.where(FlashRecord.status == status.value)
+def iter_flash_records(
+    session: Session,
+    columns: Sequence[InstrumentedAttribute[Any]],
+    *,
+    artifact_id: int | None = None,
+    build_id: int | None = None,
+    device_path: str | None = None,
+    status: FlashStatus | None = None,
+    limit: int = 100,
+    batch_size: int = 200,
+) -> Iterator[Row[Any]]:
+    """Iterate over selected columns of matching flash records in batches.
 
-    stmt = stmt.order_by(FlashRecord.requested_at.desc()).limit(limit)
+    Unlike get_flash_records(), only the requested columns are loaded and
+    rows are pulled from the cursor batch by batch, so no ORM instances are
+    built and large limits do not hold every record in memory.
 
-    result = session.execute(stmt)
-    return list(result.scalars().all())
+    Args:
+        session: Database session.
+        columns: FlashRecord attributes to select, e.g. ``FlashRecord.id``.
+        artifact_id: Filter by artifact ID.
+        build_id: Filter by build ID.
+        device_path: Filter by device path.
+        status: Filter by status.
+        limit: Maximum number of records to return.
+        batch_size: Number of rows to fetch per batch.
+
+    Yields:
+        Rows whose attributes are named after the selected columns.
+    """
+    stmt = _flash_records_query(
+        tuple(columns),
+        artifact_id is not None,
+        build_id is not None,
+        device_path is not None,
+        status is not None,
+    )
+    yield from session.execute(
+        stmt,
+        _flash_records_params(artifact_id, build_id, device_path, status, limit),
+        execution_options={"yield_per": batch_size},
+    )
 
 
 __all__ = [
@@ -551,7 +933,9 @@ __all__ = [
     "FlashServiceError",
     "flash_artifact",
     "flash_image",
+    "flash_many_artifacts",
     "get_artifact",
     "get_flash_records",
+    "iter_flash_records",
     "plan_flash",
 ]
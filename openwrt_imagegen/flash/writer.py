@@ -12,19 +12,30 @@ All operations follow the safety rules in docs/SAFETY.md:
 """
 
 import hashlib
+import importlib
 import logging
 import os
+import queue
+import threading
 from dataclasses import dataclass
+from io import BufferedIOBase, RawIOBase
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
-from openwrt_imagegen.types import VerificationMode, VerificationResult
+from openwrt_imagegen.types import HashAlgorithm, VerificationMode, VerificationResult
 
 logger = logging.getLogger(__name__)
 
 # Default block size for I/O operations (1 MiB)
 DEFAULT_BLOCK_SIZE = 1024 * 1024
 
+# Block size for the image write pass (4 MiB); matches the allocation
+# unit of most SD cards and keeps the write syscall count low
+WRITE_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Blocks the image reader may fill ahead of the device writer
+WRITE_QUEUE_DEPTH = 4
+
 # Size prefixes for verification modes
 VERIFICATION_SIZE_BYTES = {
     VerificationMode.PREFIX_16M: 16 * 1024 * 1024,
@@ -39,8 +50,8 @@ class WriteResult:
     Attributes:
         success: Whether the write succeeded.
         bytes_written: Number of bytes written.
-        source_hash: SHA-256 hash of the source image (or prefix).
-        device_hash: SHA-256 hash read back from device (or prefix).
+        source_hash: Hash of the source image (or prefix).
+        device_hash: Hash read back from device (or prefix).
         verification_mode: Verification mode used.
         verification_result: Result of hash verification.
         error_message: Error message if write failed.
@@ -111,22 +122,66 @@ class HashMismatchError(WriteError):
         self.mode = mode
 
 
+class HashAlgorithmUnavailableError(WriteError):
+    """The package providing a hash algorithm is not installed."""
+
+    def __init__(self, algorithm: HashAlgorithm) -> None:
+        super().__init__(
+            f"Hash algorithm '{algorithm.value}' requires the '{algorithm.value}' "
+            f"package. Install it with: pip install openwrt-imagegen[{algorithm.value}]",
+            error_code="HASH_ALGORITHM_UNAVAILABLE",
+        )
+        self.algorithm = algorithm
+
+
+def _new_hasher(algorithm: HashAlgorithm) -> Any:
+    """Create an incremental hash object for an algorithm.
+
+    Args:
+        algorithm: Hash algorithm to use.
+
+    Returns:
+        Object with ``update()`` and ``hexdigest()``.
+
+    Raises:
+        HashAlgorithmUnavailableError: The algorithm's package is missing.
+    """
+    if algorithm == HashAlgorithm.BLAKE3:
+        # Optional dependency; imported on demand
+        try:
+            blake3 = importlib.import_module("blake3")
+        except ImportError:
+            raise HashAlgorithmUnavailableError(algorithm) from None
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
+
 def compute_file_hash(
     file_path: str | Path,
     max_bytes: int | None = None,
     block_size: int = DEFAULT_BLOCK_SIZE,
+    algorithm: HashAlgorithm = HashAlgorithm.SHA256,
 ) -> tuple[str, int]:
-    """Compute SHA-256 hash of a file.
+    """Compute the hash of a file (SHA-256 unless another algorithm is given).
 
     Args:
         file_path: Path to the file to hash.
         max_bytes: Maximum number of bytes to hash (for prefix verification).
         block_size: Block size for reading.
+        algorithm: Hash algorithm to use.
 
     Returns:
         Tuple of (hex hash string, bytes hashed).
+
+    Raises:
+        HashAlgorithmUnavailableError: The algorithm's package is missing.
     """
-    hasher = hashlib.sha256()
+    hasher = _new_hasher(algorithm)
+    if algorithm == HashAlgorithm.BLAKE3 and max_bytes is None:
+        # Whole files are memory-mapped and hashed on all cores
+        hasher.update_mmap(str(file_path))
+        return hasher.hexdigest(), os.path.getsize(file_path)
+
     bytes_hashed = 0
 
     with open(file_path, "rb") as f:
@@ -154,18 +209,23 @@ def compute_device_hash(
     device_path: str,
     num_bytes: int,
     block_size: int = DEFAULT_BLOCK_SIZE,
+    algorithm: HashAlgorithm = HashAlgorithm.SHA256,
 ) -> str:
-    """Compute SHA-256 hash of data read from a device.
+    """Compute the hash of data read from a device.
 
     Args:
         device_path: Path to the device to read.
         num_bytes: Number of bytes to read and hash.
         block_size: Block size for reading.
+        algorithm: Hash algorithm to use.
 
     Returns:
         Hex hash string.
+
+    Raises:
+        HashAlgorithmUnavailableError: The algorithm's package is missing.
     """
-    hasher = hashlib.sha256()
+    hasher = _new_hasher(algorithm)
     bytes_read = 0
 
     with open(device_path, "rb") as f:
@@ -178,49 +238,114 @@ def compute_device_hash(
             hasher.update(chunk)
             bytes_read += len(chunk)
 
-    return hasher.hexdigest()
+    digest: str = hasher.hexdigest()
+    return digest
 
 
 def _write_with_progress(
-    source: BinaryIO,
+    source: RawIOBase | BufferedIOBase,
     dest: BinaryIO,
     total_bytes: int,
     block_size: int = DEFAULT_BLOCK_SIZE,
+    queue_depth: int = WRITE_QUEUE_DEPTH,
+    source_hasher: Any = None,
+    hash_bytes: int = 0,
 ) -> int:
     """Write data from source to destination with progress tracking.
 
+    Reading the image and writing the device are overlapped: a reader
+    thread fills a ring of ``queue_depth`` preallocated buffers while
+    this thread writes the previous ones straight to the destination
+    file descriptor. Both sides release the GIL during I/O, so the
+    device always has the next block ready to write.
+
+    If a hasher is given, the reader also feeds it the first
+    ``hash_bytes`` bytes of each block it reads, so the source is hashed
+    in the same pass that writes it.
+
     Args:
         source: Source file object.
         dest: Destination file object.
         total_bytes: Total bytes to write.
         block_size: Block size for I/O.
+        queue_depth: Number of buffers shared by reader and writer.
+        source_hasher: Hash object to update with the data read.
+        hash_bytes: Number of leading source bytes to hash.
 
     Returns:
         Number of bytes written.
+
+    Raises:
+        OSError: Reading the source or writing the destination failed.
     """
+    free_buffers: queue.Queue[bytearray | None] = queue.Queue()
+    for _ in range(max(queue_depth, 1)):
+        free_buffers.put(bytearray(block_size))
+    filled: queue.Queue[tuple[bytearray, int] | BaseException | None] = queue.Queue()
+    stop = threading.Event()
+
+    def read_blocks() -> None:
+        remaining = total_bytes
+        hash_remaining = hash_bytes
+        try:
+            while remaining > 0:
+                buffer = free_buffers.get()
+                if buffer is None or stop.is_set():
+                    return
+                n = source.readinto(memoryview(buffer)[: min(block_size, remaining)])
+                if not n:
+                    break
+                if source_hasher is not None and hash_remaining > 0:
+                    # Hashing here overlaps with the device write of the
+                    # previous block
+                    to_hash = min(n, hash_remaining)
+                    source_hasher.update(memoryview(buffer)[:to_hash])
+                    hash_remaining -= to_hash
+                filled.put((buffer, n))
+                remaining -= n
+        except BaseException as e:
+            filled.put(e)
+            return
+        filled.put(None)
+
+    reader = threading.Thread(target=read_blocks, name="flash-reader", daemon=True)
+    reader.start()
+
+    fd = dest.fileno()
     bytes_written = 0
     last_logged_mb = 0
     log_interval_bytes = 10 * 1024 * 1024  # 10 MiB
 
-    while bytes_written < total_bytes:
-        chunk = source.read(block_size)
-        if not chunk:
-            break
-
-        dest.write(chunk)
-        bytes_written += len(chunk)
-
-        # Log progress every 10 MiB
-        current_mb = bytes_written // log_interval_bytes
-        if current_mb > last_logged_mb:
-            progress = (bytes_written / total_bytes) * 100
-            logger.debug(
-                "Write progress: %d / %d bytes (%.1f%%)",
-                bytes_written,
-                total_bytes,
-                progress,
-            )
-            last_logged_mb = current_mb
+    try:
+        while True:
+            item = filled.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+
+            buffer, n = item
+            view = memoryview(buffer)[:n]
+            while view:
+                view = view[os.write(fd, view) :]
+            free_buffers.put(buffer)
+            bytes_written += n
+
+            # Log progress every 10 MiB
+            current_mb = bytes_written // log_interval_bytes
+            if current_mb > last_logged_mb:
+                progress = (bytes_written / total_bytes) * 100
+                logger.debug(
+                    "Write progress: %d / %d bytes (%.1f%%)",
+                    bytes_written,
+                    total_bytes,
+                    progress,
+                )
+                last_logged_mb = current_mb
+    finally:
+        stop.set()
+        free_buffers.put(None)
+        reader.join()
 
     return bytes_written
 
@@ -282,22 +407,28 @@ def write_image_to_device(
     wipe_before: bool = False,
     verification_mode: VerificationMode = VerificationMode.FULL,
     block_size: int = DEFAULT_BLOCK_SIZE,
+    write_block_size: int = WRITE_BLOCK_SIZE,
     expected_hash: str | None = None,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
 ) -> WriteResult:
     """Write an image file to a block device with verification.
 
     This is the core write function that:
     1. Optionally wipes the device first
-    2. Writes the image with fsync
-    3. Verifies the write by reading back and comparing hashes
+    2. Writes the image with fsync, hashing the source as it is read
+       unless expected_hash is given
+    3. Verifies the write by reading back the device and comparing hashes
 
     Args:
         image_path: Path to the image file.
         device_path: Path to the target device.
         wipe_before: Whether to wipe device before writing.
         verification_mode: How to verify the write.
-        block_size: Block size for I/O operations.
-        expected_hash: Pre-computed hash of the image (optional).
+        block_size: Block size for wipe and verification reads.
+        write_block_size: Block size for writing the image.
+        expected_hash: Pre-computed hash of the image (optional), made with
+            hash_algorithm.
+        hash_algorithm: Hash algorithm used for verification.
 
     Returns:
         WriteResult with operation details.
@@ -307,14 +438,15 @@ def write_image_to_device(
         WritePermissionError: Permission denied.
         WriteIOError: I/O error during write.
         HashMismatchError: Verification failed.
+        HashAlgorithmUnavailableError: The hash algorithm's package is missing.
     """
     image_path = Path(image_path)
 
-    # Validate image exists
-    if not image_path.exists():
-        raise ImageNotFoundError(str(image_path))
-
-    image_size = image_path.stat().st_size
+    # Validate image exists and get its size in one stat
+    try:
+        image_size = image_path.stat().st_size
+    except FileNotFoundError:
+        raise ImageNotFoundError(str(image_path)) from None
     logger.info(
         "Writing image %s (%d bytes) to %s",
         image_path.name,
@@ -332,29 +464,31 @@ def write_image_to_device(
         # Full verification
         verify_bytes = image_size
 
-    # Compute source hash (if not provided)
-    if expected_hash is None and verification_mode != VerificationMode.SKIP:
-        logger.debug(
-            "Computing source hash (mode=%s, bytes=%d)", verification_mode, verify_bytes
-        )
-        source_hash, _ = compute_file_hash(image_path, max_bytes=verify_bytes)
-    elif expected_hash is not None:
-        source_hash = expected_hash
-    else:
-        source_hash = ""
-
-    logger.debug("Source hash: %s", source_hash[:16] if source_hash else "N/A")
-
     # Wipe if requested
     if wipe_before:
         wipe_device(device_path, block_size=block_size)
 
+    # Hash the source in the write pass rather than re-reading it later
+    source_hasher = (
+        _new_hasher(hash_algorithm)
+        if expected_hash is None and verify_bytes > 0
+        else None
+    )
+
     # Write image to device
     bytes_written = 0
     try:
-        with open(image_path, "rb") as src, open(device_path, "r+b") as dst:
+        with (
+            open(image_path, "rb", buffering=0) as src,
+            open(device_path, "r+b", buffering=0) as dst,
+        ):
             bytes_written = _write_with_progress(
-                src, dst, image_size, block_size=block_size
+                src,
+                dst,
+                image_size,
+                block_size=write_block_size,
+                source_hasher=source_hasher,
+                hash_bytes=verify_bytes,
             )
 
             # Flush all buffers and sync to device
@@ -374,6 +508,12 @@ def write_image_to_device(
     os.sync()
 
     # Verify write
+    if expected_hash is not None:
+        source_hash = expected_hash
+    elif source_hasher is not None:
+        source_hash = source_hasher.hexdigest()
+    else:
+        source_hash = ""
     verification_result = VerificationResult.SKIPPED
     device_hash: str | None = None
 
@@ -383,8 +523,9 @@ def write_image_to_device(
         )
 
         device_hash = compute_device_hash(
-            device_path, verify_bytes, block_size=block_size
+            device_path, verify_bytes, block_size=block_size, algorithm=hash_algorithm
         )
+        logger.debug("Source hash: %s", source_hash[:16])
         logger.debug("Device hash: %s", device_hash[:16])
 
         if device_hash == source_hash:
@@ -455,6 +596,8 @@ def verify_device_hash(
 
 __all__ = [
     "DEFAULT_BLOCK_SIZE",
+    "WRITE_BLOCK_SIZE",
+    "HashAlgorithmUnavailableError",
     "HashMismatchError",
     "ImageNotFoundError",
     "WriteError",
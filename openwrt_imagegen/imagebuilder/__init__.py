@@ -5,29 +5,72 @@ This module handles:
 - Downloading/verifying archives and extracting to cache
 - Managing Image Builder metadata and cache state
 - Locking for concurrent download prevention
+
+Exports are resolved lazily so that importing a lightweight submodule
+(e.g. ``imagebuilder.cache``) does not pull in SQLAlchemy or httpx.
 """
 
-from openwrt_imagegen.imagebuilder.fetch import (
-    DownloadError,
-    DownloadResult,
-    ExtractionError,
-    ImageBuilderURLs,
-    VerificationError,
-    build_imagebuilder_url,
-    download_imagebuilder,
-)
-from openwrt_imagegen.imagebuilder.models import ImageBuilder
-from openwrt_imagegen.imagebuilder.service import (
-    ImageBuilderBrokenError,
-    ImageBuilderNotFoundError,
-    OfflineModeError,
-    builder_lock,
-    ensure_builder,
-    get_builder,
-    get_builder_cache_info,
-    list_builders,
-    prune_builders,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openwrt_imagegen.imagebuilder.fetch import (
+        DownloadError,
+        DownloadResult,
+        ExtractionError,
+        ImageBuilderURLs,
+        VerificationError,
+        build_imagebuilder_url,
+        download_imagebuilder,
+    )
+    from openwrt_imagegen.imagebuilder.models import ImageBuilder
+    from openwrt_imagegen.imagebuilder.service import (
+        ImageBuilderBrokenError,
+        ImageBuilderNotFoundError,
+        OfflineModeError,
+        builder_lock,
+        ensure_builder,
+        get_builder,
+        get_builder_cache_info,
+        iter_builders,
+        list_builders,
+        prune_builders,
+    )
+
+# Exported name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    # Models
+    "ImageBuilder": "models",
+    # Fetch module
+    "DownloadError": "fetch",
+    "DownloadResult": "fetch",
+    "ExtractionError": "fetch",
+    "ImageBuilderURLs": "fetch",
+    "VerificationError": "fetch",
+    "build_imagebuilder_url": "fetch",
+    "download_imagebuilder": "fetch",
+    # Service module
+    "ImageBuilderBrokenError": "service",
+    "ImageBuilderNotFoundError": "service",
+    "OfflineModeError": "service",
+    "builder_lock": "service",
+    "ensure_builder": "service",
+    "get_builder": "service",
+    "get_builder_cache_info": "service",
+    "iter_builders": "service",
+    "list_builders": "service",
+    "prune_builders": "service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Models
@@ -48,6 +91,7 @@ __all__ = [
     "ensure_builder",
     "get_builder",
     "get_builder_cache_info",
+    "iter_builders",
     "list_builders",
     "prune_builders",
 ]
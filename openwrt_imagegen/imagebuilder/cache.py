@@ -0,0 +1,73 @@
+"""Filesystem inspection of the Image Builder cache.
+
+This module only looks at the cache directory on disk. It deliberately
+avoids the ORM and HTTP client so that commands such as
+``imagegen builders info`` do not pay for importing them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from openwrt_imagegen.config import get_settings
+
+if TYPE_CHECKING:
+    from openwrt_imagegen.config import Settings
+
+
+def get_cache_size(cache_dir: Path) -> int:
+    """Calculate total size of Image Builder cache.
+
+    Args:
+        cache_dir: Root cache directory.
+
+    Returns:
+        Total size in bytes.
+    """
+    total = 0
+    if cache_dir.exists():
+        for path in cache_dir.rglob("*"):
+            if path.is_file():
+                total += path.stat().st_size
+    return total
+
+
+def get_builder_cache_info(
+    settings: Settings | None = None,
+) -> dict[str, object]:
+    """Get information about the Image Builder cache.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Dictionary with cache information.
+    """
+    if settings is None:
+        settings = get_settings()
+
+    cache_dir = settings.cache_dir
+    total_size = get_cache_size(cache_dir)
+
+    return {
+        "cache_dir": str(cache_dir),
+        "total_size_bytes": total_size,
+        "total_size_human": _format_size(total_size),
+        "exists": cache_dir.exists(),
+    }
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format bytes as human-readable size."""
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes //= 1024
+    return f"{size_bytes:.1f} PB"
+
+
+__all__ = [
+    "get_builder_cache_info",
+    "get_cache_size",
+]
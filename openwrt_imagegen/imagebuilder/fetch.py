@@ -19,6 +19,8 @@ from pathlib import Path
 
 import httpx
 
+from openwrt_imagegen.imagebuilder.cache import get_cache_size
+
 logger = logging.getLogger(__name__)
 
 # Official OpenWrt download server base URL
@@ -576,23 +578,6 @@ def prune_builder(
         raise
 
 
-def get_cache_size(cache_dir: Path) -> int:
-    """Calculate total size of Image Builder cache.
-
-    Args:
-        cache_dir: Root cache directory.
-
-    Returns:
-        Total size in bytes.
-    """
-    total = 0
-    if cache_dir.exists():
-        for path in cache_dir.rglob("*"):
-            if path.is_file():
-                total += path.stat().st_size
-    return total
-
-
 __all__ = [
     "DownloadError",
     "DownloadResult",
@@ -3,6 +3,7 @@
 This module provides high-level APIs for Image Builder management:
 - ensure_builder(): Ensure an Image Builder is available
 - list_builders(): List cached Image Builders
+- iter_builders(): Iterate over selected Image Builder columns
 - get_builder(): Get a specific Image Builder
 - prune_builders(): Remove unused/deprecated Image Builders
 
@@ -14,23 +15,23 @@ from __future__ import annotations
 import fcntl
 import logging
 import os
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from openwrt_imagegen.config import get_settings
+from openwrt_imagegen.db import utc_now
+from openwrt_imagegen.imagebuilder.cache import get_builder_cache_info
 from openwrt_imagegen.imagebuilder.fetch import (
     DownloadError,
     ExtractionError,
     VerificationError,
     download_imagebuilder,
-    get_cache_size,
     prune_builder,
 )
 from openwrt_imagegen.imagebuilder.models import ImageBuilder
@@ -229,26 +230,26 @@ def get_builder(
     return builder
 
 
-def list_builders(
-    session: Session,
+def _builders_query(
+    *columns: Any,
     release: str | None = None,
     target: str | None = None,
     subtarget: str | None = None,
     state: ImageBuilderState | None = None,
-) -> list[ImageBuilder]:
-    """List Image Builders in the database.
+) -> Select[Any]:
+    """Build the SELECT shared by list_builders() and iter_builders().
 
     Args:
-        session: Database session.
+        *columns: Entities or columns to select.
         release: Filter by release (optional).
         target: Filter by target (optional).
         subtarget: Filter by subtarget (optional).
         state: Filter by state (optional).
 
     Returns:
-        List of ImageBuilder instances matching the filters.
+        Filtered statement ordered by release, target and subtarget.
     """
-    stmt = select(ImageBuilder)
+    stmt = select(*columns)
 
     if release is not None:
         stmt = stmt.where(ImageBuilder.openwrt_release == release)
@@ -259,15 +260,76 @@ def list_builders(
     if state is not None:
         stmt = stmt.where(ImageBuilder.state == state.value)
 
-    stmt = stmt.order_by(
+    return stmt.order_by(
         ImageBuilder.openwrt_release,
         ImageBuilder.target,
         ImageBuilder.subtarget,
     )
 
+
+def list_builders(
+    session: Session,
+    release: str | None = None,
+    target: str | None = None,
+    subtarget: str | None = None,
+    state: ImageBuilderState | None = None,
+) -> list[ImageBuilder]:
+    """List Image Builders in the database.
+
+    Args:
+        session: Database session.
+        release: Filter by release (optional).
+        target: Filter by target (optional).
+        subtarget: Filter by subtarget (optional).
+        state: Filter by state (optional).
+
+    Returns:
+        List of ImageBuilder instances matching the filters.
+    """
+    stmt = _builders_query(
+        ImageBuilder,
+        release=release,
+        target=target,
+        subtarget=subtarget,
+        state=state,
+    )
     return list(session.execute(stmt).scalars().all())
 
 
+def iter_builders(
+    session: Session,
+    columns: Sequence[InstrumentedAttribute[Any]],
+    release: str | None = None,
+    target: str | None = None,
+    subtarget: str | None = None,
+    state: ImageBuilderState | None = None,
+) -> Iterator[Row[Any]]:
+    """Iterate over selected columns of matching Image Builders.
+
+    Unlike list_builders(), only the requested columns are loaded, so no
+    ORM instances are built.
+
+    Args:
+        session: Database session.
+        columns: ImageBuilder attributes to select, e.g. ``ImageBuilder.state``.
+        release: Filter by release (optional).
+        target: Filter by target (optional).
+        subtarget: Filter by subtarget (optional).
+        state: Filter by state (optional).
+
+    Yields:
+        Rows whose attributes are named after the selected columns.
+    """
+    stmt = _builders_query(
+        *columns,
+        release=release,
+        target=target,
+        subtarget=subtarget,
+        state=state,
+    )
+    yield from session.execute(stmt)
+
+
 def ensure_builder(
     session: Session,
     release: str,
@@ -321,7 +383,7 @@ def ensure_builder(
                     subtarget,
                 )
                 # Update last_used_at
-                builder.last_used_at = datetime.now(timezone.utc)
+                builder.last_used_at = utc_now()
                 return builder
             else:
                 # Directory was deleted externally
@@ -368,7 +430,7 @@ def ensure_builder(
                 target,
                 subtarget,
             )
-            builder.last_used_at = datetime.now(timezone.utc)
+            builder.last_used_at = utc_now()
             return builder
 
         # Create or get builder record
@@ -408,7 +470,7 @@ def ensure_builder(
             builder.root_dir = str(root_dir)
             builder.checksum = checksum
             builder.mark_ready()
-            now = datetime.now(timezone.utc)
+            now = utc_now()
             if builder.first_used_at is None:
                 builder.first_used_at = now
             builder.last_used_at = now
@@ -477,31 +539,37 @@ def prune_builders(
 
     pruned: list[tuple[str, str, str]] = []
 
-    # Build query for builders to prune
-    stmt = select(ImageBuilder)
-
+    # Build the criteria selecting builders to prune
+    criteria = []
     if deprecated_only:
-        stmt = stmt.where(ImageBuilder.state == ImageBuilderState.DEPRECATED.value)
+        criteria.append(ImageBuilder.state == ImageBuilderState.DEPRECATED.value)
     elif unused_days is not None:
         from datetime import timedelta
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=unused_days)
-        stmt = stmt.where(
+        cutoff = utc_now() - timedelta(days=unused_days)
+        criteria.append(
             (ImageBuilder.last_used_at < cutoff) | (ImageBuilder.last_used_at.is_(None))
         )
 
-    builders = list(session.execute(stmt).scalars().all())
-
-    for builder in builders:
-        key = (builder.openwrt_release, builder.target, builder.subtarget)
-
-        if dry_run:
+    if dry_run:
+        # Only the keys are reported; don't load entities into the session
+        key_stmt = select(
+            ImageBuilder.openwrt_release, ImageBuilder.target, ImageBuilder.subtarget
+        ).where(*criteria)
+        for release, target, subtarget in session.execute(key_stmt):
             logger.info(
                 "[DRY RUN] Would prune Image Builder: %s/%s/%s",
-                *key,
+                release,
+                target,
+                subtarget,
             )
-            pruned.append(key)
-            continue
+            pruned.append((release, target, subtarget))
+        return pruned
+
+    builders = list(session.execute(select(ImageBuilder).where(*criteria)).scalars())
+
+    for builder in builders:
+        key = (builder.openwrt_release, builder.target, builder.subtarget)
 
         # Remove from filesystem
         builder_dir = (
@@ -522,46 +590,12 @@ def prune_builders(
         pruned.append(key)
         logger.info("Pruned Image Builder: %s/%s/%s", *key)
 
-    if not dry_run:
-        session.flush()
+    # Issue all deletes in a single flush
+    session.flush()
 
     return pruned
 
 
-def get_builder_cache_info(
-    settings: Settings | None = None,
-) -> dict[str, object]:
-    """Get information about the Image Builder cache.
-
-    Args:
-        settings: Application settings.
-
-    Returns:
-        Dictionary with cache information.
-    """
-    if settings is None:
-        settings = get_settings()
-
-    cache_dir = settings.cache_dir
-    total_size = get_cache_size(cache_dir)
-
-    return {
-        "cache_dir": str(cache_dir),
-        "total_size_bytes": total_size,
-        "total_size_human": _format_size(total_size),
-        "exists": cache_dir.exists(),
-    }
-
-
-def _format_size(size_bytes: int) -> str:
-    """Format bytes as human-readable size."""
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes //= 1024
-    return f"{size_bytes:.1f} PB"
-
-
 __all__ = [
     "ImageBuilderBrokenError",
     "ImageBuilderNotFoundError",
@@ -570,6 +604,7 @@ __all__ = [
     "ensure_builder",
     "get_builder",
     "get_builder_cache_info",
+    "iter_builders",
     "list_builders",
     "prune_builders",
 ]
@@ -0,0 +1,85 @@
+"""Logging setup for openwrt_imagegen.
+
+Records emitted under the ``openwrt_imagegen`` logger are handed to a
+``QueueHandler`` and written out by a ``QueueListener`` running in a
+background thread. Callers on the build and flash paths therefore only pay
+for an enqueue; formatting and stream I/O happen off the calling thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+PACKAGE_LOGGER = "openwrt_imagegen"
+DEFAULT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def configure_logging(
+    level: str = "INFO",
+    handler: logging.Handler | None = None,
+) -> None:
+    """Route package log records through a background queue listener.
+
+    Safe to call more than once; later calls only update the level. When
+    no handler is given and the application has already configured
+    logging (the root or package logger has handlers), only the level is
+    set and records keep propagating to those handlers.
+
+    Args:
+        level: Log level name for the package logger.
+        handler: Handler that performs the actual output. Defaults to a
+            stream handler on the current ``sys.stderr``.
+    """
+    global _listener, _queue_handler
+
+    pkg_logger = logging.getLogger(PACKAGE_LOGGER)
+    pkg_logger.setLevel(level)
+    if _listener is not None:
+        return
+    if handler is None:
+        if logging.getLogger().handlers or pkg_logger.handlers:
+            return
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    pkg_logger.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    # Long-lived processes (the daemon) configure once per request
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and detach the queue handler.
+
+    Stops the listener thread after it has drained the queue and flushes
+    its handlers, so every record logged so far has been written when
+    this returns.
+    """
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    pkg_logger = logging.getLogger(PACKAGE_LOGGER)
+    if _queue_handler is not None:
+        pkg_logger.removeHandler(_queue_handler)
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+    _listener = None
+    _queue_handler = None
+
+
+__all__ = ["configure_logging", "shutdown_logging"]
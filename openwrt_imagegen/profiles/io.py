@@ -167,9 +167,8 @@ def export_profile_to_json(profile: ProfileSchema, path: Path) -> None:
         profile: ProfileSchema instance to export.
         path: Path where JSON file should be written.
     """
-    data = profile.model_dump(exclude_none=True, exclude_unset=True)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write(profile_to_json_string(profile))
         f.write("\n")
 
 
@@ -222,8 +221,8 @@ def profile_to_json_string(profile: ProfileSchema) -> str:
     Returns:
         JSON string representation.
     """
-    data = profile.model_dump(exclude_none=True, exclude_unset=True)
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    # pydantic-core writes the JSON directly, without an intermediate dict
+    return profile.model_dump_json(indent=2, exclude_none=True, exclude_unset=True)
 
 
 def load_profiles_from_directory(
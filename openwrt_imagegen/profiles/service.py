@@ -7,16 +7,22 @@ database persistence.
 See docs/ARCHITECTURE.md and docs/PROFILES.md for design context.
 """
 
+import os
 import re
-from collections.abc import Sequence
-from datetime import datetime, timezone
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic import ValidationError
-from sqlalchemy import select
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import exists, select
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
+from openwrt_imagegen.db import utc_now
 from openwrt_imagegen.profiles.io import (
     export_profile_to_json,
     export_profile_to_yaml,
@@ -35,8 +41,13 @@ from openwrt_imagegen.profiles.schema import (
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy import Select
     from sqlalchemy.engine.result import ScalarResult
 
+# Built once: validates/dumps a whole files list in a single pydantic-core
+# call instead of one model call per entry.
+_FILE_SPECS = TypeAdapter(list[FileSpecSchema])
+
 
 class ProfileNotFoundError(Exception):
     """Raised when a profile is not found."""
@@ -67,7 +78,7 @@ def profile_to_schema(profile: Profile, include_meta: bool = False) -> ProfileSc
     # Convert files from JSON to FileSpecSchema list
     files: list[FileSpecSchema] | None = None
     if profile.files:
-        files = [FileSpecSchema.model_validate(f) for f in profile.files]
+        files = _FILE_SPECS.validate_python(profile.files)
 
     # Convert policies
     policies: ProfilePoliciesSchema | None = None
@@ -127,7 +138,7 @@ def schema_to_profile(schema: ProfileSchema) -> Profile:
     # Convert files to dict format for JSON storage
     files: list[dict[str, str]] | None = None
     if schema.files:
-        files = [f.model_dump(exclude_none=True) for f in schema.files]
+        files = _FILE_SPECS.dump_python(schema.files, exclude_none=True)
 
     # Convert policies to dict for JSON storage
     policies: dict[str, Any] | None = None
@@ -175,7 +186,7 @@ def update_profile_from_schema(profile: Profile, schema: ProfileSchema) -> None:
     # Convert files
     files: list[dict[str, str]] | None = None
     if schema.files:
-        files = [f.model_dump(exclude_none=True) for f in schema.files]
+        files = _FILE_SPECS.dump_python(schema.files, exclude_none=True)
 
     # Convert policies
     policies: dict[str, Any] | None = None
@@ -209,7 +220,7 @@ def update_profile_from_schema(profile: Profile, schema: ProfileSchema) -> None:
     profile.add_local_key = schema.add_local_key
     profile.notes = schema.notes
     # created_by is not updated on existing profiles
-    profile.updated_at = datetime.now(timezone.utc)
+    profile.updated_at = utc_now()
 
 
 # CRUD Operations
@@ -357,19 +368,49 @@ def list_profiles(session: Session) -> Sequence[Profile]:
     return result.all()
 
 
-def query_profiles(
-    session: Session,
+class _json_array_elements(FunctionElement[Any]):  # noqa: N801
+    """Table-valued function yielding the elements of a JSON array as text.
+
+    Rendered as ``json_each`` (SQLite JSON1) by default and as
+    ``json_array_elements_text`` on PostgreSQL; both expose the element
+    in a ``value`` column. An untagged profile stores the JSON scalar
+    ``null``, which PostgreSQL refuses to expand, so there anything but
+    an array is read as an empty one.
+    """
+
+    name = "json_array_elements"
+    inherit_cache = True
+
+
+@compiles(_json_array_elements)
+def _compile_json_each(
+    element: _json_array_elements, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"json_each({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(_json_array_elements, "postgresql")
+def _compile_json_array_elements_text(
+    element: _json_array_elements, compiler: SQLCompiler, **kw: Any
+) -> str:
+    array = compiler.process(element.clauses, **kw)
+    return (
+        "json_array_elements_text(CASE WHEN json_typeof("
+        f"{array}) = 'array' THEN {array} ELSE '[]'::json END)"
+    )
+
+
+def _profiles_query(
     *,
     device_id: str | None = None,
     openwrt_release: str | None = None,
     target: str | None = None,
     subtarget: str | None = None,
     tags: list[str] | None = None,
-) -> Sequence[Profile]:
-    """Query profiles with filters.
+) -> "Select[Any]":
+    """Build the filtered, ordered profile SELECT statement.
 
     Args:
-        session: SQLAlchemy session.
         device_id: Filter by device_id.
         openwrt_release: Filter by OpenWrt release.
         target: Filter by target.
@@ -377,7 +418,7 @@ def query_profiles(
         tags: Filter by tags (profile must have all specified tags).
 
     Returns:
-        Sequence of matching Profile ORM instances.
+        SELECT statement for matching profiles.
     """
     stmt = select(Profile)
 
@@ -393,19 +434,87 @@ def query_profiles(
     if subtarget is not None:
         stmt = stmt.where(Profile.subtarget == subtarget)
 
-    # Tag filtering - profile must have all specified tags
-    # Note: JSON array containment varies by database
-    # This simple approach works for SQLite with JSON1 extension
-    if tags:
-        for tag in tags:
-            # Use JSON_EACH for SQLite compatibility
-            stmt = stmt.where(Profile.tags.contains([tag]))
+    # Tag filtering - profile must have all specified tags. Each tag is an
+    # EXISTS over the JSON array elements, so the match is exact rather
+    # than a substring LIKE on the serialized array.
+    for tag in tags or ():
+        elements = _json_array_elements(Profile.tags).table_valued("value")
+        stmt = stmt.where(exists().where(elements.c.value == tag))
+
+    return stmt.order_by(Profile.profile_id)
+
+
+def query_profiles(
+    session: Session,
+    *,
+    device_id: str | None = None,
+    openwrt_release: str | None = None,
+    target: str | None = None,
+    subtarget: str | None = None,
+    tags: list[str] | None = None,
+) -> Sequence[Profile]:
+    """Query profiles with filters.
+
+    Args:
+        session: SQLAlchemy session.
+        device_id: Filter by device_id.
+        openwrt_release: Filter by OpenWrt release.
+        target: Filter by target.
+        subtarget: Filter by subtarget.
+        tags: Filter by tags (profile must have all specified tags).
 
-    stmt = stmt.order_by(Profile.profile_id)
+    Returns:
+        Sequence of matching Profile ORM instances.
+    """
+    stmt = _profiles_query(
+        device_id=device_id,
+        openwrt_release=openwrt_release,
+        target=target,
+        subtarget=subtarget,
+        tags=tags,
+    )
     result: ScalarResult[Profile] = session.execute(stmt).scalars()
     return result.all()
 
 
+def iter_profiles(
+    session: Session,
+    *,
+    device_id: str | None = None,
+    openwrt_release: str | None = None,
+    target: str | None = None,
+    subtarget: str | None = None,
+    tags: list[str] | None = None,
+    batch_size: int = 500,
+) -> Iterator[Profile]:
+    """Iterate over profiles matching the filters, fetching in batches.
+
+    Unlike query_profiles(), rows are pulled from the cursor batch by batch
+    so callers can start consuming results before the query is exhausted.
+    With no filters this yields every profile in list_profiles() order.
+
+    Args:
+        session: SQLAlchemy session.
+        device_id: Filter by device_id.
+        openwrt_release: Filter by OpenWrt release.
+        target: Filter by target.
+        subtarget: Filter by subtarget.
+        tags: Filter by tags (profile must have all specified tags).
+        batch_size: Number of rows to fetch per batch.
+
+    Yields:
+        Matching Profile ORM instances.
+    """
+    stmt = _profiles_query(
+        device_id=device_id,
+        openwrt_release=openwrt_release,
+        target=target,
+        subtarget=subtarget,
+        tags=tags,
+    )
+    yield from session.scalars(stmt, execution_options={"yield_per": batch_size})
+
+
 # Import/Export Operations
 
 
@@ -427,51 +536,97 @@ def import_profile_from_file(
     """
     try:
         schema = load_profile(path)
+        return _import_schema(session, schema, update_existing=update_existing)
+    except Exception as e:
+        return _import_error_result(path, e)
 
-        existing = get_profile_or_none(session, schema.profile_id)
-        if existing is not None:
-            if not update_existing:
-                return ProfileImportResult(
-                    profile_id=schema.profile_id,
-                    success=False,
-                    error=f"Profile already exists: {schema.profile_id}",
-                    created=False,
-                )
-            update_profile_from_schema(existing, schema)
-            session.flush()
+
+def _load_profile_or_error(path: Path) -> ProfileSchema | Exception:
+    """Load a profile file, returning the exception instead of raising it."""
+    try:
+        return load_profile(path)
+    except Exception as e:
+        return e
+
+
+def _import_schema(
+    session: Session,
+    schema: ProfileSchema,
+    *,
+    update_existing: bool,
+) -> ProfileImportResult:
+    """Create or update a profile from an already loaded schema."""
+    existing = get_profile_or_none(session, schema.profile_id)
+    if existing is not None:
+        if not update_existing:
             return ProfileImportResult(
                 profile_id=schema.profile_id,
-                success=True,
+                success=False,
+                error=f"Profile already exists: {schema.profile_id}",
                 created=False,
             )
-        else:
-            profile = schema_to_profile(schema)
-            session.add(profile)
-            session.flush()
-            return ProfileImportResult(
-                profile_id=schema.profile_id,
-                success=True,
-                created=True,
-            )
-
-    except ValidationError as e:
+        update_profile_from_schema(existing, schema)
+        session.flush()
         return ProfileImportResult(
-            profile_id=path.stem,
-            success=False,
-            error=f"Validation error: {e}",
+            profile_id=schema.profile_id,
+            success=True,
+            created=False,
         )
-    except ValueError as e:
-        return ProfileImportResult(
-            profile_id=path.stem,
-            success=False,
-            error=str(e),
+
+    profile = schema_to_profile(schema)
+    session.add(profile)
+    session.flush()
+    return ProfileImportResult(
+        profile_id=schema.profile_id,
+        success=True,
+        created=True,
+    )
+
+
+def _matching_files(directory: Path, pattern: str) -> list[Path]:
+    """List the files in directory matching pattern, sorted by path.
+
+    A plain file name pattern is matched against a single ``os.scandir``
+    pass, which reuses each entry's cached type instead of a ``stat()``
+    per file and only builds ``Path`` objects for matches. Patterns with
+    a directory part (e.g. ``**/*.yaml``) still go through ``Path.glob``.
+    """
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        return sorted(p for p in directory.glob(pattern) if p.is_file())
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if fnmatchcase(entry.name, pattern) and entry.is_file()
         )
-    except Exception as e:
-        return ProfileImportResult(
-            profile_id=path.stem,
-            success=False,
-            error=f"Import error: {e}",
+
+
+def _existing_profiles(
+    session: Session, profile_ids: Sequence[str], chunk_size: int = 500
+) -> dict[str, Profile]:
+    """Fetch the stored profiles among profile_ids, keyed by profile_id.
+
+    Queries in chunks so large imports stay below the database's bound
+    parameter limit.
+    """
+    found: dict[str, Profile] = {}
+    for start in range(0, len(profile_ids), chunk_size):
+        stmt = select(Profile).where(
+            Profile.profile_id.in_(profile_ids[start : start + chunk_size])
         )
+        found.update((p.profile_id, p) for p in session.execute(stmt).scalars())
+    return found
+
+
+def _import_error_result(path: Path, error: Exception) -> ProfileImportResult:
+    """Describe a failed import of the profile file at path."""
+    if isinstance(error, ValidationError):
+        message = f"Validation error: {error}"
+    elif isinstance(error, ValueError):
+        message = str(error)
+    else:
+        message = f"Import error: {error}"
+    return ProfileImportResult(profile_id=path.stem, success=False, error=message)
 
 
 def import_profiles_from_directory(
@@ -480,14 +635,22 @@ def import_profiles_from_directory(
     *,
     pattern: str = "*.yaml",
     update_existing: bool = False,
+    workers: int | None = None,
 ) -> ProfileBulkImportResult:
     """Import profiles from all matching files in a directory.
 
+    Files are read and validated on a thread pool. Database writes then
+    happen on the calling thread, in file name order, as one batch: stored
+    profiles are looked up with a single query per 500 files and all
+    inserts and updates are flushed together.
+
     Args:
         session: SQLAlchemy session.
         directory: Directory to scan for profile files.
         pattern: Glob pattern for files (default: *.yaml).
         update_existing: If True, update existing profiles; if False, skip.
+        workers: Maximum number of loader threads. Defaults to the
+            ThreadPoolExecutor default; 1 loads files serially.
 
     Returns:
         ProfileBulkImportResult with per-file results.
@@ -498,14 +661,47 @@ def import_profiles_from_directory(
     if not directory.is_dir():
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    results: list[ProfileImportResult] = []
-    files = sorted(directory.glob(pattern))
+    files = _matching_files(directory, pattern)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() yields in submission order, so writes stay deterministic
+        loaded = list(executor.map(_load_profile_or_error, files))
 
-    for file_path in files:
-        result = import_profile_from_file(
-            session, file_path, update_existing=update_existing
+    existing = _existing_profiles(
+        session,
+        [s.profile_id for s in loaded if not isinstance(s, Exception)],
+    )
+    results: list[ProfileImportResult] = []
+    for file_path, schema in zip(files, loaded, strict=True):
+        if isinstance(schema, Exception):
+            results.append(_import_error_result(file_path, schema))
+            continue
+        # Profiles created earlier in this batch count as existing too
+        profile = existing.get(schema.profile_id)
+        if profile is None:
+            profile = schema_to_profile(schema)
+            session.add(profile)
+            existing[schema.profile_id] = profile
+            created = True
+        elif update_existing:
+            update_profile_from_schema(profile, schema)
+            created = False
+        else:
+            results.append(
+                ProfileImportResult(
+                    profile_id=schema.profile_id,
+                    success=False,
+                    error=f"Profile already exists: {schema.profile_id}",
+                    created=False,
+                )
+            )
+            continue
+        results.append(
+            ProfileImportResult(
+                profile_id=schema.profile_id, success=True, created=created
+            )
         )
-        results.append(result)
+    session.flush()
 
     succeeded = sum(1 for r in results if r.success)
     failed = len(results) - succeeded
@@ -655,6 +851,7 @@ __all__ = [
     "get_profile_or_none",
     "import_profile_from_file",
     "import_profiles_from_directory",
+    "iter_profiles",
     "list_profiles",
     "profile_to_schema",
     "query_profiles",
@@ -45,6 +45,13 @@ class VerificationMode(str, Enum):
     SKIP = "skipped"
 
 
+class HashAlgorithm(str, Enum):
+    """Digest used to compare a flashed image with the device read-back."""
+
+    SHA256 = "sha256"
+    BLAKE3 = "blake3"
+
+
 class VerificationResult(str, Enum):
     """Result of flash verification."""
 
@@ -117,6 +124,7 @@ __all__ = [
     "BuildStatus",
     "FileSpec",
     "FlashStatus",
+    "HashAlgorithm",
     "ImageBuilderState",
     "OperationResult",
     "ProfilePolicies",
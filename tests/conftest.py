@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from openwrt_imagegen.config import reload_settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings() -> Iterator[None]:
+    """Re-read settings from the environment around every test."""
+    reload_settings()
+    yield
+    reload_settings()
@@ -503,6 +503,24 @@ class TestComputeTreeHash:
 
         assert hash1 != hash2
 
+    def test_large_file_hash_matches_in_memory_hash(self, tmp_path):
+        """Should hash mmap'd large files identically to small-file reads."""
+        import hashlib
+
+        from openwrt_imagegen.builds.overlay import MMAP_HASH_THRESHOLD
+
+        root = tmp_path / "root"
+        root.mkdir()
+        content = b"x" * (MMAP_HASH_THRESHOLD + 1)
+        big = root / "big.bin"
+        big.write_bytes(content)
+        big.chmod(0o644)
+
+        expected = hashlib.sha256(
+            b"big.bin" + b"\0" + b"644" + b"\0" + content + b"\0"
+        ).hexdigest()
+        assert compute_tree_hash(root) == expected
+
 
 class TestStageAndHashOverlay:
     """Tests for stage_and_hash_overlay convenience function."""
@@ -138,6 +138,19 @@ class TestBuildLock:
             assert (lock_dir / "build_sha256_key1.lock").exists()
             assert (lock_dir / "build_sha256_key2.lock").exists()
 
+    def test_recreates_removed_lock_directory(self, tmp_path):
+        """Should recover when the lock directory is removed between uses."""
+        import shutil
+
+        lock_dir = tmp_path / "locks"
+
+        with build_lock(lock_dir, "sha256:testkey"):
+            pass
+        shutil.rmtree(lock_dir)
+
+        with build_lock(lock_dir, "sha256:testkey"):
+            assert (lock_dir / "build_sha256_testkey.lock").exists()
+
 
 class TestGetBuild:
     """Tests for get_build function."""
@@ -257,6 +270,24 @@ class TestListBuilds:
         result = list_builds(session, limit=5)
         assert len(result) == 5
 
+    def test_applies_loader_options(self, session_factory, build_record):
+        """Should eager-load relationships passed as loader options."""
+        from sqlalchemy.orm import raiseload, selectinload
+
+        with session_factory() as fresh_session:
+            result = list_builds(
+                fresh_session,
+                loader_options=(
+                    selectinload(BuildRecord.profile),
+                    selectinload(BuildRecord.artifacts),
+                    raiseload("*"),
+                ),
+            )
+
+            assert len(result) == 1
+            assert result[0].profile.profile_id == "test.service"
+            assert result[0].artifacts == []
+
 
 class TestGetBuildArtifacts:
     """Tests for get_build_artifacts function."""
@@ -290,6 +321,28 @@ class TestGetBuildArtifacts:
         with pytest.raises(BuildNotFoundError):
             get_build_artifacts(session, 99999)
 
+    def test_loads_artifacts_in_single_roundtrip(
+        self, engine, session_factory, build_record
+    ):
+        """Should fetch the build and its artifacts without a lazy load."""
+        from sqlalchemy import event
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            with session_factory() as fresh_session:
+                result = get_build_artifacts(fresh_session, build_record.id)
+                assert result == []
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 2
+
     def test_empty_artifacts(self, session, build_record):
         """Should return empty list for build without artifacts."""
         result = get_build_artifacts(session, build_record.id)
@@ -354,6 +407,48 @@ class TestBuildOrReuseMocked:
                 assert is_cache_hit is True
                 assert result.id == existing_build.id
 
+    def test_cache_hit_skips_build_lock(
+        self, session, profile, imagebuilder, mock_settings
+    ):
+        """Should not take the file lock when a cached build already exists."""
+        from openwrt_imagegen.builds.service import build_or_reuse
+        from openwrt_imagegen.profiles.service import profile_to_schema
+
+        existing_build = BuildRecord(
+            profile_id=profile.id,
+            imagebuilder_id=imagebuilder.id,
+            cache_key="sha256:testkey",
+            status=BuildStatus.SUCCEEDED.value,
+        )
+        session.add(existing_build)
+        session.commit()
+
+        profile_schema = profile_to_schema(profile)
+
+        with (
+            patch(
+                "openwrt_imagegen.builds.service.compute_cache_key_from_profile"
+            ) as mock_cache_key,
+            patch(
+                "openwrt_imagegen.builds.service.has_overlay_content",
+                return_value=False,
+            ),
+            patch("openwrt_imagegen.builds.service.build_lock") as mock_lock,
+        ):
+            mock_cache_key.return_value = ("sha256:testkey", MagicMock())
+
+            result, is_cache_hit = build_or_reuse(
+                session=session,
+                profile=profile,
+                profile_schema=profile_schema,
+                imagebuilder=imagebuilder,
+                settings=mock_settings,
+            )
+
+        assert is_cache_hit is True
+        assert result.id == existing_build.id
+        mock_lock.assert_not_called()
+
     def test_force_rebuild_ignores_cache(
         self, session, profile, imagebuilder, mock_settings, tmp_path
     ):
@@ -6,7 +6,9 @@ network access, database, or external tools.
 
 import subprocess
 import sys
+from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from openwrt_imagegen import __version__
@@ -76,6 +78,22 @@ class TestCLIConfig:
         assert "Build timeout" in result.stdout
         assert "Flash timeout" in result.stdout
 
+    def test_config_renders_in_one_print(self, monkeypatch) -> None:
+        """The human-readable report should be rendered in a single print."""
+        import openwrt_imagegen.cli as cli_module
+
+        calls: list[tuple[object, ...]] = []
+
+        class RecordingConsole:
+            def print(self, *objects: object, **_kwargs: object) -> None:
+                calls.append(objects)
+
+        monkeypatch.setattr(cli_module, "console", RecordingConsole())
+
+        result = runner.invoke(app, ["config"])
+        assert result.exit_code == 0
+        assert len(calls) == 1
+
     def test_config_json(self) -> None:
         """CLI config --json should output JSON."""
         result = runner.invoke(app, ["config", "--json"])
@@ -109,6 +127,538 @@ class TestCLIConfig:
             assert key in config_data, f"Missing key: {key}"
 
 
+class TestSessionFactoryCache:
+    """Test the CLI database bootstrap cache."""
+
+    def test_reuses_factory_for_same_db_url(self, tmp_path, monkeypatch) -> None:
+        """Should build the engine once per database URL."""
+        from openwrt_imagegen.cli import _session_factory, _settings
+        from openwrt_imagegen.config import reload_settings
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/a.db")
+        _settings.cache_clear()
+        first = _session_factory()
+        assert _session_factory() is first
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/b.db")
+        reload_settings()
+        _settings.cache_clear()
+        assert _session_factory() is not first
+
+    def test_skips_table_creation_when_disabled(self, tmp_path, monkeypatch) -> None:
+        """Should not create tables when auto_create_tables is off."""
+        from sqlalchemy import inspect
+
+        from openwrt_imagegen.cli import _session_factory, _settings
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/c.db")
+        monkeypatch.setenv("OWRT_IMG_AUTO_CREATE_TABLES", "false")
+        _settings.cache_clear()
+        factory = _session_factory()
+
+        assert inspect(factory.kw["bind"]).get_table_names() == []
+
+
+class TestReadonlySessionFactory:
+    """Test the session factory used by read-only commands."""
+
+    def test_bootstraps_fresh_database(self, tmp_path, monkeypatch) -> None:
+        """A database without the schema should still get its tables."""
+        from sqlalchemy import inspect
+
+        from openwrt_imagegen.cli import _readonly_session_factory, _settings
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/fresh.db")
+        _settings.cache_clear()
+        factory = _readonly_session_factory()
+
+        assert "profiles" in inspect(factory.kw["bind"]).get_table_names()
+
+    def test_existing_database_is_read_only(self, tmp_path, monkeypatch) -> None:
+        """An existing database should be opened without DDL or writes."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+
+        from openwrt_imagegen import db
+        from openwrt_imagegen.cli import _readonly_session_factory, _settings
+
+        db_url = f"sqlite:///{tmp_path}/existing.db"
+        db.create_all_tables(db.get_engine(db_url))
+
+        def fail_create_all_tables(*_args: object) -> None:
+            raise AssertionError("create_all_tables should not be called")
+
+        monkeypatch.setattr(db, "create_all_tables", fail_create_all_tables)
+        monkeypatch.setenv("OWRT_IMG_DB_URL", db_url)
+        _settings.cache_clear()
+        factory = _readonly_session_factory()
+
+        with factory() as session:
+            assert session.execute(text("SELECT count(*) FROM profiles")).scalar() == 0
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM profiles"))
+
+    @pytest.mark.parametrize(
+        "args", [["artifacts", "list", "--json"], ["flash", "list"], ["build", "list"]]
+    )
+    def test_uninitialized_schema_is_reported(
+        self, tmp_path, monkeypatch, args: list[str]
+    ) -> None:
+        """Without auto-creation, a missing schema should be a clear error."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/empty.db")
+        monkeypatch.setenv("OWRT_IMG_AUTO_CREATE_TABLES", "false")
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 1
+        assert "schema is not initialized" in result.stdout
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    def test_other_database_errors_propagate(self, tmp_path, monkeypatch) -> None:
+        """Database errors with the schema in place should not be masked."""
+        from sqlalchemy.exc import OperationalError
+
+        from openwrt_imagegen import db
+
+        db_url = f"sqlite:///{tmp_path}/existing.db"
+        db.create_all_tables(db.get_engine(db_url))
+        monkeypatch.setenv("OWRT_IMG_DB_URL", db_url)
+        error = OperationalError("SELECT", {}, Exception("disk I/O error"))
+
+        with patch(
+            "openwrt_imagegen.flash.service.iter_flash_records", side_effect=error
+        ):
+            result = runner.invoke(app, ["flash", "list"])
+
+        assert result.exit_code == 1
+        assert result.exception is error
+
+
+class TestSettingsCache:
+    """Test the per-invocation settings cache."""
+
+    def test_settings_built_once_per_invocation(self, tmp_path, monkeypatch) -> None:
+        """The root callback and the command should share one Settings."""
+        from openwrt_imagegen import config
+
+        calls: list[object] = []
+        real_get_settings = config.get_settings
+
+        def counting_get_settings() -> config.Settings:
+            settings = real_get_settings()
+            calls.append(settings)
+            return settings
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/s.db")
+        monkeypatch.setattr(config, "get_settings", counting_get_settings)
+
+        result = runner.invoke(app, ["config", "--json"])
+        assert result.exit_code == 0
+        assert len(calls) == 1
+
+    def test_new_invocation_rereads_environment(self, tmp_path, monkeypatch) -> None:
+        """Each invocation should see the current environment."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/one.db")
+        first = runner.invoke(app, ["config", "--json"])
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/two.db")
+        second = runner.invoke(app, ["config", "--json"])
+
+        assert "one.db" in first.stdout
+        assert "two.db" in second.stdout
+
+
+class TestLoggingSetup:
+    """Test when the CLI sets up log output."""
+
+    @pytest.mark.parametrize(
+        ("env", "expected"), [({}, None), ({"OWRT_IMG_LOG_LEVEL": "DEBUG"}, "DEBUG")]
+    )
+    def test_configured_only_for_explicit_level(
+        self, tmp_path, monkeypatch, env, expected
+    ) -> None:
+        """Log output should be set up only when a level is asked for."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/s.db")
+        monkeypatch.delenv("OWRT_IMG_LOG_LEVEL", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with patch("openwrt_imagegen.logs.configure_logging") as mock_configure:
+            result = runner.invoke(app, ["config", "--json"])
+
+        assert result.exit_code == 0
+        if expected is None:
+            mock_configure.assert_not_called()
+        else:
+            mock_configure.assert_called_once_with(expected)
+
+
+class TestListSchemas:
+    """Test the pydantic models behind list --json output."""
+
+    def test_build_list_item_from_attributes(self) -> None:
+        """Profile ID and artifact count should be derived from relations."""
+        from datetime import datetime
+        from types import SimpleNamespace
+
+        from openwrt_imagegen.cli._schemas import BuildListItem
+
+        record = SimpleNamespace(
+            id=7,
+            profile=SimpleNamespace(profile_id="home.router"),
+            status="succeeded",
+            cache_key="abc",
+            is_cache_hit=False,
+            requested_at=datetime(2025, 1, 2, 3, 4, 5),
+            started_at=None,
+            finished_at=None,
+            log_path=None,
+            error_type=None,
+            error_message=None,
+            artifacts=[object(), object()],
+        )
+        data = BuildListItem.model_validate(record).model_dump(mode="json")
+
+        assert data["profile_id"] == "home.router"
+        assert data["artifact_count"] == 2
+        assert data["requested_at"] == "2025-01-02T03:04:05"
+        assert data["started_at"] is None
+
+    def test_build_list_item_without_profile(self) -> None:
+        """A missing profile should serialize as null."""
+        from types import SimpleNamespace
+
+        from openwrt_imagegen.cli._schemas import BuildListItem
+
+        record = SimpleNamespace(
+            id=1,
+            profile=None,
+            status="failed",
+            cache_key="k",
+            is_cache_hit=False,
+            requested_at=None,
+            started_at=None,
+            finished_at=None,
+            log_path=None,
+            error_type="build_failed",
+            error_message="boom",
+            artifacts=[],
+        )
+        data = BuildListItem.model_validate(record).model_dump(mode="json")
+
+        assert data["profile_id"] is None
+        assert data["artifact_count"] == 0
+
+    def test_artifact_item_keys(self) -> None:
+        """Artifact output should keep its documented key order."""
+        from types import SimpleNamespace
+
+        from openwrt_imagegen.cli._schemas import ArtifactItem
+
+        artifact = SimpleNamespace(
+            id=3,
+            build_id=1,
+            kind="sysupgrade",
+            filename="image.bin",
+            relative_path="image.bin",
+            absolute_path=None,
+            size_bytes=1024,
+            sha256="ab" * 32,
+            labels=["sysupgrade"],
+        )
+        data = ArtifactItem.model_validate(artifact).model_dump(mode="json")
+
+        assert list(data) == [
+            "id",
+            "build_id",
+            "kind",
+            "filename",
+            "relative_path",
+            "absolute_path",
+            "size_bytes",
+            "sha256",
+            "labels",
+        ]
+        assert data["absolute_path"] is None
+
+    def test_flash_result_item_keys(self) -> None:
+        """Flash results should keep their key order and enum values."""
+        from openwrt_imagegen.cli._schemas import FlashResultItem
+        from openwrt_imagegen.flash.service import FlashResult
+        from openwrt_imagegen.types import VerificationMode, VerificationResult
+
+        result = FlashResult(
+            success=True,
+            flash_record_id=7,
+            image_path="/tmp/image.bin",
+            device_path="/dev/sdb",
+            bytes_written=1024,
+            source_hash="ab" * 32,
+            device_hash="ab" * 32,
+            verification_mode=VerificationMode.FULL,
+            verification_result=VerificationResult.MATCH,
+        )
+        data = FlashResultItem.model_validate(result).model_dump(mode="json")
+
+        assert list(data) == [
+            "success",
+            "flash_record_id",
+            "image_path",
+            "device_path",
+            "bytes_written",
+            "source_hash",
+            "device_hash",
+            "verification_mode",
+            "verification_result",
+            "message",
+            "error_message",
+            "error_code",
+        ]
+        assert data["verification_mode"] == VerificationMode.FULL.value
+        assert data["verification_result"] == VerificationResult.MATCH.value
+
+
+class TestDumpJson:
+    """Test the CLI JSON serializer."""
+
+    def test_serializes_datetimes(self) -> None:
+        """Datetimes should be rendered as ISO 8601 strings."""
+        import json
+        from datetime import datetime
+
+        from openwrt_imagegen.cli import _encode_json
+
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        output = _encode_json([{"at": when, "none": None}])
+
+        assert json.loads(output) == [{"at": when.isoformat(), "none": None}]
+
+    def test_stdlib_fallback_matches(self, monkeypatch) -> None:
+        """Without orjson the output should be identical."""
+        from datetime import datetime
+
+        from openwrt_imagegen.cli import _encode_json
+
+        payload = {"at": datetime(2024, 1, 2, 3, 4, 5), "items": [1, 2]}
+        with_orjson = _encode_json(payload)
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert _encode_json(payload) == with_orjson
+
+
+class TestWriteJsonArray:
+    """Test the streaming JSON array writer."""
+
+    @pytest.mark.parametrize(
+        "items",
+        [[], [{"a": 1}], [{"a": 1, "b": [1, 2]}, {"c": None}, "text", 3]],
+    )
+    def test_matches_indented_dump(self, capsysbinary, items) -> None:
+        """Streamed output should match a two-space indented dump."""
+        import json
+
+        from openwrt_imagegen.cli import _write_json_array
+
+        _write_json_array(iter(items))
+
+        out = capsysbinary.readouterr().out.decode()
+        assert out == json.dumps(items, indent=2) + "\n"
+
+
+class TestEmitJson:
+    """Test the raw JSON payload writer."""
+
+    @pytest.mark.parametrize(
+        "payload", ['["[bold]x[/bold]"]', b'["[bold]x[/bold]"]', '["[red]"]\n']
+    )
+    def test_writes_payload_verbatim(self, capsysbinary, payload) -> None:
+        """Markup-like text should pass through with one trailing newline."""
+        from openwrt_imagegen.cli import _emit_json
+
+        _emit_json(payload)
+
+        raw = payload.encode() if isinstance(payload, str) else payload
+        assert capsysbinary.readouterr().out == raw.rstrip(b"\n") + b"\n"
+
+    def test_terminal_output_is_highlighted(self, capsysbinary, monkeypatch) -> None:
+        """A TTY should get Rich's highlighted JSON instead of raw bytes."""
+        from openwrt_imagegen import cli
+
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        with patch.object(cli, "console") as console:
+            cli._emit_json(b'{"a": 1}')
+
+        console.print_json.assert_called_once_with('{"a": 1}')
+        assert capsysbinary.readouterr().out == b""
+
+
+class TestEncodeRow:
+    """Test the projected-row JSON encoder."""
+
+    def test_keys_follow_selected_columns(self) -> None:
+        """Rows should encode as indented objects keyed by column name."""
+        from sqlalchemy import create_engine, literal, select
+
+        from openwrt_imagegen.cli import _encode_row
+
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(literal(1).label("id"), literal("x").label("kind"))
+            ).one()
+
+        assert _encode_row(row) == b'{\n  "id": 1,\n  "kind": "x"\n}'
+
+    def test_compact(self) -> None:
+        """indent=False should encode the row on a single line."""
+        from collections import namedtuple
+
+        from openwrt_imagegen.cli import _encode_row
+
+        row = namedtuple("Row", ["id", "labels"])(1, ["a"])
+
+        assert _encode_row(row, indent=False) == b'{"id":1,"labels":["a"]}'
+
+    def test_datetimes_are_iso_strings(self) -> None:
+        """Datetime values should be emitted as ISO 8601 strings."""
+        from collections import namedtuple
+        from datetime import datetime
+
+        from openwrt_imagegen.cli import _encode_row
+
+        stamp = datetime(2025, 1, 2, 3, 4, 5, 678000)
+        row = namedtuple("Row", ["when"])(stamp)
+
+        assert _encode_row(row) == b'{\n  "when": "2025-01-02T03:04:05.678000"\n}'
+
+
+class TestWriteNdjson:
+    """Test the newline-delimited JSON writer."""
+
+    def test_one_compact_object_per_line(self, capsysbinary) -> None:
+        """Each element should be written as one compact line."""
+        from datetime import datetime
+
+        from openwrt_imagegen.cli import _write_ndjson
+
+        _write_ndjson(iter([{"id": 1}, {"when": datetime(2025, 1, 2)}]))
+
+        assert capsysbinary.readouterr().out == (
+            b'{"id":1}\n{"when":"2025-01-02T00:00:00"}\n'
+        )
+
+    def test_empty_writes_nothing(self, capsysbinary) -> None:
+        """No elements should produce no output at all."""
+        from openwrt_imagegen.cli import _write_ndjson
+
+        _write_ndjson([])
+
+        assert capsysbinary.readouterr().out == b""
+
+
+class TestTextOutput:
+    """Test multi-line human-readable command output."""
+
+    def test_builders_info_text(self, tmp_path, monkeypatch) -> None:
+        """builders info should print its block in order."""
+        monkeypatch.setenv("OWRT_IMG_CACHE_DIR", str(tmp_path / "cache"))
+
+        result = runner.invoke(app, ["builders", "info"])
+
+        assert result.exit_code == 0, result.stdout
+        assert result.stdout.splitlines() == [
+            "Image Builder Cache Information:",
+            "",
+            f"  Cache directory: {tmp_path / 'cache'}",
+            "  Exists: False",
+            "  Total size: 0.0 B",
+        ]
+
+    def test_builders_list_text(self, tmp_path, monkeypatch) -> None:
+        """builders list should print one block per builder."""
+        from datetime import datetime
+
+        from openwrt_imagegen.db import (
+            create_all_tables,
+            get_engine,
+            get_session_factory,
+        )
+        from openwrt_imagegen.imagebuilder.models import ImageBuilder
+
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        engine = get_engine(db_url)
+        create_all_tables(engine)
+        with get_session_factory(engine)() as session:
+            session.add_all(
+                [
+                    ImageBuilder(
+                        openwrt_release="23.05.3",
+                        target="ath79",
+                        subtarget="generic",
+                        upstream_url="https://example.com/a",
+                        root_dir="/cache/a",
+                        state="ready",
+                        last_used_at=datetime(2024, 1, 2, 3, 4, 5),
+                    ),
+                    ImageBuilder(
+                        openwrt_release="23.05.3",
+                        target="ramips",
+                        subtarget="mt7621",
+                        upstream_url="https://example.com/b",
+                        root_dir="/cache/b",
+                        state="broken",
+                    ),
+                ]
+            )
+            session.commit()
+        monkeypatch.setenv("OWRT_IMG_DB_URL", db_url)
+
+        result = runner.invoke(app, ["builders", "list"])
+
+        assert result.exit_code == 0, result.stdout
+        lines = result.stdout.splitlines()
+        assert lines[0] == "Found 2 Image Builder(s):"
+        assert "  23.05.3/ath79/generic" in lines
+        assert "    Last used: 2024-01-02T03:04:05" in lines
+        broken = lines.index("  23.05.3/ramips/mt7621")
+        assert lines[broken + 1 : broken + 3] == [
+            "    State: broken",
+            "    Root: /cache/b",
+        ]
+
+    def test_profiles_import_directory_text(self, tmp_path, monkeypatch) -> None:
+        """Directory import should list failures after the totals."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/test.db")
+        profiles = tmp_path / "profiles"
+        profiles.mkdir()
+        (profiles / "good.yaml").write_text(
+            "profile_id: text.good\n"
+            "name: Good\n"
+            "device_id: dev\n"
+            "openwrt_release: '23.05.3'\n"
+            "target: ath79\n"
+            "subtarget: generic\n"
+            "imagebuilder_profile: dev\n"
+        )
+        (profiles / "bad.yaml").write_text("profile_id: text.bad\n")
+
+        result = runner.invoke(app, ["profiles", "import", str(profiles)])
+
+        assert result.exit_code == 1
+        lines = result.stdout.splitlines()
+        assert lines[:4] == [
+            "Import results:",
+            "  Total: 2",
+            "  Succeeded: 1",
+            "  Failed: 1",
+        ]
+        assert lines[4].startswith("    - ")
+        assert "bad" in lines[4]
+
+        # The profiles that did import are committed despite the exit code
+        shown = runner.invoke(app, ["profiles", "show", "text.good", "--json"])
+        assert shown.exit_code == 0
+
+
 class TestCLISubcommands:
     """Test that subcommand groups exist."""
 
@@ -165,3 +715,70 @@ class TestModuleEntryPoint:
         )
         assert result.returncode == 0
         assert __version__ in result.stdout
+
+    def test_version_fast_path_skips_typer(self) -> None:
+        """--version via the entry point should not import Typer."""
+        code = (
+            "import sys; sys.argv = ['imagegen', '--version']; "
+            "from openwrt_imagegen.__main__ import main; main(); "
+            "print('typer' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert result.stdout.splitlines() == [
+            f"openwrt-imagegen version {__version__}",
+            "False",
+        ]
+
+    def test_import_defers_settings_and_rich(self) -> None:
+        """Importing the CLI module should not load settings or Rich."""
+        code = (
+            "import sys; import openwrt_imagegen.cli; "
+            "print('openwrt_imagegen.config' in sys.modules, 'rich' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "False False"
+
+    def test_subcommand_groups_load_on_demand(self) -> None:
+        """Invoking one group should not import the other groups' modules."""
+        code = (
+            "import sys; from typer.testing import CliRunner; "
+            "from openwrt_imagegen.cli import app; "
+            "CliRunner().invoke(app, ['builders', '--help']); "
+            "groups = ('_profiles', '_builders', '_builds', '_artifacts', '_flash'); "
+            "print([g for g in groups if 'openwrt_imagegen.cli.' + g in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "['_builders']"
+
+    def test_group_commands_built_once(self) -> None:
+        """Separately built root commands should share each loaded group."""
+        import typer
+
+        first = typer.main.get_command(app)
+        second = typer.main.get_command(app)
+
+        assert first is not second
+        assert first.get_command(None, "builders") is second.get_command(
+            None, "builders"
+        )
+
+    def test_cli_command_cached(self) -> None:
+        """The root command used for in-process reuse should be built once."""
+        from openwrt_imagegen.cli import _cli_command
+
+        assert _cli_command() is _cli_command()
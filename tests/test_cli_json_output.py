@@ -97,6 +97,31 @@ tags:
             assert "test" in profile["tags"]
             assert "json" in profile["tags"]
 
+    def test_profiles_list_ndjson_matches_json(self, tmp_path: Path) -> None:
+        """profiles list --ndjson should carry the --json objects, one per line."""
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        profile_yaml = tmp_path / "test.yaml"
+        profile_yaml.write_text("""
+profile_id: test.profile.1
+name: Test Profile
+device_id: test-device
+openwrt_release: "23.05.2"
+target: ath79
+subtarget: generic
+imagebuilder_profile: tplink_archer-c6-v3
+""")
+
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": db_url}):
+            runner.invoke(app, ["profiles", "import", str(profile_yaml)])
+            json_result = runner.invoke(app, ["profiles", "list", "--json"])
+            result = runner.invoke(app, ["profiles", "list", "--ndjson"])
+
+        assert result.exit_code == 0, result.stdout
+        lines = result.stdout.splitlines()
+        assert len(lines) == 1
+        assert [json.loads(line) for line in lines] == json.loads(json_result.stdout)
+        assert "null" not in result.stdout
+
     def test_profiles_show_json(self, tmp_path: Path) -> None:
         """profiles show --json should return profile details."""
         db_url = f"sqlite:///{tmp_path}/test.db"
@@ -236,6 +261,42 @@ class TestBuildersJSONOutput:
             data = json.loads(result.stdout)
             assert data == []
 
+    def test_builders_list_json_matches_schema(self, tmp_path: Path) -> None:
+        """builders list --json rows should match the BuilderListItem schema."""
+        from datetime import datetime
+
+        from openwrt_imagegen.cli._schemas import BuilderListItem
+        from openwrt_imagegen.db import (
+            create_all_tables,
+            get_engine,
+            get_session_factory,
+        )
+        from openwrt_imagegen.imagebuilder.models import ImageBuilder
+
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        engine = get_engine(db_url)
+        create_all_tables(engine)
+        with get_session_factory(engine)() as session:
+            builder = ImageBuilder(
+                openwrt_release="23.05.3",
+                target="ath79",
+                subtarget="generic",
+                upstream_url="https://example.com/",
+                root_dir="/cache/test",
+                state="ready",
+                first_used_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+            )
+            session.add(builder)
+            session.commit()
+            expected = [BuilderListItem.model_validate(builder).model_dump(mode="json")]
+
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": db_url}):
+            result = runner.invoke(app, ["builders", "list", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == expected
+        assert expected[0]["first_used_at"] == "2024-01-02T03:04:05.678901"
+
     def test_builders_info_json(self, tmp_path: Path) -> None:
         """builders info --json should return cache information."""
         db_url = f"sqlite:///{tmp_path}/test.db"
@@ -364,6 +425,134 @@ class TestArtifactsJSONOutput:
             data = json.loads(result.stdout)
             assert data == []
 
+    @pytest.fixture
+    def artifacts_db_url(self, tmp_path: Path) -> str:
+        """Create a database holding one build with two artifacts."""
+        from openwrt_imagegen.builds.models import Artifact, BuildRecord
+        from openwrt_imagegen.db import (
+            create_all_tables,
+            get_engine,
+            get_session_factory,
+        )
+        from openwrt_imagegen.imagebuilder.models import ImageBuilder
+        from openwrt_imagegen.profiles.models import Profile
+
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        engine = get_engine(db_url)
+        create_all_tables(engine)
+        with get_session_factory(engine)() as session:
+            profile = Profile(
+                profile_id="artifacts.test",
+                name="Artifacts Test",
+                device_id="device-1",
+                openwrt_release="23.05.3",
+                target="ath79",
+                subtarget="generic",
+                imagebuilder_profile="device-1",
+            )
+            builder = ImageBuilder(
+                openwrt_release="23.05.3",
+                target="ath79",
+                subtarget="generic",
+                upstream_url="https://example.com/",
+                root_dir="/cache/test",
+            )
+            session.add_all([profile, builder])
+            session.flush()
+            build = BuildRecord(
+                profile_id=profile.id,
+                imagebuilder_id=builder.id,
+                cache_key="sha256:artifacts",
+            )
+            session.add(build)
+            session.flush()
+            session.add_all(
+                [
+                    Artifact(
+                        build_id=build.id,
+                        kind=kind,
+                        relative_path=f"{kind}.bin",
+                        filename=f"{kind}.bin",
+                        size_bytes=1024,
+                        sha256="ab" * 32,
+                        labels=[kind],
+                    )
+                    for kind in ("factory", "sysupgrade")
+                ]
+            )
+            session.commit()
+        engine.dispose()
+        return db_url
+
+    def test_artifacts_list_with_data_json(self, artifacts_db_url: str) -> None:
+        """artifacts list --json should list newest first with stable keys."""
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": artifacts_db_url}):
+            result = runner.invoke(app, ["artifacts", "list", "--json"])
+
+        assert result.exit_code == 0, result.stdout
+        data = json.loads(result.stdout)
+        assert [a["kind"] for a in data] == ["sysupgrade", "factory"]
+        assert data[0]["labels"] == ["sysupgrade"]
+        assert data[0]["absolute_path"] is None
+
+    def test_artifacts_list_with_data_text(self, artifacts_db_url: str) -> None:
+        """artifacts list should honour filters in text output."""
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": artifacts_db_url}):
+            result = runner.invoke(app, ["artifacts", "list", "--kind", "factory"])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Found 1 artifact(s)" in result.stdout
+        assert "factory.bin" in result.stdout
+
+    @pytest.mark.parametrize(
+        ("args", "kinds"),
+        [
+            (["--build-id", "1"], ["sysupgrade", "factory"]),
+            (["--build-id", "2"], []),
+            (["--build-id", "1", "--kind", "factory"], ["factory"]),
+        ],
+    )
+    def test_artifacts_list_filters_json(
+        self, artifacts_db_url: str, args: list[str], kinds: list[str]
+    ) -> None:
+        """Bound filter values should apply on every invocation."""
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": artifacts_db_url}):
+            result = runner.invoke(app, ["artifacts", "list", "--json", *args])
+
+        assert result.exit_code == 0, result.stdout
+        assert [a["kind"] for a in json.loads(result.stdout)] == kinds
+
+    def test_artifacts_list_stmt_built_once(self) -> None:
+        """Each filter combination should reuse one statement object."""
+        from openwrt_imagegen.cli._artifacts import _artifacts_list_stmt
+
+        assert _artifacts_list_stmt(True, False) is _artifacts_list_stmt(True, False)
+        assert _artifacts_list_stmt(True, False) is not _artifacts_list_stmt(
+            False, False
+        )
+
+    def test_artifacts_list_ndjson(self, artifacts_db_url: str) -> None:
+        """artifacts list --ndjson should print one JSON object per line."""
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": artifacts_db_url}):
+            json_result = runner.invoke(app, ["artifacts", "list", "--json"])
+            result = runner.invoke(app, ["artifacts", "list", "--ndjson"])
+
+        assert result.exit_code == 0, result.stdout
+        lines = result.stdout.splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(json_result.stdout)
+        assert all(line.startswith("{") and line.endswith("}") for line in lines)
+
+    def test_artifacts_show_text(self, artifacts_db_url: str) -> None:
+        """artifacts show should render every field in one block."""
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": artifacts_db_url}):
+            result = runner.invoke(app, ["artifacts", "show", "1"])
+
+        assert result.exit_code == 0, result.stdout
+        lines = result.stdout.splitlines()
+        assert lines[0] == "Artifact #1"
+        assert "  Size:          1,024 bytes" in lines
+        assert lines[-1] == "  Labels:        factory"
+
     def test_artifacts_show_not_found_json(self, tmp_path: Path) -> None:
         """artifacts show should fail properly for missing artifact."""
         db_url = f"sqlite:///{tmp_path}/test.db"
@@ -392,6 +581,36 @@ class TestFlashJSONOutput:
             assert result.exit_code == 1
             assert "not found" in result.stdout.lower()
 
+    def test_flash_image_json_without_force_refuses(self, tmp_path: Path) -> None:
+        """Scripted --json flashes without --force should fail, not prompt."""
+        image_file = tmp_path / "test-image.bin"
+        image_file.write_bytes(b"\x00" * 1024)
+
+        with patch("openwrt_imagegen.flash.service.flash_image") as mock_flash:
+            result = runner.invoke(
+                app, ["flash", "image", str(image_file), "/dev/sdb", "--json"]
+            )
+
+        assert result.exit_code == 1
+        assert "--force" in result.stdout
+        assert "Are you sure" not in result.stdout
+        mock_flash.assert_not_called()
+
+    def test_flash_image_without_json_still_prompts(self, tmp_path: Path) -> None:
+        """Without --json the confirmation prompt is still shown."""
+        image_file = tmp_path / "test-image.bin"
+        image_file.write_bytes(b"\x00" * 1024)
+
+        with patch("openwrt_imagegen.flash.service.flash_image") as mock_flash:
+            result = runner.invoke(
+                app, ["flash", "image", str(image_file), "/dev/sdb"], input="n\n"
+            )
+
+        assert result.exit_code == 0
+        assert "Are you sure" in result.stdout
+        assert "Aborted" in result.stdout
+        mock_flash.assert_not_called()
+
     def test_flash_image_dry_run_json(self, tmp_path: Path) -> None:
         """flash image --dry-run --json should return proper structure."""
         # Create a fake image file
@@ -463,6 +682,88 @@ class TestFlashJSONOutput:
             data = json.loads(result.stdout)
             assert data == []
 
+    def test_flash_list_timestamps_json(self, tmp_path: Path) -> None:
+        """flash list --json should render timestamps as ISO 8601 strings."""
+        from collections import namedtuple
+        from datetime import datetime
+
+        from openwrt_imagegen.cli._schemas import FlashRecordListItem
+
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        requested = datetime(2025, 1, 2, 3, 4, 5, 678000)
+        # iter_flash_records yields named rows
+        record = namedtuple("Row", FlashRecordListItem.model_fields)(
+            id=1,
+            artifact_id=2,
+            build_id=3,
+            device_path="/dev/sdb",
+            device_model=None,
+            device_serial=None,
+            status="succeeded",
+            wiped_before_flash=False,
+            verification_mode="full-hash",
+            verification_result="match",
+            requested_at=requested,
+            started_at=None,
+            finished_at=None,
+            error_type=None,
+            error_message=None,
+            log_path=None,
+        )
+
+        with (
+            patch.dict("os.environ", {"OWRT_IMG_DB_URL": db_url}),
+            patch(
+                "openwrt_imagegen.flash.service.iter_flash_records",
+                return_value=[record],
+            ),
+        ):
+            result = runner.invoke(app, ["flash", "list", "--json"])
+
+        assert result.exit_code == 0, result.stdout
+        data = json.loads(result.stdout)
+        assert data[0]["requested_at"] == requested.isoformat()
+        assert data[0]["started_at"] is None
+
+    def test_flash_list_stored_timestamps_json(self, tmp_path: Path) -> None:
+        """Stored timestamps should come out exactly as datetime.isoformat()."""
+        from datetime import datetime
+
+        from openwrt_imagegen.db import (
+            create_all_tables,
+            get_engine,
+            get_session_factory,
+        )
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        db_url = f"sqlite:///{tmp_path}/test.db"
+        engine = get_engine(db_url)
+        create_all_tables(engine)
+        started = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        finished = datetime(2025, 1, 2, 3, 9, 0)
+        with get_session_factory(engine)() as session:
+            # requested_at comes from the CURRENT_TIMESTAMP server default
+            record = FlashRecord(
+                artifact_id=1,
+                build_id=1,
+                device_path="/dev/sdb",
+                started_at=started,
+                finished_at=finished,
+            )
+            session.add(record)
+            session.commit()
+            requested = record.requested_at
+        engine.dispose()
+
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": db_url}):
+            result = runner.invoke(app, ["flash", "list", "--json"])
+
+        assert result.exit_code == 0, result.stdout
+        data = json.loads(result.stdout)[0]
+        assert data["requested_at"] == requested.isoformat()
+        assert data["started_at"] == "2025-01-02T03:04:05.678901"
+        assert data["finished_at"] == "2025-01-02T03:09:00"
+
     def test_flash_list_invalid_status(self, tmp_path: Path) -> None:
         """flash list with invalid status should fail."""
         db_url = f"sqlite:///{tmp_path}/test.db"
@@ -536,6 +837,16 @@ class TestJSONOutputConsistency:
             data = json.loads(result.stdout)
             assert isinstance(data, list)
 
+    @pytest.mark.parametrize("group", ["profiles", "build", "artifacts", "flash"])
+    def test_list_ndjson_empty(self, tmp_path: Path, group: str) -> None:
+        """list --ndjson with no records must print nothing."""
+        db_url = f"sqlite:///{tmp_path}/test.db"
+
+        with patch.dict("os.environ", {"OWRT_IMG_DB_URL": db_url}):
+            result = runner.invoke(app, [group, "list", "--ndjson"])
+            assert result.exit_code == 0, result.stdout
+            assert result.stdout == ""
+
 
 class TestJSONOutputStableKeys:
     """Test that JSON outputs have stable keys as per FRONTENDS.md."""
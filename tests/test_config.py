@@ -5,7 +5,12 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
-from openwrt_imagegen.config import Settings, get_settings, print_settings_json
+from openwrt_imagegen.config import (
+    Settings,
+    get_settings,
+    print_settings_json,
+    reload_settings,
+)
 
 
 class TestSettings:
@@ -26,6 +31,7 @@ class TestSettings:
         assert "sqlite" in settings.db_url
         assert settings.offline is False
         assert settings.log_level == "INFO"
+        assert settings.auto_create_tables is True
         assert settings.max_concurrent_downloads >= 1
         assert settings.max_concurrent_builds >= 1
 
@@ -37,10 +43,12 @@ class TestSettings:
                 "OWRT_IMG_OFFLINE": "true",
                 "OWRT_IMG_LOG_LEVEL": "DEBUG",
                 "OWRT_IMG_MAX_CONCURRENT_BUILDS": "4",
+                "OWRT_IMG_AUTO_CREATE_TABLES": "false",
             },
         ):
             settings = Settings()
             assert settings.offline is True
+            assert settings.auto_create_tables is False
             assert settings.log_level == "DEBUG"
             assert settings.max_concurrent_builds == 4
 
@@ -64,6 +72,18 @@ class TestGetSettings:
         settings = get_settings()
         assert isinstance(settings, Settings)
 
+    def test_get_settings_is_cached(self) -> None:
+        """Repeated lookups should share one Settings instance."""
+        assert get_settings() is get_settings()
+
+    def test_reload_settings_rereads_environment(self) -> None:
+        """reload_settings should pick up environment changes."""
+        first = get_settings()
+        with patch.dict(os.environ, {"OWRT_IMG_LOG_LEVEL": "DEBUG"}):
+            assert get_settings() is first
+            reload_settings()
+            assert get_settings().log_level == "DEBUG"
+
 
 class TestPrintSettingsJson:
     """Test print_settings_json function."""
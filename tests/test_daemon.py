@@ -0,0 +1,181 @@
+"""Tests for daemon module."""
+
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from openwrt_imagegen.daemon import (
+    _FRAME_HEADER,
+    _STDERR,
+    DaemonServer,
+    _run_cli,
+    default_socket_path,
+    run_client,
+    stop_daemon,
+)
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (AF_UNIX paths are limited to ~108 bytes)."""
+    directory = tempfile.mkdtemp(prefix="igd-")
+    yield Path(directory) / "d.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Run a daemon server in a background thread."""
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def _run(argv: list[str], socket_path: Path) -> tuple[int | None, str, str]:
+    stdout = io.BytesIO()
+    stderr = io.BytesIO()
+    code = run_client(argv, socket_path, stdout=stdout, stderr=stderr)
+    return code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+class TestRunClient:
+    """Tests for running CLI invocations through the daemon."""
+
+    def test_no_daemon_returns_none(self, socket_path) -> None:
+        """Without a daemon the caller should fall back to in-process."""
+        assert run_client(["config"], socket_path) is None
+
+    def test_relays_stdout_and_exit_code(self, daemon, tmp_path, monkeypatch) -> None:
+        """Command output and a zero exit code should reach the client."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/d.db")
+
+        code, stdout, _ = _run(["config", "--json"], daemon)
+
+        assert code == 0
+        assert json.loads(stdout)["db_url"] == f"sqlite:///{tmp_path}/d.db"
+
+    def test_forwards_caller_environment(self, daemon, tmp_path, monkeypatch) -> None:
+        """Each request should see the calling client's settings."""
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/one.db")
+        _, first, _ = _run(["config", "--json"], daemon)
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path}/two.db")
+        _, second, _ = _run(["config", "--json"], daemon)
+
+        assert json.loads(first)["db_url"].endswith("one.db")
+        assert json.loads(second)["db_url"].endswith("two.db")
+
+    def test_relays_usage_errors(self, daemon) -> None:
+        """Usage errors should keep their exit code and go to stderr."""
+        code, stdout, stderr = _run(["no-such-command"], daemon)
+
+        assert code == 2
+        assert stdout == ""
+        assert "No such command" in stderr
+
+
+class TestSocketSecurity:
+    """Tests for the socket location and the daemon owner check."""
+
+    def test_fallback_path_in_private_directory(self, monkeypatch) -> None:
+        """Without XDG_RUNTIME_DIR the socket should sit in a per-user dir."""
+        monkeypatch.delenv("OWRT_IMG_DAEMON_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        path = default_socket_path()
+
+        assert path.name == "imagegen.sock"
+        assert path.parent.name == f"imagegen-{os.getuid()}"
+
+    def test_server_creates_private_directory(self, socket_path) -> None:
+        """A missing socket directory should be created with mode 0700."""
+        nested = socket_path.parent / "run" / "d.sock"
+
+        server = DaemonServer(nested)
+        server.server_close()
+
+        assert nested.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_server_refuses_shared_directory(self, socket_path) -> None:
+        """A directory open to group or others should be rejected."""
+        socket_path.parent.chmod(0o755)
+
+        with pytest.raises(PermissionError):
+            DaemonServer(socket_path)
+
+    def test_client_refuses_other_users_daemon(self, daemon) -> None:
+        """Nothing should be sent to a daemon run by another user."""
+        with (
+            patch("openwrt_imagegen.daemon._peer_uid", return_value=os.getuid() + 1),
+            patch("openwrt_imagegen.daemon._run_cli") as mock_run,
+        ):
+            code, stdout, stderr = _run(["config", "--json"], daemon)
+
+        assert code is None
+        assert stdout == ""
+        assert "Refusing to use" in stderr
+        mock_run.assert_not_called()
+
+
+class TestRunCli:
+    """Tests for running one invocation inside the daemon."""
+
+    def test_queued_logs_precede_exit_frame(self) -> None:
+        """Records written by the log listener should arrive before exit."""
+        from openwrt_imagegen.logs import configure_logging, shutdown_logging
+
+        def command(**_kwargs):
+            # StreamHandler() binds the request's redirected stderr
+            configure_logging("INFO", handler=logging.StreamHandler())
+            logging.getLogger("openwrt_imagegen.flash").info("queued record")
+
+        wfile = io.BytesIO()
+        try:
+            with patch("openwrt_imagegen.cli._cli_command", return_value=command):
+                code = _run_cli({"argv": []}, wfile)
+            # Everything the daemon sends before the exit frame
+            response = wfile.getvalue()
+        finally:
+            shutdown_logging()
+
+        frames = []
+        stream = io.BytesIO(response)
+        while header := stream.read(_FRAME_HEADER.size):
+            channel, length = _FRAME_HEADER.unpack(header)
+            frames.append((channel, stream.read(length)))
+
+        assert code == 0
+        stderr = b"".join(p for c, p in frames if c == _STDERR)
+        assert b"queued record" in stderr
+
+
+class TestStopDaemon:
+    """Tests for stop_daemon."""
+
+    def test_stops_running_daemon(self, socket_path) -> None:
+        """A running daemon should shut down and remove its socket."""
+        server = DaemonServer(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        assert stop_daemon(socket_path) is True
+        thread.join(timeout=5)
+        server.server_close()
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_no_daemon(self, socket_path) -> None:
+        """Stopping without a daemon should report False."""
+        assert stop_daemon(socket_path) is False
@@ -1,6 +1,10 @@
 """Tests for flash/device.py - device validation."""
 
+import dataclasses
+import errno
+import pickle
 import stat
+import struct
 import tempfile
 from unittest.mock import mock_open, patch
 
@@ -14,12 +18,15 @@ from openwrt_imagegen.flash.device import (
     PartitionDeviceError,
     SystemDeviceError,
     _partition_to_whole_device,
+    discard_device,
     get_device_size,
     get_mount_points,
     get_root_device,
     is_block_device,
     is_partition_path,
+    read_mounts,
     validate_device,
+    validate_devices,
 )
 
 
@@ -48,6 +55,14 @@ class TestIsPartitionPath:
         assert is_partition_path("/dev/mmcblk0p1") is True
         assert is_partition_path("/dev/mmcblk1p2") is True
 
+    def test_mmcblk_non_partition_names(self):
+        """MMC boot areas and malformed names should not be partitions."""
+        assert is_partition_path("/dev/mmcblk0boot0") is False
+        assert is_partition_path("/dev/mmcblk0rpmb") is False
+        assert is_partition_path("/dev/mmcblkp1") is False
+        assert is_partition_path("/dev/mmcblk0p") is False
+        assert is_partition_path("/dev/mmcblk0p1p2") is False
+
     def test_whole_device_nvme(self):
         """NVMe whole device should not be detected as partition."""
         assert is_partition_path("/dev/nvme0n1") is False
@@ -100,6 +115,11 @@ class TestPartitionToWholeDevice:
         """Whole device paths should be returned as-is."""
         assert _partition_to_whole_device("/dev/sda") == "/dev/sda"
         assert _partition_to_whole_device("/dev/mmcblk0") == "/dev/mmcblk0"
+        assert _partition_to_whole_device("/dev/dm-0") == "/dev/dm-0"
+
+    def test_sd_device_ending_in_p(self):
+        """A drive letter "p" should not be taken for a partition separator."""
+        assert _partition_to_whole_device("/dev/sdp1") == "/dev/sdp"
 
 
 class TestIsBlockDevice:
@@ -179,6 +199,26 @@ class TestGetMountPoints:
             assert result == []
 
 
+class TestReadMounts:
+    """Tests for read_mounts function."""
+
+    def test_snapshot_reused(self):
+        """A snapshot should serve both lookups without reopening the file."""
+        proc_mounts = "/dev/mmcblk0p2 / ext4 rw 0 0\n/dev/sdb1 /mnt ext4 rw 0 0\nbad\n"
+        with patch("builtins.open", mock_open(read_data=proc_mounts)):
+            mounts = read_mounts()
+
+        assert mounts == [("/dev/mmcblk0p2", "/"), ("/dev/sdb1", "/mnt")]
+        with patch("builtins.open", side_effect=AssertionError("reopened")):
+            assert get_root_device(mounts) == "/dev/mmcblk0"
+            assert get_mount_points("/dev/sdb", mounts) == ["/mnt"]
+
+    def test_read_error(self):
+        """An unreadable mount table should yield None."""
+        with patch("builtins.open", side_effect=OSError("Permission denied")):
+            assert read_mounts() is None
+
+
 class TestGetRootDevice:
     """Tests for get_root_device function."""
 
@@ -214,17 +254,57 @@ class TestGetRootDevice:
             result = get_root_device()
             assert result is None
 
+    def test_stops_at_root_mount(self):
+        """Lines after the root mount should not be parsed."""
+        lines = ["/dev/sda1 / ext4 rw 0 0\n"]
+
+        def more_lines():
+            yield from lines
+            raise AssertionError("read past the root mount")
+
+        opener = mock_open()
+        opener.return_value.__iter__.side_effect = more_lines
+        with patch("builtins.open", opener):
+            assert get_root_device() == "/dev/sda"
+
 
 class TestGetDeviceSize:
     """Tests for get_device_size function."""
 
+    def test_ioctl_size(self):
+        """Read device size with the BLKGETSIZE64 ioctl."""
+        size = struct.pack("Q", 32_000_000_000)
+        with patch("os.open", return_value=42):
+            with patch("os.close") as mock_close:
+                with patch("fcntl.ioctl", return_value=size) as mock_ioctl:
+                    with patch("pathlib.Path.read_text") as mock_read:
+                        result = get_device_size("/dev/sda")
+
+        assert result == 32_000_000_000
+        assert mock_ioctl.call_args.args[0] == 42
+        mock_close.assert_called_once_with(42)
+        mock_read.assert_not_called()
+
+    def test_ioctl_failure_falls_back_to_sysfs(self):
+        """Fall back to sysfs when the ioctl is not supported."""
+        with patch("os.open", return_value=42):
+            with patch("os.close") as mock_close:
+                with patch("fcntl.ioctl", side_effect=OSError("ENOTTY")):
+                    with patch("pathlib.Path.exists", return_value=True):
+                        with patch("pathlib.Path.read_text", return_value="8\n"):
+                            result = get_device_size("/dev/sda")
+
+        assert result == 4096
+        mock_close.assert_called_once_with(42)
+
     def test_sysfs_read(self):
         """Read device size from sysfs."""
         # 1000 sectors * 512 bytes = 512000 bytes
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.read_text", return_value="1000\n"):
-                result = get_device_size("/dev/sda")
-                assert result == 512000
+        with patch("os.open", side_effect=PermissionError("denied")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.read_text", return_value="1000\n"):
+                    result = get_device_size("/dev/sda")
+                    assert result == 512000
 
     def test_sysfs_not_found(self):
         """Return None if sysfs path doesn't exist."""
@@ -234,10 +314,115 @@ class TestGetDeviceSize:
 
     def test_read_error(self):
         """Return None on read error."""
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.read_text", side_effect=OSError("Error")):
-                result = get_device_size("/dev/sda")
-                assert result is None
+        with patch("os.open", side_effect=PermissionError("denied")):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("pathlib.Path.read_text", side_effect=OSError("Error")):
+                    result = get_device_size("/dev/sda")
+                    assert result is None
+
+
+class TestDiscardDevice:
+    """Tests for discard_device function."""
+
+    def test_discard_ioctl(self):
+        """Issue BLKDISCARD over the requested range."""
+        with patch("os.open", return_value=42):
+            with patch("os.close") as mock_close:
+                with patch("fcntl.ioctl") as mock_ioctl:
+                    result = discard_device("/dev/sdb", offset=512, length=4096)
+
+        assert result == 4096
+        fd, _request, arg = mock_ioctl.call_args.args
+        assert fd == 42
+        assert struct.unpack("QQ", arg) == (512, 4096)
+        mock_close.assert_called_once_with(42)
+
+    def test_discard_defaults_to_device_size(self):
+        """Discard the rest of the device when no length is given."""
+        with patch("os.open", return_value=42):
+            with patch("os.close"):
+                with patch("fcntl.ioctl") as mock_ioctl:
+                    with patch(
+                        "openwrt_imagegen.flash.device.get_device_size",
+                        return_value=8192,
+                    ):
+                        result = discard_device("/dev/sdb", offset=1024)
+
+        assert result == 7168
+        assert struct.unpack("QQ", mock_ioctl.call_args.args[2]) == (1024, 7168)
+
+    def test_discard_unknown_size(self):
+        """Refuse to guess a length when the device size is unknown."""
+        with patch("openwrt_imagegen.flash.device.get_device_size", return_value=None):
+            with pytest.raises(ValueError):
+                discard_device("/dev/sdb")
+
+    def test_zero_fallback_when_unsupported(self):
+        """Zero the range when the device does not support discard."""
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"\xff" * 8192)
+            f.flush()
+            with patch("fcntl.ioctl", side_effect=unsupported):
+                result = discard_device(f.name, offset=1024, length=4096)
+
+            f.seek(0)
+            data = f.read()
+
+        assert result == 4096
+        assert data[:1024] == b"\xff" * 1024
+        assert data[1024:5120] == bytes(4096)
+        assert data[5120:] == b"\xff" * 3072
+
+    def test_other_errors_propagate(self):
+        """Errors other than missing discard support should be raised."""
+        with patch("os.open", return_value=42):
+            with patch("os.close"):
+                with patch("fcntl.ioctl", side_effect=OSError(errno.EIO, "I/O")):
+                    with pytest.raises(OSError):
+                        discard_device("/dev/sdb", length=4096)
+
+
+class TestDeviceInfo:
+    """Tests for the DeviceInfo dataclass."""
+
+    def test_frozen(self):
+        """DeviceInfo should be immutable and slotted."""
+        info = DeviceInfo(
+            path="/dev/sdb",
+            is_block_device=True,
+            is_whole_device=True,
+            is_mounted=False,
+            mount_points=[],
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.path = "/dev/sdc"  # type: ignore[misc]
+        assert not hasattr(info, "__dict__")
+
+
+class TestDeviceValidationErrors:
+    """Tests for the device validation exceptions."""
+
+    def test_mounted_error_message(self):
+        """Message should list the mount points and match str()."""
+        err = DeviceMountedError("/dev/sdb", ["/mnt/a", "/mnt/b"])
+
+        assert err.message == str(err)
+        assert "/mnt/a, /mnt/b" in err.message
+        assert err.error_code == "DEVICE_MOUNTED"
+
+    def test_errors_pickle_round_trip(self):
+        """Errors should survive pickling with their details intact."""
+        for err in (
+            DeviceNotFoundError("/dev/sdb"),
+            PartitionDeviceError("/dev/sdb1"),
+            DeviceMountedError("/dev/sdb", ["/mnt/usb"]),
+        ):
+            restored = pickle.loads(pickle.dumps(err))
+            assert type(restored) is type(err)
+            assert restored.message == err.message
+            assert restored.error_code == err.error_code
 
 
 class TestValidateDevice:
@@ -260,6 +445,22 @@ class TestValidateDevice:
             assert "not a block device" in str(exc_info.value).lower()
             assert exc_info.value.error_code == "NOT_BLOCK_DEVICE"
 
+    def test_unreadable_path_not_block_device(self):
+        """An unstattable path should be reported as not a block device."""
+        with patch("os.stat", side_effect=PermissionError("denied")):
+            with pytest.raises(NotBlockDeviceError):
+                validate_device("/dev/sdb")
+
+    def test_device_stat_once(self):
+        """Existence and type checks should share one stat call."""
+        block_mode = stat.S_IFBLK | 0o660
+        with patch("os.stat") as mock_stat:
+            mock_stat.return_value.st_mode = block_mode
+            with pytest.raises(PartitionDeviceError):
+                validate_device("/dev/sdb1")
+
+        mock_stat.assert_called_once_with("/dev/sdb1")
+
     def test_partition_not_allowed(self):
         """Raise PartitionDeviceError for partition paths."""
         # Mock the device to exist and be a block device
@@ -357,6 +558,99 @@ class TestValidateDevice:
                             assert result.mount_points == []
                             assert result.size_bytes == 4000000000
 
+    def test_mount_table_read_once(self):
+        """Root and mount checks should share one read of /proc/mounts."""
+        proc_mounts = "/dev/sda1 / ext4 rw 0 0\n/dev/sdb1 /mnt/usb ext4 rw 0 0\n"
+        block_mode = stat.S_IFBLK | 0o660
+        opener = mock_open(read_data=proc_mounts)
+
+        with patch("os.path.exists", return_value=True):
+            with patch("os.stat") as mock_stat:
+                mock_stat.return_value.st_mode = block_mode
+                with patch("builtins.open", opener):
+                    with pytest.raises(DeviceMountedError):
+                        validate_device("/dev/sdb")
+
+        opener.assert_called_once_with("/proc/mounts")
+
+    def test_validate_devices_shares_mount_snapshot(self):
+        """Batch validation should read /proc/mounts once for all devices."""
+        proc_mounts = "/dev/sda1 / ext4 rw 0 0\n/dev/sdd1 /mnt/usb ext4 rw 0 0\n"
+        block_mode = stat.S_IFBLK | 0o660
+        opener = mock_open(read_data=proc_mounts)
+
+        with patch("os.path.exists", return_value=True):
+            with patch("os.stat") as mock_stat:
+                mock_stat.return_value.st_mode = block_mode
+                with patch("builtins.open", opener):
+                    with patch(
+                        "openwrt_imagegen.flash.device.get_device_size",
+                        return_value=1000,
+                    ):
+                        results = validate_devices(
+                            ["/dev/sdb", "/dev/sdc", "/dev/sdd"], allow_mounted=True
+                        )
+
+        opener.assert_called_once_with("/proc/mounts")
+        assert [r.path for r in results] == ["/dev/sdb", "/dev/sdc", "/dev/sdd"]
+        assert [r.is_mounted for r in results] == [False, False, True]
+
+    def test_validate_devices_raises_on_first_failure(self):
+        """Batch validation should stop at the first invalid device."""
+        block_mode = stat.S_IFBLK | 0o660
+
+        with patch("os.path.exists", return_value=True):
+            with patch("os.stat") as mock_stat:
+                mock_stat.return_value.st_mode = block_mode
+                with (
+                    patch(
+                        "openwrt_imagegen.flash.device.get_root_device",
+                        return_value="/dev/sdc",
+                    ),
+                    patch(
+                        "openwrt_imagegen.flash.device.get_device_size",
+                        return_value=1000,
+                    ),
+                    pytest.raises(SystemDeviceError) as exc_info,
+                ):
+                    validate_devices(["/dev/sdb", "/dev/sdc"], check_mount=False)
+
+        assert exc_info.value.device_path == "/dev/sdc"
+
+    def test_validate_devices_per_entry_errors(self):
+        """With raise_on_error False, failures should come back in place."""
+        proc_mounts = "/dev/sda1 / ext4 rw 0 0\n/dev/sdd1 /mnt/usb ext4 rw 0 0\n"
+        block_mode = stat.S_IFBLK | 0o660
+        opener = mock_open(read_data=proc_mounts)
+
+        with patch("os.stat") as mock_stat:
+            mock_stat.return_value.st_mode = block_mode
+            with (
+                patch("builtins.open", opener),
+                patch(
+                    "openwrt_imagegen.flash.device.get_device_size",
+                    return_value=1000,
+                ),
+            ):
+                results = validate_devices(
+                    ["/dev/sdb", "/dev/sdb1", "/dev/sda", "/dev/sdd"],
+                    raise_on_error=False,
+                )
+
+        opener.assert_called_once_with("/proc/mounts")
+        assert results[0].path == "/dev/sdb"
+        assert [type(r) for r in results[1:]] == [
+            PartitionDeviceError,
+            SystemDeviceError,
+            DeviceMountedError,
+        ]
+
+    def test_validate_devices_empty(self):
+        """An empty batch should not touch the mount table."""
+        with patch("builtins.open") as opener:
+            assert validate_devices([]) == []
+        opener.assert_not_called()
+
     def test_skip_system_device_check(self):
         """Allow system device check to be skipped."""
         proc_mounts = "/dev/sda1 / ext4 rw 0 0\n"
@@ -14,10 +14,18 @@ from openwrt_imagegen.flash.service import (
     FlashResult,
     flash_artifact,
     flash_image,
+    flash_many_artifacts,
     get_flash_records,
+    iter_flash_records,
     plan_flash,
 )
-from openwrt_imagegen.types import FlashStatus, VerificationMode, VerificationResult
+from openwrt_imagegen.flash.writer import WriteIOError, compute_file_hash
+from openwrt_imagegen.types import (
+    FlashStatus,
+    HashAlgorithm,
+    VerificationMode,
+    VerificationResult,
+)
 
 
 class TestPlanFlash:
@@ -66,6 +74,24 @@ class TestPlanFlash:
             finally:
                 os.unlink(img.name)
 
+    def test_plan_with_validated_device(self, tmp_path):
+        """A device validated by the caller should not be validated again."""
+        image = tmp_path / "test.img"
+        image.write_bytes(b"Test image content")
+        device_info = MagicMock(path="/dev/sdb", model=None, serial=None)
+
+        with patch("openwrt_imagegen.flash.service.validate_device") as mock_validate:
+            plan = plan_flash(
+                image,
+                "/dev/../dev/sdb",
+                verification_mode=VerificationMode.SKIP,
+                device_info=device_info,
+            )
+
+        mock_validate.assert_not_called()
+        assert plan.device_path == "/dev/sdb"
+        assert plan.device_info is device_info
+
     def test_plan_with_wipe(self):
         """Create flash plan with wipe option."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".img") as img:
@@ -156,6 +182,67 @@ class TestPlanFlash:
             finally:
                 os.unlink(img.name)
 
+    def test_plan_reuses_hash_of_unchanged_image(self, tmp_path):
+        """Planning the same unchanged image twice should hash it once."""
+        image = tmp_path / "image.img"
+        image.write_bytes(b"first content")
+
+        with (
+            patch("openwrt_imagegen.flash.service.validate_device"),
+            patch(
+                "openwrt_imagegen.flash.service.compute_file_hash",
+                wraps=compute_file_hash,
+            ) as mock_hash,
+        ):
+            first = plan_flash(image, "/dev/sdb")
+            second = plan_flash(image, "/dev/sdb")
+            assert mock_hash.call_count == 1
+            assert second.image_hash == first.image_hash
+
+            # Rewriting the image changes its size/mtime, so it is re-hashed
+            image.write_bytes(b"second, longer content")
+            third = plan_flash(image, "/dev/sdb")
+
+        assert mock_hash.call_count == 2
+        assert third.image_hash == hashlib.sha256(b"second, longer content").hexdigest()
+
+    def test_plan_uses_known_image_hash(self, tmp_path):
+        """A known full-image hash should be used without hashing the file."""
+        image = tmp_path / "image.img"
+        image.write_bytes(b"content")
+
+        with (
+            patch("openwrt_imagegen.flash.service.validate_device"),
+            patch("openwrt_imagegen.flash.service.compute_file_hash") as mock_hash,
+        ):
+            plan = plan_flash(image, "/dev/sdb", image_sha256="ab" * 32)
+
+        assert plan.image_hash == "ab" * 32
+        mock_hash.assert_not_called()
+
+    def test_recorded_sha256_ignored_for_blake3(self, tmp_path):
+        """A known SHA-256 should not stand in for a BLAKE3 image hash."""
+        image = tmp_path / "image.img"
+        image.write_bytes(b"content")
+
+        with (
+            patch("openwrt_imagegen.flash.service.validate_device"),
+            patch(
+                "openwrt_imagegen.flash.service.compute_file_hash",
+                return_value=("b3" * 32, 7),
+            ) as mock_hash,
+        ):
+            plan = plan_flash(
+                image,
+                "/dev/sdb",
+                image_sha256="ab" * 32,
+                hash_algorithm=HashAlgorithm.BLAKE3,
+            )
+
+        assert plan.image_hash == "b3" * 32
+        assert plan.hash_algorithm == HashAlgorithm.BLAKE3
+        assert mock_hash.call_args.kwargs["algorithm"] == HashAlgorithm.BLAKE3
+
 
 class TestFlashImage:
     """Tests for flash_image function."""
@@ -259,6 +346,89 @@ class TestFlashImage:
                     os.unlink(img.name)
                     os.unlink(dev.name)
 
+    def test_real_flash_hashes_image_once(self, tmp_path):
+        """A real flash should hash the image in the write pass only."""
+        content = os.urandom(8192)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 8192)
+
+        with (
+            patch(
+                "openwrt_imagegen.flash.service.validate_device",
+                return_value=MagicMock(path=str(device), model=None, serial=None),
+            ),
+            patch("openwrt_imagegen.flash.service.compute_file_hash") as plan_hash,
+            patch("openwrt_imagegen.flash.writer.compute_file_hash") as writer_hash,
+        ):
+            result = flash_image(
+                image, str(device), verification_mode=VerificationMode.FULL
+            )
+
+        plan_hash.assert_not_called()
+        writer_hash.assert_not_called()
+        assert result.success is True
+        assert result.source_hash == hashlib.sha256(content).hexdigest()
+        assert result.verification_result == VerificationResult.MATCH
+
+    def test_tracked_flash_inserts_running_record(self, tmp_path):
+        """The FlashRecord should be written once, already running."""
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.orm import Session
+
+        from openwrt_imagegen.db import Base, import_models
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        import_models()
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        image = tmp_path / "image.img"
+        image.write_bytes(b"Test image content")
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 100)
+
+        statements: list[str] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda _c, _cur, statement, *_args: statements.append(statement),
+        )
+
+        def write_image(*_args, **_kwargs):
+            # Only the record's INSERT should precede the device write
+            assert [s.split()[0] for s in statements] == ["INSERT"]
+            # requested_at is left to the server default
+            assert "requested_at" not in statements[0].split("VALUES")[0]
+            raise WriteIOError("boom")
+
+        with (
+            Session(engine) as session,
+            patch("openwrt_imagegen.flash.service.validate_device") as mock_validate,
+            patch(
+                "openwrt_imagegen.flash.service.write_image_to_device",
+                side_effect=write_image,
+            ),
+        ):
+            mock_validate.return_value = MagicMock(
+                path=str(device), model=None, serial=None
+            )
+            result = flash_image(
+                image,
+                str(device),
+                session=session,
+                verification_mode=VerificationMode.FULL,
+                artifact_id=1,
+                build_id=1,
+            )
+            record = session.get(FlashRecord, result.flash_record_id)
+
+        assert result.success is False
+        assert record is not None
+        assert record.status == FlashStatus.FAILED.value
+        assert record.started_at is not None
+        assert record.requested_at is not None
+
 
 class TestFlashArtifact:
     """Tests for flash_artifact function."""
@@ -333,6 +503,233 @@ class TestFlashArtifact:
             finally:
                 os.unlink(img.name)
 
+    def test_flash_artifact_uses_recorded_hash(self, tmp_path):
+        """The artifact's recorded hash should be used when the size matches."""
+        image = tmp_path / "image.img"
+        image.write_bytes(b"Test content")
+        session = MagicMock()
+        session.get.return_value = MagicMock(
+            id=1,
+            build_id=1,
+            absolute_path=str(image),
+            size_bytes=len(b"Test content"),
+            sha256="cd" * 32,
+        )
+
+        with (
+            patch("openwrt_imagegen.flash.service.validate_device"),
+            patch("openwrt_imagegen.flash.service.compute_file_hash") as mock_hash,
+        ):
+            result = flash_artifact(
+                session,
+                artifact_id=1,
+                device_path="/dev/sdb",
+                verification_mode=VerificationMode.FULL,
+                dry_run=True,
+            )
+
+        assert result.source_hash == "cd" * 32
+        mock_hash.assert_not_called()
+
+
+class TestFlashManyArtifacts:
+    """Tests for flash_many_artifacts function."""
+
+    @pytest.fixture
+    def session(self, tmp_path):
+        """In-memory session with two artifacts backed by image files."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from openwrt_imagegen.builds.models import Artifact
+        from openwrt_imagegen.db import Base, import_models
+
+        import_models()
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            for name, content, sha256 in [
+                ("good.img", b"good image", hashlib.sha256(b"good image").hexdigest()),
+                # Recorded hash does not match the file: verification fails
+                ("bad.img", b"bad image!", "00" * 32),
+            ]:
+                image = tmp_path / name
+                image.write_bytes(content)
+                session.add(
+                    Artifact(
+                        build_id=1,
+                        kind="sysupgrade",
+                        relative_path=name,
+                        absolute_path=str(image),
+                        filename=name,
+                        size_bytes=len(content),
+                        sha256=sha256,
+                    )
+                )
+            session.commit()
+            yield session
+
+    @pytest.fixture
+    def devices(self, tmp_path):
+        """Two writable device stand-ins."""
+        paths = []
+        for name in ("sdb", "sdc"):
+            device = tmp_path / name
+            device.write_bytes(b"\x00" * 64)
+            paths.append(str(device))
+        return paths
+
+    @staticmethod
+    def _validate(paths, **_kwargs):
+        return [MagicMock(path=path, model="Card", serial=None) for path in paths]
+
+    def test_records_inserted_in_one_statement(self, session, devices):
+        """Records should share one INSERT and be updated around each write."""
+        from sqlalchemy import event, select
+
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        statements: list[str] = []
+
+        def listener(_conn, _cursor, statement, *_args):
+            statements.append(statement.split()[0])
+
+        event.listen(session.get_bind(), "before_cursor_execute", listener)
+        with patch(
+            "openwrt_imagegen.flash.service.validate_devices",
+            side_effect=self._validate,
+        ):
+            results = flash_many_artifacts(
+                session, [1, 2], devices, verification_mode=VerificationMode.FULL
+            )
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+        assert [r.device_path for r in results] == devices
+        assert [r.success for r in results] == [True, False]
+        assert results[1].error_code == "HASH_MISMATCH"
+        assert [s for s in statements if s != "SELECT"] == ["INSERT"] + ["UPDATE"] * 4
+
+        records = session.scalars(select(FlashRecord).order_by(FlashRecord.id)).all()
+        assert [r.id for r in records] == [r.flash_record_id for r in results]
+        assert [r.status for r in records] == [
+            FlashStatus.SUCCEEDED,
+            FlashStatus.FAILED,
+        ]
+        assert records[0].verification_result == VerificationResult.MATCH.value
+        assert records[0].device_model == "Card"
+        assert records[1].error_type == "HASH_MISMATCH"
+        assert all(r.requested_at and r.started_at and r.finished_at for r in records)
+
+    def test_invalid_device_gets_no_record(self, session, devices):
+        """A device failing validation should not stop the others."""
+        from sqlalchemy import func, select
+
+        from openwrt_imagegen.flash.device import NotBlockDeviceError
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        def validate(paths, **kwargs):
+            _, valid = self._validate(paths, **kwargs)
+            return [NotBlockDeviceError(paths[0]), valid]
+
+        with patch(
+            "openwrt_imagegen.flash.service.validate_devices", side_effect=validate
+        ) as mock_validate:
+            results = flash_many_artifacts(
+                session, [1, 1], devices, verification_mode=VerificationMode.FULL
+            )
+
+        mock_validate.assert_called_once_with(devices, raise_on_error=False)
+        assert results[0].success is False
+        assert results[0].flash_record_id is None
+        assert results[0].error_code == "NOT_BLOCK_DEVICE"
+        assert results[1].success is True
+        assert session.scalar(select(func.count(FlashRecord.id))) == 1
+
+    def test_interrupted_batch_keeps_earlier_outcomes(self, session, devices):
+        """Outcomes of written devices should be stored before the next write."""
+        from sqlalchemy import select
+
+        from openwrt_imagegen.flash.models import FlashRecord
+        from openwrt_imagegen.flash.service import write_image_to_device
+
+        def write(image_path, device_path, **kwargs):
+            if device_path == devices[1]:
+                raise KeyboardInterrupt
+            return write_image_to_device(image_path, device_path, **kwargs)
+
+        with (
+            patch(
+                "openwrt_imagegen.flash.service.validate_devices",
+                side_effect=self._validate,
+            ),
+            patch(
+                "openwrt_imagegen.flash.service.write_image_to_device",
+                side_effect=write,
+            ),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            flash_many_artifacts(
+                session, [1, 1], devices, verification_mode=VerificationMode.FULL
+            )
+
+        records = session.scalars(select(FlashRecord).order_by(FlashRecord.id)).all()
+        assert [r.status for r in records] == [
+            FlashStatus.SUCCEEDED,
+            FlashStatus.RUNNING,
+        ]
+        assert records[0].finished_at is not None
+        assert records[1].started_at is not None
+        assert records[1].finished_at is None
+
+    def test_rejects_device_spelled_twice(self, session, devices, tmp_path):
+        """Two spellings of one device should be refused before any write."""
+        from sqlalchemy import func, select
+
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        (tmp_path / "sub").mkdir()
+        alias = str(tmp_path / "sub" / ".." / "sdb")
+
+        with (
+            patch(
+                "openwrt_imagegen.flash.service.validate_devices",
+                side_effect=self._validate,
+            ),
+            patch("openwrt_imagegen.flash.service.write_image_to_device") as mock_write,
+            pytest.raises(ValueError, match="more than once"),
+        ):
+            flash_many_artifacts(session, [1, 2], [devices[0], alias])
+
+        mock_write.assert_not_called()
+        assert session.scalar(select(func.count(FlashRecord.id))) == 0
+
+    def test_missing_artifact_raises_before_writing(self, session, devices):
+        """Unknown artifacts should be reported before any device is written."""
+        with (
+            patch("openwrt_imagegen.flash.service.validate_devices") as mock_validate,
+            pytest.raises(ArtifactNotFoundError) as exc_info,
+        ):
+            flash_many_artifacts(session, [1, 99], devices)
+
+        assert exc_info.value.artifact_id == 99
+        mock_validate.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("artifact_ids", "device_paths"),
+        [([1], ["/dev/sdb", "/dev/sdc"]), ([1, 2], ["/dev/sdb", "/dev/sdb"])],
+    )
+    def test_rejects_mismatched_or_repeated_devices(self, artifact_ids, device_paths):
+        """Parallel sequences must line up and name each device once."""
+        with pytest.raises(ValueError):
+            flash_many_artifacts(MagicMock(), artifact_ids, device_paths)
+
+    def test_empty_batch(self):
+        """An empty batch should not touch the database."""
+        session = MagicMock()
+
+        assert flash_many_artifacts(session, [], []) == []
+        session.execute.assert_not_called()
+
 
 class TestGetFlashRecords:
     """Tests for get_flash_records function."""
@@ -369,6 +766,90 @@ class TestGetFlashRecords:
 
         assert records == []
 
+    def test_statement_reused_across_filter_values(self):
+        """Calls with the same filters should share one bound statement."""
+        session = MagicMock()
+
+        get_flash_records(session, device_path="/dev/sdb", limit=5)
+        get_flash_records(session, device_path="/dev/sdc", limit=10)
+        get_flash_records(session, status=FlashStatus.FAILED)
+
+        (first, first_params), (second, second_params), (third, _) = [
+            c.args for c in session.execute.call_args_list
+        ]
+        assert first is second
+        assert third is not first
+        assert first_params["device_path"] == "/dev/sdb"
+        assert second_params["device_path"] == "/dev/sdc"
+        assert second_params["limit"] == 10
+
+
+class TestIterFlashRecords:
+    """Tests for iter_flash_records function."""
+
+    @pytest.fixture
+    def session(self):
+        """In-memory session with three flash records."""
+        from datetime import datetime
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from openwrt_imagegen.db import Base, import_models
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        import_models()
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            for i, status in enumerate(["succeeded", "failed", "succeeded"], 1):
+                session.add(
+                    FlashRecord(
+                        artifact_id=i,
+                        build_id=1,
+                        device_path="/dev/sdb",
+                        status=status,
+                        requested_at=datetime(2025, 1, i),
+                    )
+                )
+            session.commit()
+            yield session
+
+    def test_yields_selected_columns_newest_first(self, session):
+        """Rows should carry only the selected columns, newest first."""
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        rows = list(
+            iter_flash_records(session, [FlashRecord.id, FlashRecord.artifact_id])
+        )
+
+        assert [tuple(r) for r in rows] == [(3, 3), (2, 2), (1, 1)]
+        assert rows[0]._fields == ("id", "artifact_id")
+
+    def test_filters_and_limit(self, session):
+        """Filters and limit should apply as in get_flash_records."""
+        from openwrt_imagegen.flash.models import FlashRecord
+
+        rows = list(
+            iter_flash_records(
+                session,
+                [FlashRecord.id],
+                status=FlashStatus.SUCCEEDED,
+                limit=1,
+                batch_size=1,
+            )
+        )
+
+        assert [r.id for r in rows] == [3]
+
+    def test_get_flash_records_binds_filters(self, session):
+        """Bound filter values should select the matching records."""
+        failed = get_flash_records(session, status=FlashStatus.FAILED)
+        succeeded = get_flash_records(session, status=FlashStatus.SUCCEEDED, limit=1)
+
+        assert [r.artifact_id for r in failed] == [2]
+        assert [r.artifact_id for r in succeeded] == [3]
+
 
 class TestFlashResult:
     """Tests for FlashResult dataclass."""
@@ -2,23 +2,27 @@
 
 import hashlib
 import os
+import sys
 import tempfile
+import threading
 from unittest.mock import patch
 
 import pytest
 
 from openwrt_imagegen.flash.writer import (
     DEFAULT_BLOCK_SIZE,
+    HashAlgorithmUnavailableError,
     HashMismatchError,
     ImageNotFoundError,
     WriteResult,
+    _write_with_progress,
     compute_device_hash,
     compute_file_hash,
     verify_device_hash,
     wipe_device,
     write_image_to_device,
 )
-from openwrt_imagegen.types import VerificationMode, VerificationResult
+from openwrt_imagegen.types import HashAlgorithm, VerificationMode, VerificationResult
 
 
 class TestComputeFileHash:
@@ -96,6 +100,62 @@ class TestComputeFileHash:
                 os.unlink(f.name)
 
 
+class TestHashAlgorithms:
+    """Tests for selecting the verification hash algorithm."""
+
+    def test_blake3_unavailable(self, tmp_path):
+        """A missing blake3 package should raise a clear write error."""
+        image = tmp_path / "image.img"
+        image.write_bytes(b"content")
+
+        with patch.dict(sys.modules, {"blake3": None}):
+            with pytest.raises(HashAlgorithmUnavailableError) as exc_info:
+                compute_file_hash(image, algorithm=HashAlgorithm.BLAKE3)
+
+        assert exc_info.value.error_code == "HASH_ALGORITHM_UNAVAILABLE"
+        assert "blake3" in exc_info.value.message
+
+    def test_blake3_whole_and_prefix(self, tmp_path):
+        """BLAKE3 digests should match the reference for whole files and prefixes."""
+        blake3 = pytest.importorskip("blake3")
+        content = os.urandom(3 * 4096 + 7)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+
+        whole, whole_bytes = compute_file_hash(image, algorithm=HashAlgorithm.BLAKE3)
+        prefix, prefix_bytes = compute_file_hash(
+            image, max_bytes=4096, block_size=1024, algorithm=HashAlgorithm.BLAKE3
+        )
+
+        assert (whole, whole_bytes) == (
+            blake3.blake3(content).hexdigest(),
+            len(content),
+        )
+        assert (prefix, prefix_bytes) == (
+            blake3.blake3(content[:4096]).hexdigest(),
+            4096,
+        )
+
+    def test_blake3_write_verification(self, tmp_path):
+        """A BLAKE3-verified write should match the read-back."""
+        blake3 = pytest.importorskip("blake3")
+        content = os.urandom(8192)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 8192)
+
+        result = write_image_to_device(
+            image,
+            str(device),
+            verification_mode=VerificationMode.FULL,
+            hash_algorithm=HashAlgorithm.BLAKE3,
+        )
+
+        assert result.verification_result == VerificationResult.MATCH
+        assert result.source_hash == blake3.blake3(content).hexdigest()
+
+
 class TestComputeDeviceHash:
     """Tests for compute_device_hash function."""
 
@@ -202,6 +262,90 @@ class TestWipeDevice:
                 os.unlink(f.name)
 
 
+class TestWriteWithProgress:
+    """Tests for the pipelined image copy loop."""
+
+    @pytest.mark.parametrize("queue_depth", [1, 4])
+    def test_copies_all_blocks(self, tmp_path, queue_depth):
+        """Every block should land in order, including a short final block."""
+        content = os.urandom(5 * 4096 + 123)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * (len(content) + 4096))
+
+        with (
+            open(image, "rb", buffering=0) as src,
+            open(device, "r+b", buffering=0) as dst,
+        ):
+            written = _write_with_progress(
+                src, dst, len(content), block_size=4096, queue_depth=queue_depth
+            )
+
+        assert written == len(content)
+        data = device.read_bytes()
+        assert data[: len(content)] == content
+        assert data[len(content) :] == b"\x00" * 4096
+
+    def test_hashes_leading_bytes(self, tmp_path):
+        """Only the requested prefix should be fed to the source hasher."""
+        content = os.urandom(5 * 4096 + 123)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * len(content))
+        hasher = hashlib.sha256()
+
+        with (
+            open(image, "rb", buffering=0) as src,
+            open(device, "r+b", buffering=0) as dst,
+        ):
+            _write_with_progress(
+                src,
+                dst,
+                len(content),
+                block_size=4096,
+                source_hasher=hasher,
+                hash_bytes=2 * 4096 + 10,
+            )
+
+        assert (
+            hasher.hexdigest() == hashlib.sha256(content[: 2 * 4096 + 10]).hexdigest()
+        )
+        assert device.read_bytes() == content
+
+    def test_read_error_propagates(self, tmp_path):
+        """A failing source read should surface in the calling thread."""
+
+        class FailingSource:
+            def readinto(self, _buffer):
+                raise OSError("read failed")
+
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 16)
+
+        with open(device, "r+b", buffering=0) as dst, pytest.raises(OSError):
+            _write_with_progress(FailingSource(), dst, 16, block_size=8)
+
+    def test_write_error_stops_reader(self, tmp_path):
+        """A failing device write should stop the reader and propagate."""
+        image = tmp_path / "image.img"
+        image.write_bytes(os.urandom(64 * 1024))
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"")
+
+        with (
+            open(image, "rb", buffering=0) as src,
+            open(device, "rb", buffering=0) as read_only_dst,
+            pytest.raises(OSError),
+        ):
+            _write_with_progress(
+                src, read_only_dst, 64 * 1024, block_size=4096, queue_depth=2
+            )
+
+        assert not any(t.name == "flash-reader" for t in threading.enumerate())
+
+
 class TestWriteImageToDevice:
     """Tests for write_image_to_device function."""
 
@@ -305,6 +449,24 @@ class TestWriteImageToDevice:
         assert "not found" in str(exc_info.value).lower()
         assert exc_info.value.error_code == "IMAGE_NOT_FOUND"
 
+    def test_image_stat_once(self, tmp_path):
+        """The image should be stat()ed once for existence and size."""
+        from pathlib import Path
+
+        image = tmp_path / "image.img"
+        image.write_bytes(b"image")
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 16)
+
+        with patch.object(
+            Path, "stat", autospec=True, side_effect=Path.stat
+        ) as mock_stat:
+            write_image_to_device(
+                image, str(device), verification_mode=VerificationMode.SKIP
+            )
+
+        assert [c.args[0] for c in mock_stat.call_args_list].count(image) == 1
+
     def test_write_prefix_verification(self):
         """Write with prefix verification mode."""
         # Create image larger than 16MiB prefix
@@ -394,6 +556,75 @@ class TestWriteImageToDevice:
                     os.unlink(img.name)
                     os.unlink(dev.name)
 
+    def test_expected_hash_skips_source_read(self, tmp_path):
+        """A precomputed source hash should not be recomputed after the write."""
+        content = os.urandom(4096)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 8192)
+        digest = hashlib.sha256(content).hexdigest()
+
+        with patch("openwrt_imagegen.flash.writer.compute_file_hash") as mock_hash:
+            result = write_image_to_device(
+                image,
+                str(device),
+                verification_mode=VerificationMode.FULL,
+                expected_hash=digest,
+            )
+
+        mock_hash.assert_not_called()
+        assert result.source_hash == digest
+        assert result.verification_result == VerificationResult.MATCH
+
+    def test_source_hashed_during_write(self, tmp_path):
+        """The source should be hashed in the write pass, not re-read."""
+        content = os.urandom(3 * 4096 + 100)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * 16384)
+
+        with patch("openwrt_imagegen.flash.writer.compute_file_hash") as mock_hash:
+            result = write_image_to_device(
+                image,
+                str(device),
+                verification_mode=VerificationMode.FULL,
+                block_size=4096,
+            )
+
+        mock_hash.assert_not_called()
+        assert result.source_hash == hashlib.sha256(content).hexdigest()
+        assert result.verification_result == VerificationResult.MATCH
+
+    def test_writes_in_write_block_size_chunks(self, tmp_path):
+        """The image should be written in write_block_size chunks."""
+        content = os.urandom(2 * 8192 + 100)
+        image = tmp_path / "image.img"
+        image.write_bytes(content)
+        device = tmp_path / "device.dev"
+        device.write_bytes(b"\x00" * len(content))
+
+        real_write = os.write
+        sizes = []
+
+        def recording_write(fd, data):
+            sizes.append(len(data))
+            return real_write(fd, data)
+
+        with patch("openwrt_imagegen.flash.writer.os.write", recording_write):
+            result = write_image_to_device(
+                image,
+                str(device),
+                verification_mode=VerificationMode.FULL,
+                block_size=1024,
+                write_block_size=8192,
+            )
+
+        assert sizes == [8192, 8192, 100]
+        assert device.read_bytes() == content
+        assert result.verification_result == VerificationResult.MATCH
+
 
 class TestWriteResult:
     """Tests for WriteResult dataclass."""
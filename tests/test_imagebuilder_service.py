@@ -29,6 +29,7 @@ from openwrt_imagegen.imagebuilder.service import (
     ensure_builder,
     get_builder,
     get_builder_cache_info,
+    iter_builders,
     list_builders,
     prune_builders,
 )
@@ -251,6 +252,20 @@ class TestListBuilders:
         assert len(results) == 1
         assert results[0].subtarget == "generic"
 
+    def test_iter_selected_columns(self, session, populated_db):  # noqa: ARG002
+        """iter_builders should yield only the selected columns, in order."""
+        rows = list(
+            iter_builders(
+                session,
+                [ImageBuilder.target, ImageBuilder.root_dir],
+                release="23.05.3",
+            )
+        )
+        assert [r._asdict() for r in rows] == [
+            {"target": "ath79", "root_dir": "/cache/1"},
+            {"target": "ramips", "root_dir": "/cache/2"},
+        ]
+
 
 class TestEnsureBuilder:
     """Tests for ensure_builder function."""
@@ -520,6 +535,21 @@ class TestPruneBuilders:
             if builder.state == ImageBuilderState.DEPRECATED.value:
                 assert Path(builder.root_dir).exists()
 
+    def test_prune_dry_run_loads_no_entities(
+        self, session, mock_settings, populated_db_with_dirs
+    ):
+        """Dry run should report keys without loading builders into the session."""
+        session.expunge_all()
+
+        pruned = prune_builders(session, settings=mock_settings, dry_run=True)
+
+        assert sorted(pruned) == sorted(
+            (b.openwrt_release, b.target, b.subtarget)
+            for b in populated_db_with_dirs
+            if b.state == ImageBuilderState.DEPRECATED.value
+        )
+        assert len(session.identity_map) == 0
+
     def test_prune_mutually_exclusive_options(self, session, mock_settings):
         """Should raise ValueError when both deprecated_only and unused_days are specified."""
         with pytest.raises(ValueError) as exc_info:
@@ -0,0 +1,98 @@
+"""Import budget tests for the CLI.
+
+Commands that never touch the database must not import SQLAlchemy; it is
+by far the most expensive dependency to load.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules(args: list[str], env: dict[str, str]) -> set[str]:
+    """Run the CLI with import profiling and return the imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-m", "openwrt_imagegen", *args],
+        capture_output=True,
+        text=True,
+        env=env | {"PYTHONPROFILEIMPORTTIME": "1"},
+    )
+    assert result.returncode == 0, result.stderr
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+class TestImportBudget:
+    """Non-database commands should stay free of heavy imports."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--version"],
+            ["--help"],
+            ["config"],
+            ["config", "--json"],
+            ["builders", "info"],
+            ["builders", "info", "--json"],
+        ],
+    )
+    def test_no_sqlalchemy(self, args: list[str], tmp_path) -> None:
+        """SQLAlchemy should not be imported."""
+        env = os.environ | {
+            "OWRT_IMG_CACHE_DIR": str(tmp_path / "cache"),
+            "OWRT_IMG_DB_URL": f"sqlite:///{tmp_path}/test.db",
+        }
+        modules = _imported_modules(args, env)
+
+        assert "openwrt_imagegen" in modules
+        assert "sqlalchemy" not in modules
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["artifacts", "list", "--help"],
+            ["flash", "write", "--help"],
+            ["profiles", "--help"],
+        ],
+    )
+    def test_subcommand_help_skips_settings(self, args: list[str]) -> None:
+        """Subcommand help should not load settings or SQLAlchemy."""
+        modules = _imported_modules(args, dict(os.environ))
+
+        assert "openwrt_imagegen.config" not in modules
+        assert "openwrt_imagegen.logs" not in modules
+        assert "sqlalchemy" not in modules
+
+    def test_subcommand_help_loads_only_its_group(self) -> None:
+        """Group help should not import the other command groups."""
+        # Groups are loaded with importlib.import_module, which -X importtime
+        # does not report, so inspect sys.modules at exit instead.
+        script = (
+            "import atexit, sys\n"
+            "atexit.register(lambda: print(*sorted(sys.modules), file=sys.stderr))\n"
+            "sys.argv = ['imagegen', 'profiles', '--help']\n"
+            "from openwrt_imagegen.__main__ import main\n"
+            "main()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        modules = set(result.stderr.split())
+        groups = {m for m in modules if m.startswith("openwrt_imagegen.cli._")}
+        assert groups == {
+            "openwrt_imagegen.cli._options",
+            "openwrt_imagegen.cli._profiles",
+        }
+
+    @pytest.mark.parametrize("args", [["--version"], ["--help"]])
+    def test_root_help_skips_pydantic(self, args: list[str]) -> None:
+        """Version and top-level help should not load pydantic."""
+        modules = _imported_modules(args, dict(os.environ))
+
+        assert "pydantic" not in modules
@@ -0,0 +1,100 @@
+"""Tests for logs module."""
+
+import logging
+
+import pytest
+
+from openwrt_imagegen.logs import PACKAGE_LOGGER, configure_logging, shutdown_logging
+
+
+class _ListHandler(logging.Handler):
+    """Handler that collects formatted messages."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture(autouse=True)
+def _reset_logging():
+    """Ensure each test starts and ends without a listener."""
+    pkg_logger = logging.getLogger(PACKAGE_LOGGER)
+    level = pkg_logger.level
+    shutdown_logging()
+    yield
+    shutdown_logging()
+    pkg_logger.setLevel(level)
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    def test_records_reach_handler(self) -> None:
+        """Records should be delivered through the queue listener."""
+        handler = _ListHandler()
+        configure_logging("DEBUG", handler=handler)
+
+        logging.getLogger(f"{PACKAGE_LOGGER}.builds").info("hello %s", "world")
+        shutdown_logging()
+
+        assert handler.messages == ["hello world"]
+
+    def test_level_filters_records(self) -> None:
+        """Records below the configured level should be dropped."""
+        handler = _ListHandler()
+        configure_logging("WARNING", handler=handler)
+
+        pkg_logger = logging.getLogger(PACKAGE_LOGGER)
+        pkg_logger.info("ignored")
+        pkg_logger.warning("kept")
+        shutdown_logging()
+
+        assert handler.messages == ["kept"]
+
+    def test_idempotent(self) -> None:
+        """Repeated calls should not install duplicate handlers."""
+        handler = _ListHandler()
+        configure_logging("INFO", handler=handler)
+        configure_logging("INFO", handler=_ListHandler())
+
+        logging.getLogger(PACKAGE_LOGGER).info("once")
+        shutdown_logging()
+
+        assert handler.messages == ["once"]
+
+    def test_shutdown_detaches_handler(self) -> None:
+        """Shutdown should detach the queue handler."""
+        configure_logging("INFO", handler=_ListHandler())
+        shutdown_logging()
+
+        assert logging.getLogger(PACKAGE_LOGGER).handlers == []
+
+    def test_propagation_left_alone(self, caplog) -> None:
+        """Records should still reach handlers further up the hierarchy."""
+        handler = _ListHandler()
+        configure_logging("INFO", handler=handler)
+
+        with caplog.at_level(logging.INFO, logger=PACKAGE_LOGGER):
+            logging.getLogger(PACKAGE_LOGGER).info("both")
+        shutdown_logging()
+
+        assert logging.getLogger(PACKAGE_LOGGER).propagate is True
+        assert handler.messages == ["both"]
+        assert [r.getMessage() for r in caplog.records] == ["both"]
+
+    def test_default_handler_skipped_when_configured(self) -> None:
+        """Without a handler, existing logging configuration should win."""
+        root = logging.getLogger()
+        existing = _ListHandler()
+        root.addHandler(existing)
+        try:
+            configure_logging("DEBUG")
+            logging.getLogger(f"{PACKAGE_LOGGER}.flash").debug("direct")
+        finally:
+            root.removeHandler(existing)
+
+        assert logging.getLogger(PACKAGE_LOGGER).handlers == []
+        assert existing.messages == ["direct"]
@@ -458,3 +458,29 @@ class TestIdempotency:
         assert result1.profile.profile_id == result2.profile.profile_id
         assert result2.profile.profile_id == result3.profile.profile_id
         assert result1.profile.name == result2.profile.name
+
+
+class TestSessionFactoryCache:
+    """Tests for reuse of the database engine across tool calls."""
+
+    def test_factory_reused_for_same_url(self, isolated_db):
+        """Repeated calls against one database should share a factory."""
+        from mcp_server.server import _get_session_factory
+
+        _ = isolated_db  # Fixture points settings at a temp database
+        assert _get_session_factory() is _get_session_factory()
+
+    def test_factory_follows_db_url(self, isolated_db, tmp_path):
+        """A different database URL should get its own factory."""
+        from mcp_server.server import _get_session_factory
+        from openwrt_imagegen.config import reload_settings
+
+        first = _get_session_factory()
+        with patch.dict(
+            os.environ, {"OWRT_IMG_DB_URL": f"sqlite:///{tmp_path}/other.db"}
+        ):
+            reload_settings()
+            second = _get_session_factory()
+
+        assert first is not second
+        assert str(first.kw["bind"].url) == isolated_db
@@ -4,14 +4,23 @@ These tests verify the database models, relationships, and basic
 CRUD operations using an in-memory SQLite database.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from openwrt_imagegen.builds.models import Artifact, BuildRecord
-from openwrt_imagegen.db import Base, create_all_tables, get_engine, get_session
+from openwrt_imagegen.db import (
+    Base,
+    create_all_tables,
+    get_engine,
+    get_session,
+    utc_now,
+)
 from openwrt_imagegen.flash.models import FlashRecord
+from openwrt_imagegen.flash.service import _flash_records_query, get_flash_records
 from openwrt_imagegen.imagebuilder.models import ImageBuilder
 from openwrt_imagegen.profiles.models import Profile
 from openwrt_imagegen.types import (
@@ -56,6 +65,30 @@ class TestDatabaseSetup:
         engine = get_engine(f"sqlite:///{db_path}")
         assert engine is not None
 
+    def test_sqlite_connections_use_wal(self, tmp_path):
+        """SQLite connections should be tuned by the connect pragmas."""
+        db_path = tmp_path / "test.db"
+        engine = get_engine(f"sqlite:///{db_path}")
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NORMAL
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            # MEMORY
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+        engine.dispose()
+
+    def test_sqlite_driver_url_creates_parent(self, tmp_path):
+        """A driver-qualified SQLite URL should get its directory and pragmas."""
+        db_path = tmp_path / "nested" / "dir" / "test.db"
+        engine = get_engine(f"sqlite+pysqlite:///{db_path}")
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert db_path.exists()
+        engine.dispose()
+
     def test_create_all_tables(self, tmp_path):
         """create_all_tables should create all model tables."""
         db_path = tmp_path / "test.db"
@@ -68,6 +101,77 @@ class TestDatabaseSetup:
         assert "artifacts" in Base.metadata.tables
         assert "flash_records" in Base.metadata.tables
 
+    def test_create_all_tables_existing_schema(self, tmp_path):
+        """An up-to-date schema should be detected with one query."""
+        from sqlalchemy import event
+
+        db_url = f"sqlite:///{tmp_path / 'test.db'}"
+        create_all_tables(get_engine(db_url))
+        engine = get_engine(db_url)
+        statements: list[str] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda _c, _cur, statement, *_args: statements.append(statement),
+        )
+
+        create_all_tables(engine)
+        assert len(statements) == 1
+        assert "sqlite_master" in statements[0]
+
+        # The engine is now known to be provisioned: no further queries
+        create_all_tables(engine)
+        assert len(statements) == 1
+
+    def test_drop_all_tables_resets_ready_engine(self, tmp_path):
+        """Tables dropped through drop_all_tables should be recreated."""
+        from sqlalchemy import inspect
+
+        from openwrt_imagegen.db import drop_all_tables
+
+        engine = get_engine(f"sqlite:///{tmp_path / 'test.db'}")
+        create_all_tables(engine)
+        drop_all_tables(engine)
+
+        create_all_tables(engine)
+
+        assert "profiles" in inspect(engine).get_table_names()
+
+    def test_create_all_tables_adds_missing_table(self, tmp_path):
+        """A partially created schema should be completed."""
+        from sqlalchemy import inspect
+
+        db_url = f"sqlite:///{tmp_path / 'test.db'}"
+        create_all_tables(get_engine(db_url))
+        engine = get_engine(db_url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE flash_records"))
+
+        create_all_tables(engine)
+
+        assert "flash_records" in inspect(engine).get_table_names()
+
+    def test_default_engine_shared(self, tmp_path, monkeypatch):
+        """Helpers without an explicit engine should share one per URL."""
+        from openwrt_imagegen import db
+        from openwrt_imagegen.config import reload_settings
+
+        monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path / 'test.db'}")
+        db._default_engine.cache_clear()
+        db._default_session_factory.cache_clear()
+        try:
+            create_all_tables()
+            with get_session() as first, get_session() as second:
+                assert first.get_bind() is second.get_bind()
+            assert db.get_session_factory().kw["bind"] is first.get_bind()
+
+            monkeypatch.setenv("OWRT_IMG_DB_URL", f"sqlite:///{tmp_path / 'b.db'}")
+            reload_settings()
+            assert db.get_session_factory().kw["bind"] is not first.get_bind()
+        finally:
+            db._default_engine.cache_clear()
+            db._default_session_factory.cache_clear()
+
     def test_get_session_context_manager(self, tmp_path):
         """get_session should provide a working session context."""
         db_path = tmp_path / "test.db"
@@ -636,6 +740,98 @@ class TestFlashRecordModel:
         assert flash.status == FlashStatus.SUCCEEDED.value
         assert flash.is_succeeded()
 
+    def test_flash_record_timestamps_are_utc(self, session, artifact):
+        """Status transitions should stamp naive UTC, like the stored values."""
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        flash = FlashRecord(
+            artifact_id=artifact.id,
+            build_id=artifact.build_id,
+            device_path="/dev/sdd",
+        )
+        flash.mark_running()
+        session.add(flash)
+        session.commit()
+        session.expire(flash, ["started_at"])
+        flash.mark_succeeded()
+
+        # started_at is loaded from the row, finished_at is still in memory
+        assert flash.started_at.tzinfo is None
+        assert flash.finished_at.tzinfo is None
+        assert flash.finished_at - flash.started_at >= timedelta(0)
+        assert flash.started_at >= before.replace(microsecond=0)
+
+    def test_requested_at_stamped_in_utc(self, session, artifact):
+        """The server default should stamp the same clock as utc_now()."""
+        before = utc_now().replace(microsecond=0)
+        flash = FlashRecord(
+            artifact_id=artifact.id,
+            build_id=artifact.build_id,
+            device_path="/dev/sdd",
+        )
+        flash.mark_running()
+        session.add(flash)
+        session.commit()
+        session.refresh(flash)
+
+        assert before <= flash.requested_at <= flash.started_at
+
+    @pytest.mark.parametrize(
+        ("dialect", "sql"),
+        [
+            ("sqlite", "CURRENT_TIMESTAMP"),
+            ("postgresql", "timezone('UTC', now())"),
+        ],
+    )
+    def test_requested_at_default_per_dialect(self, dialect, sql):
+        """The requested_at default should render a UTC clock per backend."""
+        import importlib
+
+        from sqlalchemy.schema import CreateTable
+
+        module = importlib.import_module(f"sqlalchemy.dialects.{dialect}")
+        ddl = str(CreateTable(FlashRecord.__table__).compile(dialect=module.dialect()))
+
+        (column,) = [line for line in ddl.splitlines() if "requested_at" in line]
+
+        assert f"DEFAULT {sql} NOT NULL" in column
+
+    def test_flash_listing_breaks_ties_by_id(self, session, artifact):
+        """Records requested in the same instant should list newest id first."""
+        requested_at = datetime(2026, 1, 1, 12, 0, 0)
+        for device_path in ("/dev/sdb", "/dev/sdc", "/dev/sdd"):
+            session.add(
+                FlashRecord(
+                    artifact_id=artifact.id,
+                    build_id=artifact.build_id,
+                    device_path=device_path,
+                    requested_at=requested_at,
+                )
+            )
+        session.commit()
+
+        records = get_flash_records(session, limit=2)
+        # SQLite would fall back to rowid order anyway; other backends need
+        # the id spelled out, and the index has to carry it to avoid a sort
+        stmt = _flash_records_query((FlashRecord.id,), False, False, False, False)
+        (index,) = [
+            i
+            for i in FlashRecord.__table__.indexes
+            if i.name == "ix_flash_records_recent"
+        ]
+
+        assert [r.device_path for r in records] == ["/dev/sdd", "/dev/sdc"]
+        assert "flash_records.requested_at DESC, flash_records.id DESC" in str(stmt)
+        assert [c.name for c in index.columns][:2] == ["requested_at", "id"]
+
+    def test_build_record_timestamps_are_naive_utc(self, session, artifact):
+        """Build transitions should stamp naive UTC times."""
+        build = artifact.build
+        build.mark_running()
+        build.mark_failed("boom")
+
+        assert build.started_at.tzinfo is None
+        assert build.finished_at.tzinfo is None
+
     def test_flash_record_failure(self, session, artifact):
         """Should record flash failures properly."""
         flash = FlashRecord(
@@ -668,6 +864,35 @@ class TestFlashRecordModel:
         assert flash.build == artifact.build
         assert flash in list(artifact.flash_records)
 
+    def test_flash_record_status_stored_by_value(self, session, artifact):
+        """Status should persist as its value and load as a FlashStatus."""
+        flash = FlashRecord(
+            artifact_id=artifact.id,
+            build_id=artifact.build_id,
+            device_path="/dev/sdg",
+        )
+        session.add(flash)
+        session.commit()
+        session.expire(flash)
+
+        raw = session.execute(
+            text("SELECT status FROM flash_records WHERE id = :id"), {"id": flash.id}
+        ).scalar_one()
+        assert raw == "pending"
+        assert flash.status is FlashStatus.PENDING
+
+    def test_flash_record_status_rejects_unknown(self, session, artifact):
+        """The status column should refuse values outside FlashStatus."""
+        with pytest.raises(IntegrityError):
+            session.execute(
+                text(
+                    "INSERT INTO flash_records "
+                    "(artifact_id, build_id, device_path, status, wiped_before_flash) "
+                    "VALUES (:a, :b, '/dev/sdh', 'exploded', 0)"
+                ),
+                {"a": artifact.id, "b": artifact.build_id},
+            )
+
 
 class TestQueryPatterns:
     """Test common query patterns described in DB_MODELS.md."""
@@ -766,3 +991,52 @@ class TestQueryPatterns:
 
         assert latest is not None
         assert latest.cache_key == "key-2"
+
+    @pytest.mark.parametrize(
+        ("column", "value"), [("build_id", 1), ("kind", "sysupgrade")]
+    )
+    def test_artifact_listing_uses_index_order(self, session, column, value):
+        """Artifact listings should not need a separate sort step."""
+        stmt = (
+            select(Artifact.id)
+            .where(getattr(Artifact, column) == value)
+            .order_by(Artifact.id.desc())
+            .limit(100)
+        )
+        compiled = stmt.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        plan = " ".join(
+            row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+
+        assert f"ix_artifacts_{column}_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_active_flashes_index_is_partial(self, session):
+        """The in-flight flash index should cover only pending/running rows."""
+        index_sql = session.execute(
+            text(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type = 'index' AND name = 'ix_flash_records_active'"
+            )
+        ).scalar_one()
+
+        assert "WHERE status IN ('pending', 'running')" in index_sql
+
+    def test_flash_listing_uses_recent_index(self, session):
+        """The unfiltered newest-first listing should not need a sort step."""
+        stmt = _flash_records_query(
+            (FlashRecord.id,), False, False, False, False
+        ).params(limit=100)
+        compiled = stmt.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        plan = " ".join(
+            row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        )
+
+        assert "ix_flash_records_recent" in plan
+        assert "TEMP B-TREE" not in plan
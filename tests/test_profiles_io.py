@@ -286,6 +286,16 @@ class TestProfileToString:
         data = json.loads(json_str)
         assert data["profile_id"] == sample_profile.profile_id
 
+    def test_to_json_string_format(self, sample_profile):
+        """JSON should be two-space indented, unescaped, without unset keys."""
+        profile = sample_profile.model_copy(update={"name": "Wohnzimmer Gerät"})
+
+        json_str = profile_to_json_string(profile)
+
+        expected = profile.model_dump(exclude_none=True, exclude_unset=True)
+        assert json_str == json.dumps(expected, indent=2, ensure_ascii=False)
+        assert "Gerät" in json_str
+
 
 class TestLoadProfilesFromDirectory:
     """Test bulk profile loading from directory."""
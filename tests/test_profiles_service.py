@@ -25,6 +25,7 @@ from openwrt_imagegen.profiles.service import (
     get_profile_or_none,
     import_profile_from_file,
     import_profiles_from_directory,
+    iter_profiles,
     list_profiles,
     profile_to_schema,
     query_profiles,
@@ -381,6 +382,85 @@ class TestQueryOperations:
         profiles = query_profiles(session, openwrt_release="999.0")
         assert len(profiles) == 0
 
+    def test_query_by_tags(self, session, populated_db):
+        """Should require every requested tag."""
+        _ = populated_db  # Fixture populates database
+        profiles = query_profiles(session, tags=["home", "wifi"])
+        assert [p.profile_id for p in profiles] == ["home.device1.23.05"]
+
+    def test_query_by_tag_is_exact(self, session, populated_db):
+        """Should not match a tag that is only a substring of another."""
+        _ = populated_db  # Fixture populates database
+        assert query_profiles(session, tags=["la"]) == []
+        assert len(query_profiles(session, tags=["lab"])) == 1
+
+    @pytest.mark.parametrize(
+        ("dialect", "function"),
+        [
+            ("sqlite", "json_each(profiles.tags)"),
+            (
+                "postgresql",
+                "json_array_elements_text(CASE WHEN json_typeof(profiles.tags) "
+                "= 'array' THEN profiles.tags ELSE '[]'::json END)",
+            ),
+        ],
+    )
+    def test_tag_filter_per_dialect(self, session, dialect, function):
+        """The tag filter should expand the JSON array natively per backend."""
+        import importlib
+
+        from openwrt_imagegen.profiles.service import _profiles_query
+
+        _ = session  # Fixture maps the models
+        module = importlib.import_module(f"sqlalchemy.dialects.{dialect}")
+        sql = str(_profiles_query(tags=["lab"]).compile(dialect=module.dialect()))
+
+        assert f"FROM {function} AS anon_1" in sql
+        assert "anon_1.value =" in sql
+
+    def test_tag_filter_skips_untagged_profiles(self, session, populated_db):
+        """Profiles stored without tags should not break the tag filter."""
+        from sqlalchemy import text
+
+        _ = populated_db  # Fixture populates database
+        profile = schema_to_profile(
+            ProfileSchema(
+                profile_id="untagged",
+                name="Untagged",
+                device_id="device-9",
+                openwrt_release="23.05.3",
+                target="ath79",
+                subtarget="generic",
+                imagebuilder_profile="device-9",
+            )
+        )
+        session.add(profile)
+        session.commit()
+        stored = session.execute(
+            text("SELECT tags FROM profiles WHERE profile_id = 'untagged'")
+        ).scalar_one()
+
+        results = query_profiles(session, tags=["home"])
+
+        assert stored == "null"
+        assert [p.profile_id for p in results] == [
+            "home.device1.23.05",
+            "home.device2.23.05",
+        ]
+
+    def test_iter_profiles_matches_list(self, session, populated_db):
+        """Should yield every profile in list_profiles order."""
+        _ = populated_db  # Fixture populates database
+        streamed = [p.profile_id for p in iter_profiles(session, batch_size=1)]
+        assert streamed == [p.profile_id for p in list_profiles(session)]
+
+    def test_iter_profiles_with_filter(self, session, populated_db):
+        """Should apply the same filters as query_profiles."""
+        _ = populated_db  # Fixture populates database
+        streamed = list(iter_profiles(session, device_id="device-1"))
+        expected = query_profiles(session, device_id="device-1")
+        assert [p.id for p in streamed] == [p.id for p in expected]
+
 
 class TestImportExportOperations:
     """Test import/export operations with database."""
@@ -474,6 +554,105 @@ class TestImportExportOperations:
         assert result.succeeded == 3
         assert result.failed == 0
 
+    def test_import_from_directory_pattern(
+        self, session, tmp_path, minimal_profile_data
+    ):
+        """Only matching files should be imported; ** patterns recurse."""
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        (tmp_path / "skipped.yaml").mkdir()
+        for i, path in enumerate(
+            [tmp_path / "a.yaml", tmp_path / "b.yml", nested / "c.yaml"]
+        ):
+            data = {**minimal_profile_data, "profile_id": f"test.pattern.{i}"}
+            with open(path, "w") as f:
+                yaml.dump(data, f)
+
+        flat = import_profiles_from_directory(session, tmp_path)
+        recursive = import_profiles_from_directory(
+            session, tmp_path, pattern="**/*.yaml", update_existing=True
+        )
+
+        assert [r.profile_id for r in flat.results] == ["test.pattern.0"]
+        assert [r.profile_id for r in recursive.results] == [
+            "test.pattern.0",
+            "test.pattern.2",
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_import_from_directory_keeps_file_order(
+        self, session, tmp_path, minimal_profile_data, workers
+    ):
+        """Results should follow file name order regardless of worker count."""
+        for i in range(6):
+            data = minimal_profile_data.copy()
+            data["profile_id"] = f"test.profile.{i}"
+            with open(tmp_path / f"profile{i}.yaml", "w") as f:
+                yaml.dump(data, f)
+        (tmp_path / "profile3.yaml").write_text("profile_id: [not valid\n")
+        # A later file reusing an ID must see the profile created before it
+        duplicate = minimal_profile_data.copy()
+        duplicate["profile_id"] = "test.profile.0"
+        with open(tmp_path / "profile9.yaml", "w") as f:
+            yaml.dump(duplicate, f)
+
+        result = import_profiles_from_directory(session, tmp_path, workers=workers)
+
+        assert [r.profile_id for r in result.results] == [
+            "test.profile.0",
+            "test.profile.1",
+            "test.profile.2",
+            "profile3",
+            "test.profile.4",
+            "test.profile.5",
+            "test.profile.0",
+        ]
+        assert [r.success for r in result.results] == [
+            True,
+            True,
+            True,
+            False,
+            True,
+            True,
+            False,
+        ]
+        assert "already exists" in (result.results[-1].error or "")
+
+    def test_import_from_directory_batches_queries(
+        self, session, tmp_path, minimal_profile_data
+    ):
+        """Stored profiles should be looked up once and updated in one flush."""
+        from sqlalchemy import event
+
+        stored = {**minimal_profile_data, "profile_id": "test.profile.2"}
+        create_profile(session, ProfileSchema(**stored))
+        for i in range(5):
+            data = minimal_profile_data.copy()
+            data["profile_id"] = f"test.profile.{i}"
+            data["name"] = f"Imported {i}"
+            with open(tmp_path / f"profile{i}.yaml", "w") as f:
+                yaml.dump(data, f)
+
+        selects: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = import_profiles_from_directory(
+                session, tmp_path, update_existing=True
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result.succeeded == 5
+        assert [r.created for r in result.results] == [True, True, False, True, True]
+        assert len(selects) == 1
+        assert get_profile(session, "test.profile.2").name == "Imported 2"
+
     def test_export_to_yaml(self, session, tmp_path, minimal_profile_data):
         """Should export profile to YAML file."""
         schema = ProfileSchema.model_validate(minimal_profile_data)
@@ -7,6 +7,7 @@ from openwrt_imagegen.types import (
     BuildStatus,
     FileSpec,
     FlashStatus,
+    HashAlgorithm,
     ImageBuilderState,
     OperationResult,
     ProfilePolicies,
@@ -45,6 +46,11 @@ class TestEnums:
         assert VerificationMode.PREFIX_64M.value == "prefix-64MiB"
         assert VerificationMode.SKIP.value == "skipped"
 
+    def test_hash_algorithm_values(self) -> None:
+        """HashAlgorithm should have expected values."""
+        assert HashAlgorithm.SHA256.value == "sha256"
+        assert HashAlgorithm.BLAKE3.value == "blake3"
+
     def test_verification_result_values(self) -> None:
         """VerificationResult should have expected values."""
         assert VerificationResult.MATCH.value == "match"
@@ -329,6 +329,35 @@ class TestFlashDetail:
         response = client.get("/ui/flash/999")
         assert response.status_code == 404
 
+    @pytest.mark.parametrize(
+        ("status", "shown", "hidden"),
+        [
+            ("failed", "Error Details", "Post-Flash Steps"),
+            ("succeeded", "Post-Flash Steps", "Error Details"),
+        ],
+    )
+    def test_flash_detail_sections_follow_status(self, client, status, shown, hidden):
+        """Test that status-specific sections render for the record's status."""
+        from openwrt_imagegen.flash.models import FlashRecord
+        from openwrt_imagegen.types import FlashStatus
+
+        with client.app.state.session_factory() as session:
+            record = FlashRecord(
+                artifact_id=1,
+                build_id=1,
+                device_path="/dev/sdb",
+                status=FlashStatus(status),
+                error_message="card removed" if status == "failed" else None,
+            )
+            session.add(record)
+            session.commit()
+            record_id = record.id
+
+        response = client.get(f"/ui/flash/{record_id}")
+        assert response.status_code == 200
+        assert shown in response.text
+        assert hidden not in response.text
+
 
 class TestNavigation:
     """Tests for navigation between pages."""
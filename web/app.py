@@ -15,6 +15,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from openwrt_imagegen import __version__
+from openwrt_imagegen.config import get_settings
 from openwrt_imagegen.db import create_all_tables, get_engine, get_session_factory
 from web.routers import builders, builds, config, flash, gui, health, profiles
 
@@ -26,7 +27,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Initializes database tables on startup.
     """
     engine = get_engine()
-    create_all_tables(engine)
+    if get_settings().auto_create_tables:
+        create_all_tables(engine)
     app.state.session_factory = get_session_factory(engine)
     yield
 
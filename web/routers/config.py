@@ -24,7 +24,9 @@ def get_config() -> dict[str, Any]:
         "tmp_dir": str(settings.tmp_dir) if settings.tmp_dir else None,
         "offline": settings.offline,
         "log_level": settings.log_level,
+        "auto_create_tables": settings.auto_create_tables,
         "verification_mode": settings.verification_mode,
+        "hash_algorithm": settings.hash_algorithm,
         "max_concurrent_downloads": settings.max_concurrent_downloads,
         "max_concurrent_builds": settings.max_concurrent_builds,
         "download_timeout": settings.download_timeout,